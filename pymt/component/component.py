@@ -128,6 +128,11 @@ class Component(GridMixIn):
         Time interval over which component will run uses ports.
     run_dir : str, optional
         Directory where the component will run.
+    dispatch : {'serial', 'concurrent'}, optional
+        How the component runs its port and connected events that happen
+        at the same time (see :class:`~pymt.events.manager.EventManager`).
+    max_workers : int, optional
+        Maximum number of threads used to run events concurrently.
     """
 
     def __init__(
@@ -140,6 +145,8 @@ class Component(GridMixIn):
         time_step=1.0,
         run_dir=".",
         name=None,
+        dispatch="serial",
+        max_workers=None,
     ):
         if uses is None:
             uses = set()
@@ -158,7 +165,9 @@ class Component(GridMixIn):
 
         self._events = EventManager(
             [(PortEvent(port=self._port, init_args=argv, run_dir=run_dir), time_step)]
-            + list(events)
+            + list(events),
+            dispatch=dispatch,
+            max_workers=max_workers,
         )
         # self._events = EventManager([(self._port, 1.)] + events)
         # self._events = EventManager(
@@ -174,6 +183,20 @@ class Component(GridMixIn):
         """
         return self._time_step
 
+    @property
+    def dependencies(self):
+        """What the component reads from and writes to when it runs.
+
+        A component runs its port and the events connected to it, and so
+        depends on what they depend on.
+        """
+        (reads, writes) = ([], [])
+        for event in self._events:
+            (event_reads, event_writes) = event.dependencies
+            reads += event_reads
+            writes += event_writes
+        return reads, writes
+
     @property
     def current_time(self):
         """Current time for component updating."""
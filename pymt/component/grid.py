@@ -1,6 +1,7 @@
 import numpy as np
 
-from pymt.grids.connectivity import get_connectivity
+from pymt.grids.connectivity import cached_connectivity
+from pymt.grids.registry import intern_array
 
 
 def raster_node_coordinates(shape, spacing=None, origin=None):
@@ -35,8 +36,10 @@ def raster_node_coordinates(shape, spacing=None, origin=None):
     >>> x
     array([1., 3., 5.])
     """
-    spacing = spacing or np.ones_like(shape, dtype=float)
-    origin = origin or np.zeros_like(shape, dtype=float)
+    if spacing is None:
+        spacing = np.ones_like(shape, dtype=float)
+    if origin is None:
+        origin = np.zeros_like(shape, dtype=float)
 
     coordinate_vectors = []
     for shape_, spacing_, origin_ in zip(shape, spacing, origin):
@@ -189,7 +192,8 @@ def get_structured_node_connectivity(grid, grid_id):
     Returns
     -------
     conn : ndarray
-        Connectivities of nodes to cells.
+        Connectivities of nodes to cells. These arrays are shared between
+        grids of the same shape and so are read-only.
 
     Examples
     --------
@@ -205,7 +209,7 @@ def get_structured_node_connectivity(grid, grid_id):
     array([4, 8])
     """
     shape = grid.get_grid_shape(grid_id)
-    return get_connectivity(shape, with_offsets=True)
+    return cached_connectivity(shape)
 
 
 class GridMixIn:
@@ -328,7 +332,7 @@ class GridMixIn:
         else:
             coords = get_structured_node_coordinates(self._port, grid_id)
 
-        self._coords[grid_id] = coords
+        self._coords[grid_id] = tuple(intern_array(coord) for coord in coords)
 
     def _get_coord_by_dim(self, grid_id, dim):
         try:
@@ -354,7 +358,10 @@ class GridMixIn:
                 self.get_grid_offset(grid_id),
             )
 
-        self._connectivity[grid_id] = (connectivity, offset)
+        self._connectivity[grid_id] = (
+            intern_array(connectivity),
+            intern_array(offset),
+        )
 
     def _get_connectivity(self, grid_id):
         try:
@@ -370,6 +377,9 @@ class GridMixIn:
             self._set_connectivity(grid_id)
             return self._connectivity[grid_id][1]
 
+    def get_grid_shape(self, grid_id):
+        return self._port.get_grid_shape(grid_id)
+
     def get_x(self, grid_id):
         return self._get_coord_by_dim(grid_id, -1)
 
@@ -393,3 +403,12 @@ class GridMixIn:
 
     def get_var_units(self, name):
         return self._port.get_var_units(name)
+
+    def get_var_grid(self, name):
+        return self._port.get_var_grid(name)
+
+    def get_var_location(self, name):
+        try:
+            return self._port.get_var_location(name)
+        except AttributeError:
+            return "node"
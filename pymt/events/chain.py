@@ -2,6 +2,16 @@ class ChainEvent:
     def __init__(self, events):
         self._events = events
 
+    @property
+    def dependencies(self):
+        """What the chained events read from and write to when they run."""
+        (reads, writes) = ([], [])
+        for event in self._events:
+            (event_reads, event_writes) = event.dependencies
+            reads += event_reads
+            writes += event_writes
+        return reads, writes
+
     def initialize(self):
         for event in self._events:
             event.initialize()
@@ -44,14 +44,127 @@ hello from initialize
 hello!
 hello!
 hello from finalize
+
+Events that happen at the same time, and that do not depend on one
+another, can be run concurrently. An event declares what it depends on
+with a `dependencies` attribute: a pair of collections of the objects
+(usually ports) that the event reads from and writes to when it runs.
+Two events are independent if neither writes to something the other
+reads from or writes to. Events without a `dependencies` attribute are
+run on their own, after the events before them and before the events
+after them.
+
+>>> class Tick:
+...     def __init__(self, name, port):
+...         self.name, self.dependencies = name, ((), (port,))
+...     def initialize(self):
+...         pass
+...     def run(self, time):
+...         pass
+...     def finalize(self):
+...         pass
+
+>>> (port_1, port_2) = (object(), object())
+>>> (a, b, c) = (Tick("a", port_1), Tick("b", port_2), Tick("c", port_1))
+>>> [[event.name for event in wave] for wave in dispatch_waves([a, b, c])]
+[['a', 'b'], ['c']]
+
+>>> with EventManager([(a, 1.), (b, 1.), (c, 1.)], dispatch="concurrent") as mngr:
+...     mngr.run(2.)
 """
 
+import concurrent.futures
 from configparser import ConfigParser
 from io import StringIO
 
 from ..timeline import Timeline
 from ..utils.prefix import names_with_prefix
 
+DISPATCHES = ("serial", "concurrent")
+
+WORKING_DIRECTORY = object()
+"""Stands for the working directory of the process in event dependencies."""
+
+
+def event_dependencies(event):
+    """What an event reads from and writes to when it runs.
+
+    Parameters
+    ----------
+    event : event-like
+        An event.
+
+    Returns
+    -------
+    (reads, writes) or None
+        Ids of the objects the event reads from, and writes to, or
+        ``None`` if the event does not declare its dependencies.
+    """
+    try:
+        (reads, writes) = event.dependencies
+    except AttributeError:
+        return None
+
+    return {id(obj) for obj in reads}, {id(obj) for obj in writes}
+
+
+def _conflict(dependencies, other):
+    if dependencies is None or other is None:
+        return True
+    (reads, writes) = dependencies
+    (other_reads, other_writes) = other
+    return bool(writes & (other_reads | other_writes) or other_writes & reads)
+
+
+def dispatch_waves(events, dependencies=None):
+    """Split events that happen at the same time into waves.
+
+    Events are taken in the order they would run one at a time. Each
+    event is put in the wave after the last wave that holds an event it
+    conflicts with, so that the events of a wave are independent of one
+    another, and events that conflict run in their original order.
+
+    Parameters
+    ----------
+    events : iterable of event-like
+        Events in the order they would be run.
+    dependencies : callable, optional
+        Function that gives the dependencies of an event. The default
+        is :func:`event_dependencies`.
+
+    Returns
+    -------
+    list of list
+        Waves of events, each in the order the events were given.
+    """
+    dependencies = dependencies or event_dependencies
+
+    waves = []
+    placed = []
+    for event in events:
+        deps = dependencies(event)
+
+        wave = 0
+        for other_wave, other in placed:
+            if other_wave >= wave and _conflict(deps, other):
+                wave = other_wave + 1
+
+        if wave == len(waves):
+            waves.append([])
+        waves[wave].append(event)
+        placed.append((wave, deps))
+
+    return waves
+
+
+def _run_event(event, time):
+    try:
+        event.run
+    except AttributeError:
+        event.update(time)
+    else:
+        event.run(time)
+
 
 class EventManager:
     """
@@ -59,6 +172,12 @@ class EventManager:
     ----------
     events : dict-like
         Events as event-object/repeat interval pairs.
+    dispatch : {'serial', 'concurrent'}, optional
+        Run events one at a time or, for events that happen at the same
+        time and are independent of one another, concurrently on a pool
+        of threads.
+    max_workers : int, optional
+        Maximum number of threads used to run events concurrently.
 
     See Also
     --------
@@ -88,13 +207,21 @@ class EventManager:
     2
     """
 
-    def __init__(self, *args):
+    def __init__(self, *args, dispatch="serial", max_workers=None):
         if len(args) > 1:
             raise TypeError(
                 "__init__() takes 1 or 2 arguments (%d given)" % (len(args) + 1,)
             )
+        if dispatch not in DISPATCHES:
+            raise ValueError(
+                f"{dispatch}: dispatch not understood (not one of {DISPATCHES})"
+            )
 
         self._timeline = Timeline(*args)
+        self._dispatch = dispatch
+        self._max_workers = max_workers
+        self._executor = None
+        self._dependencies = {}
         self._initializing = False
         self._initialized = False
         self._running = False
@@ -135,14 +262,46 @@ class EventManager:
         self.initialize()
         if not self._running:
             self._running = True
-            for event in self._timeline.iter_until(stop_time):
-                try:
-                    event.run
-                except AttributeError:
-                    event.update(self._timeline.time)
+            try:
+                if self._dispatch == "serial":
+                    for event in self._timeline.iter_until(stop_time):
+                        _run_event(event, self._timeline.time)
                 else:
-                    event.run(self._timeline.time)
-            self._running = False
+                    for events in self._timeline.iter_groups_until(stop_time):
+                        self._run_concurrently(events, self._timeline.time)
+            finally:
+                self._running = False
+
+    def _run_concurrently(self, events, time):
+        """Run events that happen at the same time, wave by wave.
+
+        If events fail, the error of the first of them, in the order they
+        would have run one at a time, is raised once the wave is done.
+        """
+        for wave in dispatch_waves(events, dependencies=self.dependencies):
+            if len(wave) == 1:
+                _run_event(wave[0], time)
+                continue
+
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self._max_workers
+                )
+            futures = [self._executor.submit(_run_event, event, time) for event in wave]
+            concurrent.futures.wait(futures)
+            for future in futures:
+                future.result()
+
+    def dependencies(self, event):
+        """What an event reads from and writes to when it runs.
+
+        Dependencies given when the event was added take precedence over
+        those the event declares itself (see :func:`event_dependencies`).
+        """
+        try:
+            return self._dependencies[id(event)]
+        except KeyError:
+            return event_dependencies(event)
 
     def finalize(self):
         """Finalize managed events.
@@ -159,7 +318,11 @@ class EventManager:
                     event.finalize()
             self._initialized = False
 
-    def add_recurring_event(self, event, interval):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def add_recurring_event(self, event, interval, reads=None, writes=None):
         """Add a managed event.
 
         Add *event* to the list of managed events and run it with the
@@ -171,7 +334,16 @@ class EventManager:
             Event to be managed.
         interval : float
             Recurrence interval for the event.
+        reads, writes : iterable, optional
+            Objects that the event reads from and writes to when it runs.
+            If either is given, these replace the dependencies that the
+            event declares itself.
         """
+        if reads is not None or writes is not None:
+            self._dependencies[id(event)] = (
+                {id(obj) for obj in reads or ()},
+                {id(obj) for obj in writes or ()},
+            )
         self._timeline.add_recurring_event(event, interval)
         self._order.append((event, interval))
 
@@ -243,5 +415,9 @@ class EventManager:
     def __exit__(self, exception_type, value, traceback):
         self.finalize()
 
+    def __iter__(self):
+        for event, _ in self._order:
+            yield event
+
     def __len__(self):
         return len(self._order)
@@ -8,8 +8,22 @@ import yaml
 
 from ..component.grid import GridMixIn
 from ..framework import services
-from ..mappers import NearestVal
+from ..grids.assertions import is_dynamic
+from ..mappers import (
+    Bilinear,
+    IdentityMapper,
+    InverseDistance,
+    NearestVal,
+    VectorMapper,
+)
+from ..mappers.cache import MAPPER_CACHE
 from ..utils import as_cwd
+from .manager import WORKING_DIRECTORY
+
+
+def _underlying_port(port):
+    """The port that a port-like object, such as a component, wraps."""
+    return getattr(port, "_port", port)
 
 
 class PortEvent(GridMixIn):
@@ -43,6 +57,19 @@ class PortEvent(GridMixIn):
 
         GridMixIn.__init__(self)
 
+    @property
+    def dependencies(self):
+        """What the event reads from and writes to when it runs.
+
+        The event runs, and so changes, its port. Events run their port in
+        their *run_dir* and so depend on the working directory of the
+        process, which they change if *run_dir* is not the current one.
+        """
+        if self._run_dir == ".":
+            return [WORKING_DIRECTORY], [self._port]
+        else:
+            return [], [self._port, WORKING_DIRECTORY]
+
     def initialize(self):
         """Initialize the event.
 
@@ -109,8 +136,18 @@ class PortMapEvent:
         Port name that is the destination.
     vars_to_map : list, optional
         Names of variable to map.
-    method : {'direct', 'nearest'}, optional
-        Method used to map values.
+    vectors_to_map : list, optional
+        Names of the components of vectors to map, as
+        ``((dst_x, dst_y), (src_x, src_y))``. Both components are mapped
+        together and, on curvilinear grids, rotated between the grids'
+        local axes.
+    method : {'direct', 'nearest', 'idw', 'bilinear'}, optional
+        Method used to map values. If the ports' grids have the same
+        geometry, values are passed through without mapping.
+    dynamic : bool, optional
+        If the nodes of either port's grid move, update the mapper before
+        each mapping. The default is to check if either grid is flagged as
+        dynamic.
     """
 
     def __init__(self, *args, **kwds):
@@ -123,22 +160,89 @@ class PortMapEvent:
         else:
             self._dst = kwds["dst_port"]
         self._vars_to_map = kwds.get("vars_to_map", [])
+        self._vectors_to_map = kwds.get("vectors_to_map", [])
         self._method = kwds.get("method", "direct")
+        self._dynamic = kwds.get(
+            "dynamic", is_dynamic(self._src) or is_dynamic(self._dst)
+        )
 
         if self._method == "direct":
-            self._mapper = None
+            self._mapper_class = None
         elif self._method == "nearest":
-            self._mapper = NearestVal()
+            self._mapper_class = NearestVal
+        elif self._method == "idw":
+            self._mapper_class = InverseDistance
+        elif self._method == "bilinear":
+            self._mapper_class = Bilinear
         else:
             raise ValueError("method %s not understood" % self._method)
+        self._mapper = None
+        self._vector_mapper = None
+
+    @property
+    def dependencies(self):
+        """What the event reads from and writes to when it runs.
+
+        Ports that wrap other ports, like components, stand for the port
+        they wrap so that the event conflicts with events that run it.
+        """
+        return [_underlying_port(self._src)], [_underlying_port(self._dst)]
 
     def initialize(self):
-        """Initialize the data mappers."""
-        if self._mapper is not None:
+        """Initialize the data mappers.
+
+        Mappers are shared with other events that map between grids with
+        the same geometry, unless the grids are dynamic.
+        """
+        if self._mapper_class is None:
+            return
+
+        if self._dynamic:
+            self._mapper = self._mapper_class()
             self._mapper.initialize(self._dst, self._src, vars=self._vars_to_map)
+        else:
+            if IdentityMapper.test(self._dst, self._src, vars=self._mapped_names()):
+                mapper_class = IdentityMapper
+            else:
+                mapper_class = self._mapper_class
+
+            self._mapper = MAPPER_CACHE.get(
+                mapper_class, self._dst, self._src, vars=self._vars_to_map
+            )
+
+        if self._vectors_to_map:
+            self._vector_mapper = VectorMapper(self._mapper)
+            self._vector_mapper.set_rotation(self._dst, self._src)
+
+    def _mapped_names(self):
+        """(*dest*, *src*) names of all of the variables that are mapped."""
+        names = list(self._vars_to_map)
+        for dst_names, src_names in self._vectors_to_map:
+            names += zip(dst_names, src_names)
+        return names
+
+    @property
+    def path(self):
+        """How values are transferred between ports.
+
+        This is 'direct' if values are passed without mapping, 'identity'
+        if the ports' grids have the same geometry, or the name of the
+        mapper used to map values.
+        """
+        if self._mapper is None:
+            return "direct"
+        elif isinstance(self._mapper, IdentityMapper):
+            return "identity"
+        else:
+            return self._mapper.name
 
     def run(self, stop_time):
         """Map values from one port to another."""
+        if self._dynamic and self._mapper is not None:
+            self._mapper.update(self._dst, self._src, vars=self._vars_to_map)
+            if self._vector_mapper is not None:
+                self._vector_mapper.set_rotation(self._dst, self._src)
+
         for dst_name, src_name in self._vars_to_map:
             src_values = self._src.get_value(
                 src_name, units=self._dst.get_var_units(dst_name)
@@ -151,5 +255,19 @@ class PortMapEvent:
 
             self._dst.set_value(dst_name, dst_values)
 
+        for dst_names, src_names in self._vectors_to_map:
+            src_values = [
+                self._src.get_value(src_name, units=self._dst.get_var_units(dst_name))
+                for dst_name, src_name in zip(dst_names, src_names)
+            ]
+
+            if self._vector_mapper is None:
+                dst_values = src_values
+            else:
+                dst_values = self._vector_mapper.run(src_values)
+
+            for dst_name, values in zip(dst_names, dst_values):
+                self._dst.set_value(dst_name, values)
+
     def finalize(self):
         pass
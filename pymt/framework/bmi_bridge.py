@@ -12,6 +12,7 @@ import yaml
 from deprecated import deprecated
 
 from ..errors import BmiError
+from ..grids.pyramid import GridPyramid
 from ..units import transform_azimuth_to_math, transform_math_to_azimuth
 from ..utils import as_cwd
 from .bmi_docstring import bmi_docstring
@@ -269,6 +270,7 @@ class _BmiCap(DeprecatedMethods):
         self._bmi = self._cls()
         self._initialized = False
         self._grid = dict()
+        self._pyramid = dict()
         self._var = dict()
         self._time_units = None
         self._initdir = None
@@ -338,7 +340,9 @@ class _BmiCap(DeprecatedMethods):
         val = np.asarray(val).reshape((-1,))
         return self.bmi.set_value(name, val)
 
-    def get_value(self, name, out=None, units=None, angle=None, at=None, method=None):
+    def get_value(
+        self, name, out=None, units=None, angle=None, at=None, method=None, level=0
+    ):
         if out is None:
             # grid = self.var_grid(name)
             dtype = self.var_type(name)
@@ -387,6 +391,11 @@ class _BmiCap(DeprecatedMethods):
             elif angle == "math" and "azimuth" in name:
                 transform_azimuth_to_math(out, units)
 
+        if level:
+            if self.var_location(name) != "node":
+                raise ValueError(f"{name}: only values on nodes can be coarsened")
+            return self.grid_pyramid(self.var_grid(name)).restrict(out, level)
+
         return out
 
     def get_value_ptr(self, name):
@@ -430,6 +439,40 @@ class _BmiCap(DeprecatedMethods):
         self.bmi.get_grid_origin(grid, out)
         return out
 
+    def grid_pyramid(self, grid):
+        """Coarsened versions of a uniform rectilinear or rectilinear grid.
+
+        Parameters
+        ----------
+        grid : int
+            Id of the grid.
+
+        Returns
+        -------
+        GridPyramid
+            The grid's pyramid, with levels coarsened by 2, 4 and 8.
+        """
+        try:
+            return self._pyramid[grid]
+        except KeyError:
+            pass
+
+        gtype = self.grid_type(grid)
+        shape = self.grid_shape(grid)
+        if gtype == "uniform_rectilinear":
+            pyramid = GridPyramid(
+                shape, spacing=self.grid_spacing(grid), origin=self.grid_origin(grid)
+            )
+        elif gtype == "rectilinear":
+            axes = (self.grid_z, self.grid_y, self.grid_x)[-len(shape) :]
+            pyramid = GridPyramid(shape, axes=[axis(grid) for axis in axes])
+        else:
+            raise ValueError(f"{gtype}: grid cannot be coarsened (not rectilinear)")
+
+        self._pyramid[grid] = pyramid
+
+        return pyramid
+
     def grid_face_node_connectivity(self, grid, out=None):
         if out is None:
             out = np.empty(self.grid_vertex_count(grid), dtype=ctypes.c_int)
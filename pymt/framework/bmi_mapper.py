@@ -1,7 +1,10 @@
 import warnings
+import weakref
 
 import numpy as np
 
+from .bmi_ugrid import dataset_from_bmi_grid
+
 try:
     import ESMF as esmf
 except ImportError:
@@ -153,6 +156,49 @@ def run_regridding(srcfield, dstfield, method="nearest", unmapped="pass"):
 
 
 class GridMapperMixIn:
+    @property
+    def dynamic_grids(self):
+        """Ids of grids whose nodes move as the model runs.
+
+        Add a grid's id to this set so that the grid is read again from
+        the model, and cached ESMF objects for it are rebuilt if it has
+        moved, whenever values are regridded to or from it.
+        """
+        try:
+            return self._dynamic_grids
+        except AttributeError:
+            self._dynamic_grids = set()
+            return self._dynamic_grids
+
+    def refresh_grid(self, gid):
+        """Read a grid again from the model.
+
+        Parameters
+        ----------
+        gid : int
+            Id of the grid.
+
+        Returns
+        -------
+        bool
+            ``True`` if the grid has changed since it was last read, in
+            which case any cached ESMF mesh, fields, pyramid, and regrid
+            decisions for it are discarded.
+        """
+        grid = dataset_from_bmi_grid(self, gid)
+        if grid.fingerprint() == self.grid[gid].fingerprint():
+            return False
+
+        self.grid[gid] = grid
+        getattr(self, "_esmf_mesh", {}).pop(gid, None)
+        getattr(self, "_pyramid", {}).pop(gid, None)
+        fields = getattr(self, "_esmf_field", {})
+        for _id in [_id for _id in fields if _id.startswith(f"{gid}.")]:
+            del fields[_id]
+        getattr(self, "_regrid_paths", {}).clear()
+
+        return True
+
     def _esmf_mesh_by_id(self, gid):
         try:
             self._esmf_mesh
@@ -185,6 +231,64 @@ class GridMapperMixIn:
 
         return self._esmf_field[_id]
 
+    def _choose_regrid_path(self, name, dst, dst_name):
+        try:
+            (src_var, dst_var) = (self.var[name], dst.var[dst_name])
+            is_identity = (
+                src_var.location == dst_var.location
+                and self.grid[src_var.grid].fingerprint()
+                == dst.grid[dst_var.grid].fingerprint()
+            )
+        except (AttributeError, KeyError):
+            is_identity = False
+
+        if is_identity:
+            return "identity"
+        elif esmf is not None:
+            return "esmf"
+        else:
+            return "none"
+
+    def regrid_path(self, name, to=None, to_name=None):
+        """How values are transferred from one grid to another.
+
+        Values are copied directly if the source and destination grids
+        have the same geometry, otherwise they are regridded with ESMF.
+        The choice is made the first time a pair of variables is regridded.
+
+        Parameters
+        ----------
+        name : str
+            Name of the values to regrid.
+        to : bmi_like, optional
+            BMI object onto which to map values. If not provided, map
+            values onto one of the object's own grids.
+        to_name : str, optional
+            Name of the value to map onto. If not provided, use *name*.
+
+        Returns
+        -------
+        str
+            One of 'identity' (values are passed through unchanged),
+            'esmf' (values are regridded with ESMF) or 'none' (ESMF is
+            not available so values are passed through unchanged).
+        """
+        dst = self if to is None else to
+        dst_name = name if to_name is None else to_name
+
+        try:
+            self._regrid_paths
+        except AttributeError:
+            self._regrid_paths = weakref.WeakKeyDictionary()
+
+        paths = self._regrid_paths.setdefault(dst, dict())
+        try:
+            return paths[name, dst_name]
+        except KeyError:
+            path = self._choose_regrid_path(name, dst, dst_name)
+            paths[name, dst_name] = path
+            return path
+
     def regrid(self, name, **kwds):
         """Regrid values from one grid to another.
 
@@ -197,18 +301,39 @@ class GridMapperMixIn:
             values onto one of the object's own grids.
         to_name : str, optional
             Name of the value to map onto. If not provided, use *name*.
+        level : int, optional
+            Coarse level of the destination grid's pyramid (see
+            :meth:`grid_pyramid`) onto which to regrid values. Values
+            cannot be coarsened if they are passed through without
+            regridding onto a different grid (the 'none' path).
 
         Returns
         -------
         ndarray
-            The regridded values.
+            The regridded values. If the source and destination grids are
+            the same, these are the source values themselves.
+
+        See Also
+        --------
+        :meth:`regrid_path` : How values are transferred between grids.
         """
         dst = kwds.pop("to", self)
         dst_name = kwds.pop("to_name", name)
+        level = kwds.pop("level", 0)
+
+        for bmi, var_name in ((self, name), (dst, dst_name)):
+            dynamic_grids = getattr(bmi, "dynamic_grids", ())
+            if dynamic_grids and bmi.var[var_name].grid in dynamic_grids:
+                if bmi.refresh_grid(bmi.var[var_name].grid):
+                    getattr(self, "_regrid_paths", {}).clear()
+
+        path = self.regrid_path(name, to=dst, to_name=dst_name)
+        if level and path == "none":
+            raise ValueError("values cannot be coarsened without regridding them")
 
         data = self.get_value(name, **kwds)
 
-        if esmf is not None:
+        if path == "esmf":
             src_field = self._esmf_field_by_id(self.var[name].grid, at="node")
             dst_field = dst._esmf_field_by_id(dst.var[dst_name].grid, at="node")
 
@@ -216,9 +341,12 @@ class GridMapperMixIn:
 
             run_regridding(src_field, dst_field)
 
-            return dst_field.data
-        else:
-            return data
+            data = dst_field.data
+
+        if level:
+            pyramid = dst.grid_pyramid(dst.var[dst_name].grid)
+            return pyramid.restrict(np.reshape(data, (-1,)), level)
+        return data
 
     def map_to(self, name, **kwds):
         """Map values to another grid.
@@ -2,7 +2,7 @@ import matplotlib.pyplot as plt
 import numpy as np
 
 
-def quick_plot(bmi, name, **kwds):
+def quick_plot(bmi, name, level=0, **kwds):
     if bmi.var_location(name) == "none":
         raise ValueError(f"{name} does not have an associated grid to plot")
 
@@ -17,9 +17,12 @@ def quick_plot(bmi, name, **kwds):
         name=grid.node_y.standard_name, units=grid.node_y.units
     )
 
-    z = bmi.get_value(name)
+    z = bmi.get_value(name, level=level)
 
-    if gtype.startswith("unstructured"):
+    if level:
+        (y, x) = bmi.grid_pyramid(gid).axes(level)[-2:]
+        plt.pcolormesh(x, y, z.reshape((len(y), len(x))), **kwds)
+    elif gtype.startswith("unstructured"):
         x, y = grid.node_x.values, grid.node_y.values
         nodes_per_face = bmi.grid_nodes_per_face(gid)
         if np.all(nodes_per_face == 3):
@@ -4,6 +4,15 @@ import numpy as np
 import xarray as xr
 from landlab.graph import RectilinearGraph, StructuredQuadGraph, UniformRectilinearGraph
 
+from ..grids.geometry import (
+    bounding_boxes,
+    cell_vertices,
+    polygon_areas,
+    polygon_centroids,
+)
+from ..grids.registry import intern_array
+from ..grids.utils import fingerprint_arrays, get_cells_at_node
+
 COORDINATE_NAMES = ["z", "y", "x"]
 INDEX_NAMES = ["k", "j", "i"]
 
@@ -27,6 +36,32 @@ class _Base(xr.Dataset):
         self.metadata = OrderedDict()
         super().__init__()
 
+    def fingerprint(self):
+        """A content-based identifier of the grid's geometry.
+
+        Uniform rectilinear grids are identified by their shape, spacing
+        and origin, all other grids by their node coordinates and, if
+        they have them, their shape and face-node connectivity.
+        """
+        if "node_spacing" in self:
+            names = ["node_shape", "node_spacing", "node_origin"]
+        else:
+            names = [
+                name
+                for name in (
+                    "node_shape",
+                    "node_z",
+                    "node_y",
+                    "node_x",
+                    "face_node_connectivity",
+                    "face_node_offset",
+                )
+                if name in self
+            ]
+        return self.grid_type + ":" + fingerprint_arrays(
+            *(self[name].values for name in names)
+        )
+
     def set_mesh(self):
         self.update({"mesh": xr.DataArray(data=self.grid_id, attrs=self.metadata)})
 
@@ -52,7 +87,7 @@ class _Base(xr.Dataset):
         for dim_name in COORDINATE_NAMES[: -(self.ndim + 1) : -1]:
             data = getattr(self.bmi, "grid_" + dim_name)(self.grid_id)
             coord = xr.DataArray(
-                data=data,
+                data=intern_array(data),
                 dims=("node",),
                 attrs={"standard_name": dim_name, "units": "m"},
             )
@@ -65,7 +100,7 @@ class _Base(xr.Dataset):
         coords = {}
         for axis, dim_name in enumerate(COORDINATE_NAMES[-self.ndim :]):
             coord = xr.DataArray(
-                data=coords_at_node[axis].reshape(-1),
+                data=intern_array(coords_at_node[axis].reshape(-1)),
                 dims=("node",),
                 attrs={"standard_name": dim_name, "units": "m"},
             )
@@ -77,7 +112,7 @@ class _Base(xr.Dataset):
         if data is None:
             data = self.bmi.grid_face_nodes(self.grid_id)
         face_node_connectivity = xr.DataArray(
-            data=data,
+            data=intern_array(data),
             dims=("vertex",),
             attrs={"standard_name": "Face-node connectivity"},
         )
@@ -87,12 +122,110 @@ class _Base(xr.Dataset):
         if data is None:
             data = self.bmi.grid_face_node_offset(self.grid_id)
         face_node_offset = xr.DataArray(
-            data=data,
+            data=intern_array(data),
             dims=("face",),
             attrs={"standard_name": "Offset to face-node connectivity"},
         )
         self.update({"face_node_offset": face_node_offset})
 
+    def set_face_geometry(self):
+        """Add the areas, centroids and bounding boxes of faces.
+
+        Faces are the polygons given by the face-node connectivity of a
+        2D grid.
+        """
+        if self.ndim != 2 or "face_node_connectivity" not in self:
+            raise ValueError("face geometry is only available for 2D grids with faces")
+
+        (xv, yv) = cell_vertices(
+            self["node_x"].values,
+            self["node_y"].values,
+            self["face_node_connectivity"].values,
+            self["face_node_offset"].values,
+        )
+        (x, y) = polygon_centroids(xv, yv)
+
+        self.update(
+            {
+                "face_area": xr.DataArray(
+                    data=polygon_areas(xv, yv),
+                    dims=("face",),
+                    attrs={"standard_name": "cell_area", "units": "m2"},
+                ),
+                "face_x": xr.DataArray(
+                    data=x, dims=("face",), attrs={"standard_name": "x", "units": "m"}
+                ),
+                "face_y": xr.DataArray(
+                    data=y, dims=("face",), attrs={"standard_name": "y", "units": "m"}
+                ),
+                "face_bounds": xr.DataArray(
+                    data=bounding_boxes(xv, yv),
+                    dims=("face", "bounds"),
+                    attrs={"long_name": "Face x_min, y_min, x_max, y_max"},
+                ),
+            }
+        )
+
+    def set_node_faces(self):
+        """Add the faces that share each node, as compressed sparse rows."""
+        if "face_node_connectivity" not in self:
+            raise ValueError("grid has no faces")
+
+        (faces, offset) = get_cells_at_node(
+            self["face_node_connectivity"].values,
+            self["face_node_offset"].values,
+            self["node_x"].size,
+        )
+        self.update(
+            {
+                "node_face_connectivity": xr.DataArray(
+                    data=faces,
+                    dims=("node_face",),
+                    attrs={"standard_name": "Node-face connectivity"},
+                ),
+                "node_face_offset": xr.DataArray(
+                    data=offset[1:],
+                    dims=("node",),
+                    attrs={"standard_name": "Offset to node-face connectivity"},
+                ),
+            }
+        )
+
+    def get_face_areas(self):
+        """Area of each face, computed the first time it is needed."""
+        if "face_area" not in self:
+            self.set_face_geometry()
+        return self["face_area"].values
+
+    def get_face_centroids(self):
+        """Coordinates of the centroid of each face."""
+        if "face_x" not in self:
+            self.set_face_geometry()
+        return self["face_x"].values, self["face_y"].values
+
+    def get_face_bounds(self):
+        """The (x_min, y_min, x_max, y_max) of each face."""
+        if "face_bounds" not in self:
+            self.set_face_geometry()
+        return self["face_bounds"].values
+
+    def get_node_faces(self):
+        """Faces that share each node.
+
+        Returns
+        -------
+        (faces, offset) : tuple of ndarray of int
+            The faces of node *i* are ``faces[offset[i - 1]:offset[i]]``,
+            with offsets, like those of the face-node connectivity, to
+            the end of each node's faces.
+        """
+        if "node_face_connectivity" not in self:
+            self.set_node_faces()
+        return (
+            self["node_face_connectivity"].values,
+            self["node_face_offset"].values,
+        )
+
 
 class Scalar(_Base):
     __slots__ = ()
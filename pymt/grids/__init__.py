@@ -4,6 +4,7 @@ from .assertions import (
     is_uniform_rectilinear,
     is_unstructured,
 )
+from .dtypes import get_index_dtype, set_index_dtype
 from .field import RasterField, RectilinearField, StructuredField, UnstructuredField
 from .igrid import DimensionError
 from .raster import UniformRectilinear, UniformRectilinearPoints
@@ -29,4 +30,6 @@ __all__ = [
     "is_structured",
     "is_unstructured",
     "DimensionError",
+    "get_index_dtype",
+    "set_index_dtype",
 ]
@@ -67,3 +67,15 @@ def is_unstructured(grid, strict=True):
         return not (
             is_structured(grid) or is_rectilinear(grid) or is_uniform_rectilinear(grid)
         )
+
+
+def is_dynamic(grid):
+    """Test if a grid is flagged as having nodes that move.
+
+    A grid is dynamic if its *dynamic* attribute is set, for example
+    ``UnstructuredPoints(y, x, attrs={"dynamic": True})``.
+    """
+    try:
+        return bool(grid.get_attrs().get("dynamic", False))
+    except AttributeError:
+        return False
@@ -36,8 +36,12 @@ array([27, 26, 30, 31, 43, 42, 46, 47])
 
 """
 
+import weakref
+
 import numpy as np
 
+from .registry import intern_array
+
 
 def _get_interior_ids(shape, dtype=int):
     """
@@ -123,7 +127,8 @@ def get_connectivity(shape, **kwds):
         Node ordering.  One of 'cw' (clockwise), 'ccw' (counter-clockwise),
         or 'none' (ordering not guaranteed).
     dtype: str or numpy.dtype
-        The desired data type of the returned arrays.
+        The desired data type of the returned arrays. Use 'smallest' for
+        the smallest integer type that can hold the node ids and offsets.
     with_offsets: bool
         Return offset array along with connectivity
 
@@ -201,6 +206,8 @@ def get_connectivity(shape, **kwds):
     """
     kwds.setdefault("dtype", int)
     kwds.setdefault("ordering", "cw")
+    if isinstance(kwds["dtype"], str) and kwds["dtype"] == "smallest":
+        kwds["dtype"] = smallest_index_dtype(np.prod(shape) * 2 ** len(shape))
     with_offsets = kwds.pop("with_offsets", False)
     as_cell_list = kwds.pop("as_cell_list", False)
 
@@ -230,6 +237,188 @@ def get_connectivity(shape, **kwds):
         return c
 
 
+def smallest_index_dtype(max_value):
+    """The smallest integer type that can hold indices up to a value.
+
+    Parameters
+    ----------
+    max_value : int
+        The largest index (or offset) that must be represented.
+
+    Returns
+    -------
+    numpy.dtype
+        Either int32 or int64.
+
+    Examples
+    --------
+    >>> from pymt.grids.connectivity import smallest_index_dtype
+    >>> smallest_index_dtype(2 ** 31 - 1)
+    dtype('int32')
+    >>> smallest_index_dtype(2 ** 31)
+    dtype('int64')
+    """
+    if max_value <= np.iinfo(np.int32).max:
+        return np.dtype(np.int32)
+    else:
+        return np.dtype(np.int64)
+
+
+_CONNECTIVITY = weakref.WeakValueDictionary()
+
+
+def _cached_connectivity(shape, ordering, dtype):
+    key = (shape, ordering, dtype)
+    try:
+        return (
+            _CONNECTIVITY[key + ("connectivity",)],
+            _CONNECTIVITY[key + ("offset",)],
+        )
+    except KeyError:
+        pass
+
+    (c, o) = get_connectivity(shape, ordering=ordering, dtype=dtype, with_offsets=True)
+    (c, o) = (intern_array(c, copy=False), intern_array(o, copy=False))
+    c.flags.writeable = o.flags.writeable = False
+
+    _CONNECTIVITY[key + ("connectivity",)] = c
+    _CONNECTIVITY[key + ("offset",)] = o
+
+    return (c, o)
+
+
+def cached_connectivity(shape, ordering="cw", dtype=int):
+    """Connectivity and offsets of a structured grid, shared between grids.
+
+    Arrays are cached by shape, so grids of the same shape share the same
+    arrays, which are therefore read-only. They are kept only as long as
+    something refers to them and, if there is a grid registry (see
+    :mod:`pymt.grids.registry`), are interned in it.
+
+    Parameters
+    ----------
+    shape: tuple of int
+        The shape of the grid.
+    ordering: {'cw', 'ccw', 'none'}, optional
+        Node ordering.
+    dtype: str or numpy.dtype, optional
+        The data type of the arrays, or 'smallest'.
+
+    Returns
+    -------
+    (connectivity, offset) : tuple of ndarray
+        Read-only connectivity and offset arrays.
+
+    Examples
+    --------
+    >>> from pymt.grids.connectivity import cached_connectivity
+    >>> (c, o) = cached_connectivity((2, 3))
+    >>> c
+    array([0, 1, 4, 3, 1, 2, 5, 4])
+    >>> c is cached_connectivity((2, 3))[0]
+    True
+    >>> c.flags.writeable
+    False
+    """
+    shape = tuple(int(n) for n in shape)
+    if isinstance(dtype, str) and dtype == "smallest":
+        dtype = smallest_index_dtype(np.prod(shape) * 2 ** len(shape))
+    return _cached_connectivity(shape, ordering, np.dtype(dtype).str)
+
+
+class StructuredStencil:
+    """Implicit connectivity of a structured grid.
+
+    Rather than storing the nodes of every cell, the nodes of a cell are
+    found from its index, when they are asked for, by adding a fixed set
+    of offsets (the stencil) to the cell's first node.
+
+    Parameters
+    ----------
+    shape: tuple of int
+        The shape of the grid, measured in nodes.
+    ordering: {'cw', 'ccw', 'none'}, optional
+        Node ordering.
+
+    Examples
+    --------
+    >>> from pymt.grids.connectivity import StructuredStencil
+    >>> stencil = StructuredStencil((3, 4))
+    >>> len(stencil)
+    6
+    >>> stencil.nodes_per_cell
+    4
+    >>> stencil[4]
+    array([ 5,  6, 10,  9])
+    >>> stencil[[0, 5]]
+    array([[ 0,  1,  5,  4],
+           [ 6,  7, 11, 10]])
+
+    The full connectivity is only created if asked for.
+
+    >>> (c, o) = stencil.as_arrays()
+    >>> c[:8]
+    array([0, 1, 5, 4, 1, 2, 6, 5])
+    >>> o
+    array([ 4,  8, 12, 16, 20, 24])
+    """
+
+    def __init__(self, shape, ordering="cw"):
+        self._shape = tuple(int(n) for n in shape)
+        self._ordering = ordering
+        self._offsets = _get_offsets(self._shape, ordering=ordering)
+        self._cell_shape = tuple(max(n - 1, 0) for n in self._shape)
+        self._node_strides = np.cumprod((1,) + self._shape[:0:-1])[::-1]
+
+    @property
+    def shape(self):
+        """Shape of the grid, measured in nodes."""
+        return self._shape
+
+    @property
+    def nodes_per_cell(self):
+        """Number of nodes that define each cell."""
+        return len(self._offsets)
+
+    def __len__(self):
+        return int(np.prod(self._cell_shape))
+
+    def first_node(self, cells):
+        """The node with the smallest id of each cell.
+
+        Parameters
+        ----------
+        cells : int or array_like of int
+            Cell ids.
+
+        Returns
+        -------
+        int or ndarray of int
+            Node ids.
+        """
+        index = np.unravel_index(cells, self._cell_shape)
+        return sum(i * stride for i, stride in zip(index, self._node_strides))
+
+    def __getitem__(self, cells):
+        return np.add.outer(self.first_node(cells), self._offsets)
+
+    def as_arrays(self, dtype=int):
+        """Connectivity and offsets of all cells.
+
+        Parameters
+        ----------
+        dtype: str or numpy.dtype, optional
+            The data type of the arrays, or 'smallest'.
+
+        Returns
+        -------
+        (connectivity, offset) : tuple of ndarray
+            Read-only connectivity and offset arrays (see
+            :func:`cached_connectivity`).
+        """
+        return cached_connectivity(self._shape, ordering=self._ordering, dtype=dtype)
+
+
 def get_connectivity_2d(shape, ordering="cw", dtype=int):
     """This is a little slower than the above and less general.
 
@@ -0,0 +1,127 @@
+"""Data types of the arrays that describe grids.
+
+Node ids, connectivity and offsets of grids are stored with a single,
+package-wide integer type that, by default, is the platform's ``int``.
+For very large grids, memory can be halved by storing these as 32-bit
+integers instead.
+
+Examples
+--------
+>>> import numpy as np
+>>> from pymt.grids import Unstructured, get_index_dtype, set_index_dtype
+
+>>> get_index_dtype()
+dtype('int64')
+>>> previous = set_index_dtype("int32")
+>>> grid = Unstructured([0, 0, 1], [0, 1, 0], connectivity=[0, 1, 2], offset=[3])
+>>> grid.get_connectivity()
+array([0, 1, 2], dtype=int32)
+>>> _ = set_index_dtype(previous)
+
+Coordinates are double precision unless another type is given when a
+grid is created.
+
+>>> grid = Unstructured(
+...     [0, 0, 1], [0, 1, 0], connectivity=[0, 1, 2], offset=[3], coord_dtype="float32"
+... )
+>>> grid.get_x()
+array([0., 1., 0.], dtype=float32)
+"""
+
+import numpy as np
+
+_INDEX_DTYPE = np.dtype(int)
+
+
+def set_index_dtype(dtype):
+    """Set the integer type used for the node ids of new grids.
+
+    Parameters
+    ----------
+    dtype : str or numpy.dtype
+        A signed integer type (``"int32"`` or ``"int64"``, for example).
+
+    Returns
+    -------
+    numpy.dtype
+        The previous index type.
+    """
+    global _INDEX_DTYPE
+
+    dtype = np.dtype(dtype)
+    if not np.issubdtype(dtype, np.signedinteger):
+        raise TypeError(f"{dtype}: index type must be a signed integer")
+
+    (previous, _INDEX_DTYPE) = (_INDEX_DTYPE, dtype)
+
+    return previous
+
+
+def get_index_dtype():
+    """The integer type used for the node ids of new grids."""
+    return _INDEX_DTYPE
+
+
+def check_index_range(max_value, dtype=None):
+    """Check that an index can be represented with an integer type.
+
+    Parameters
+    ----------
+    max_value : int
+        The largest value that must be represented.
+    dtype : numpy.dtype, optional
+        Integer type. The default is the current index type.
+
+    Raises
+    ------
+    OverflowError
+        If *max_value* is too large for the type.
+    """
+    dtype = np.dtype(dtype or _INDEX_DTYPE)
+    if max_value > np.iinfo(dtype).max:
+        raise OverflowError(f"{max_value}: value is too large for {dtype} indices")
+
+
+def as_index_array(array, dtype=None):
+    """Copy an array of indices as a flat array of the index type.
+
+    Arrays that are read-only, and already of the index type, are shared
+    rather than copied (see
+    :func:`~pymt.grids.connectivity.cached_connectivity`).
+
+    Parameters
+    ----------
+    array : array_like
+        Indices.
+    dtype : numpy.dtype, optional
+        Integer type. The default is the current index type.
+
+    Returns
+    -------
+    ndarray
+        The indices.
+
+    Raises
+    ------
+    OverflowError
+        If the indices cannot be represented with the index type.
+    """
+    dtype = np.dtype(dtype or _INDEX_DTYPE)
+
+    if (
+        isinstance(array, np.ndarray)
+        and not array.flags.writeable
+        and array.dtype == dtype
+    ):
+        return array.reshape((-1,))
+
+    array = np.asarray(array)
+    if array.size > 0 and np.issubdtype(array.dtype, np.integer):
+        info = np.iinfo(dtype)
+        if array.max() > info.max or array.min() < info.min:
+            raise OverflowError(f"indices are out of the range of {dtype}")
+
+    array = np.array(array, dtype=dtype)
+    array.shape = array.size
+
+    return array
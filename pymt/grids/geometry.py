@@ -0,0 +1,418 @@
+"""Vectorised geometry of grid cells.
+
+Cells are represented as padded arrays of vertex coordinates with one row
+for each cell. Cells with fewer vertices than the widest cell repeat their
+last vertex, which adds only zero-length edges, so every operation works
+on whole arrays without a loop over cells.
+
+Examples
+--------
+>>> import numpy as np
+>>> from pymt.grids.geometry import cell_vertices, polygon_areas
+
+A square and a triangle.
+
+>>> x = np.array([0.0, 1.0, 1.0, 0.0, 2.0])
+>>> y = np.array([0.0, 0.0, 1.0, 1.0, 0.0])
+>>> (xv, yv) = cell_vertices(x, y, [0, 1, 2, 3, 1, 4, 2], [4, 7])
+>>> xv
+array([[0., 1., 1., 0.],
+       [1., 2., 1., 1.]])
+>>> polygon_areas(xv, yv)
+array([1. , 0.5])
+"""
+
+import numpy as np
+
+
+def cell_vertices(x, y, connectivity, offset):
+    """Padded vertex coordinates of cells.
+
+    Parameters
+    ----------
+    x, y : ndarray of float
+        Coordinates of the grid's nodes.
+    connectivity : array_like of int
+        Nodes of each cell.
+    offset : array_like of int
+        Offset to the end of each cell in *connectivity*.
+
+    Returns
+    -------
+    (xv, yv) : tuple of ndarray of float, shape (n_cells, max_vertices)
+        Vertex coordinates of each cell.
+    """
+    connectivity = np.asarray(connectivity, dtype=int)
+    offset = np.asarray(offset, dtype=int)
+
+    n_vertices = np.diff(offset, prepend=0)
+    start = offset - n_vertices
+    n_max = n_vertices.max() if len(offset) > 0 else 0
+
+    vertex = np.minimum(np.arange(n_max), n_vertices[:, np.newaxis] - 1)
+    nodes = connectivity[start[:, np.newaxis] + vertex]
+
+    return np.asarray(x, dtype=float)[nodes], np.asarray(y, dtype=float)[nodes]
+
+
+def polygon_areas(xv, yv, signed=False):
+    """Areas of polygons with the shoelace formula.
+
+    Parameters
+    ----------
+    xv, yv : ndarray of float, shape (n_polygons, max_vertices)
+        Padded vertex coordinates of the polygons.
+    signed : bool, optional
+        Return signed areas, which are positive for polygons whose
+        vertices are ordered counter-clockwise.
+
+    Returns
+    -------
+    ndarray of float
+        Area of each polygon.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from pymt.grids.geometry import polygon_areas
+    >>> polygon_areas(np.array([[0.0, 0.0, 2.0]]), np.array([[0.0, 1.0, 0.0]]))
+    array([1.])
+    >>> polygon_areas(
+    ...     np.array([[0.0, 0.0, 2.0]]), np.array([[0.0, 1.0, 0.0]]), signed=True
+    ... )
+    array([-1.])
+    """
+    area = 0.5 * np.sum(
+        xv * np.roll(yv, -1, axis=1) - np.roll(xv, -1, axis=1) * yv, axis=1
+    )
+    if signed:
+        return area
+    else:
+        return np.abs(area)
+
+
+def polygon_centroids(xv, yv):
+    """Centroids of polygons.
+
+    Parameters
+    ----------
+    xv, yv : ndarray of float, shape (n_polygons, max_vertices)
+        Padded vertex coordinates of the polygons.
+
+    Returns
+    -------
+    (x, y) : tuple of ndarray of float
+        Coordinates of the centroid of each polygon. Polygons without
+        area (points and lines) are given the mean of their vertices.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from pymt.grids.geometry import polygon_centroids
+    >>> xv = np.array([[0.0, 2.0, 2.0, 0.0], [0.0, 3.0, 0.0, 0.0]])
+    >>> yv = np.array([[0.0, 0.0, 1.0, 1.0], [0.0, 0.0, 3.0, 3.0]])
+    >>> polygon_centroids(xv, yv)
+    (array([1., 1.]), array([0.5, 1. ]))
+    """
+    (x_next, y_next) = (np.roll(xv, -1, axis=1), np.roll(yv, -1, axis=1))
+    cross = xv * y_next - x_next * yv
+    area = 0.5 * np.sum(cross, axis=1)
+
+    has_area = area != 0.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x = np.sum((xv + x_next) * cross, axis=1) / (6.0 * area)
+        y = np.sum((yv + y_next) * cross, axis=1) / (6.0 * area)
+
+    is_vertex = np.ones(xv.shape, dtype=bool)
+    is_vertex[:, 1:] = (np.diff(xv, axis=1) != 0.0) | (np.diff(yv, axis=1) != 0.0)
+    n_vertices = np.count_nonzero(is_vertex, axis=1)
+    x_mean = np.sum(np.where(is_vertex, xv, 0.0), axis=1) / n_vertices
+    y_mean = np.sum(np.where(is_vertex, yv, 0.0), axis=1) / n_vertices
+
+    return np.where(has_area, x, x_mean), np.where(has_area, y, y_mean)
+
+
+def bounding_boxes(xv, yv):
+    """Bounding boxes of polygons.
+
+    Parameters
+    ----------
+    xv, yv : ndarray of float, shape (n_polygons, max_vertices)
+        Padded vertex coordinates of the polygons.
+
+    Returns
+    -------
+    ndarray of float, shape (n_polygons, 4)
+        The (x_min, y_min, x_max, y_max) of each polygon.
+    """
+    return np.column_stack(
+        (xv.min(axis=1), yv.min(axis=1), xv.max(axis=1), yv.max(axis=1))
+    )
+
+
+def contains_points(xv, yv, x, y, tol=1e-10):
+    """Test if points are within polygons, pair by pair.
+
+    Points are inside of a polygon if a ray from the point crosses the
+    polygon's edges an odd number of times, or if they lie on one of its
+    edges.
+
+    Parameters
+    ----------
+    xv, yv : ndarray of float, shape (n_pairs, max_vertices)
+        Padded vertex coordinates of the polygons.
+    x, y : ndarray of float, shape (n_pairs, )
+        Coordinates of the points.
+    tol : float, optional
+        Distance, relative to the length of an edge, within which a
+        point is on that edge.
+
+    Returns
+    -------
+    ndarray of bool
+        ``True`` for each point that is within its polygon.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from pymt.grids.geometry import contains_points
+    >>> xv = np.array([[0.0, 1.0, 1.0, 0.0]] * 3)
+    >>> yv = np.array([[0.0, 0.0, 1.0, 1.0]] * 3)
+    >>> contains_points(xv, yv, np.array([0.5, 1.0, 1.5]), np.array([0.5, 0.5, 0.5]))
+    array([ True,  True, False])
+    """
+    x = np.asarray(x, dtype=float)[:, np.newaxis]
+    y = np.asarray(y, dtype=float)[:, np.newaxis]
+    (x_next, y_next) = (np.roll(xv, -1, axis=1), np.roll(yv, -1, axis=1))
+    (dx, dy) = (x_next - xv, y_next - yv)
+
+    crosses = (yv > y) != (y_next > y)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_cross = xv + (y - yv) * dx / dy
+    is_inside = np.count_nonzero(crosses & (x < x_cross), axis=1) % 2 == 1
+
+    length = np.abs(dx) + np.abs(dy)
+    is_on_edge = (
+        (np.abs(dx * (y - yv) - dy * (x - xv)) <= tol * length**2)
+        & (x >= np.minimum(xv, x_next) - tol * length)
+        & (x <= np.maximum(xv, x_next) + tol * length)
+        & (y >= np.minimum(yv, y_next) - tol * length)
+        & (y <= np.maximum(yv, y_next) + tol * length)
+    )
+
+    return is_inside | np.any(is_on_edge, axis=1)
+
+
+def _bucket_ranges(boxes, origin, size, shape):
+    lower = np.floor((boxes[:, :2] - origin) / size).astype(int)
+    upper = np.floor((boxes[:, 2:] - origin) / size).astype(int)
+    lower = np.clip(lower, 0, np.array(shape[::-1]) - 1)
+    upper = np.clip(upper, 0, np.array(shape[::-1]) - 1)
+    return lower, upper
+
+
+def _expand_buckets(boxes, origin, size, shape):
+    """Bucket ids of the buckets that each box touches."""
+    (lower, upper) = _bucket_ranges(boxes, origin, size, shape)
+    n_cols = upper[:, 0] - lower[:, 0] + 1
+    count = n_cols * (upper[:, 1] - lower[:, 1] + 1)
+
+    box = np.repeat(np.arange(len(boxes)), count)
+    index = np.arange(count.sum()) - np.repeat(np.cumsum(count) - count, count)
+    col = lower[box, 0] + index % n_cols[box]
+    row = lower[box, 1] + index // n_cols[box]
+
+    return box, row * shape[1] + col
+
+
+def overlapping_boxes(boxes_a, boxes_b, bucket_size=None):
+    """Find pairs of overlapping bounding boxes.
+
+    Boxes are binned into a grid of square buckets. Each pair of boxes
+    is then tested only if the two boxes share a bucket, and is reported
+    once, from the bucket that contains the lower-left corner of the
+    pair's intersection.
+
+    Parameters
+    ----------
+    boxes_a, boxes_b : ndarray of float, shape (n_boxes, 4)
+        The (x_min, y_min, x_max, y_max) of each box.
+    bucket_size : float, optional
+        Width of the buckets. The default is the median width or height
+        of the boxes.
+
+    Returns
+    -------
+    (ids_a, ids_b) : tuple of ndarray of int
+        Indices of boxes that overlap, sorted by *ids_a*.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from pymt.grids.geometry import overlapping_boxes
+    >>> boxes_a = np.array([[0.0, 0.0, 1.0, 1.0], [1.0, 0.0, 2.0, 1.0]])
+    >>> boxes_b = np.array([[0.5, 0.5, 1.5, 1.5], [3.0, 3.0, 4.0, 4.0]])
+    >>> overlapping_boxes(boxes_a, boxes_b)
+    (array([0, 1]), array([0, 0]))
+    """
+    boxes_a = np.asarray(boxes_a, dtype=float)
+    boxes_b = np.asarray(boxes_b, dtype=float)
+
+    if len(boxes_a) == 0 or len(boxes_b) == 0:
+        return np.empty(0, dtype=int), np.empty(0, dtype=int)
+
+    origin = np.minimum(boxes_a[:, :2].min(axis=0), boxes_b[:, :2].min(axis=0))
+    extent = (
+        np.maximum(boxes_a[:, 2:].max(axis=0), boxes_b[:, 2:].max(axis=0)) - origin
+    )
+
+    if bucket_size is None:
+        sizes = np.concatenate(
+            (boxes_a[:, 2:] - boxes_a[:, :2], boxes_b[:, 2:] - boxes_b[:, :2])
+        )
+        bucket_size = np.median(sizes)
+    n_boxes = len(boxes_a) + len(boxes_b)
+    bucket_size = max(bucket_size, np.sqrt(extent[0] * extent[1] / (4 * n_boxes)))
+    if bucket_size <= 0.0:
+        bucket_size = 1.0
+    shape = tuple(np.floor(extent[::-1] / bucket_size).astype(int) + 1)
+
+    (box_a, bucket_a) = _expand_buckets(boxes_a, origin, bucket_size, shape)
+    (box_b, bucket_b) = _expand_buckets(boxes_b, origin, bucket_size, shape)
+
+    order = np.argsort(bucket_a, kind="stable")
+    (box_a, bucket_a) = (box_a[order], bucket_a[order])
+
+    start = np.searchsorted(bucket_a, bucket_b, side="left")
+    count = np.searchsorted(bucket_a, bucket_b, side="right") - start
+
+    ids_b = np.repeat(box_b, count)
+    bucket = np.repeat(bucket_b, count)
+    ids_a = box_a[
+        np.repeat(start - np.cumsum(count) + count, count) + np.arange(count.sum())
+    ]
+
+    (a, b) = (boxes_a[ids_a], boxes_b[ids_b])
+    is_overlapping = np.all(
+        np.maximum(a[:, :2], b[:, :2]) <= np.minimum(a[:, 2:], b[:, 2:]), axis=1
+    )
+    (lower, _) = _bucket_ranges(
+        np.hstack((np.maximum(a[:, :2], b[:, :2]),) * 2), origin, bucket_size, shape
+    )
+    is_owner = lower[:, 1] * shape[1] + lower[:, 0] == bucket
+
+    keep = is_overlapping & is_owner
+    (ids_a, ids_b) = (ids_a[keep], ids_b[keep])
+
+    order = np.lexsort((ids_b, ids_a))
+    return ids_a[order], ids_b[order]
+
+
+def _compact(xv, yv, emit):
+    """Move emitted vertices to the front of each row and pad the rest."""
+    n_emitted = emit.sum(axis=1)
+    n_max = max(n_emitted.max() if len(n_emitted) else 0, 1)
+
+    order = np.argsort(~emit, axis=1, kind="stable")[:, :n_max]
+    xv = np.take_along_axis(xv, order, axis=1)
+    yv = np.take_along_axis(yv, order, axis=1)
+
+    last = np.maximum(n_emitted - 1, 0)[:, np.newaxis]
+    is_padding = np.arange(n_max) > last
+    xv = np.where(is_padding, np.take_along_axis(xv, last, axis=1), xv)
+    yv = np.where(is_padding, np.take_along_axis(yv, last, axis=1), yv)
+
+    is_empty = n_emitted == 0
+    xv[is_empty] = 0.0
+    yv[is_empty] = 0.0
+
+    return xv, yv
+
+
+def clip_polygons(xv, yv, clip_xv, clip_yv):
+    """Clip polygons by convex polygons.
+
+    The polygons are clipped pairwise with the Sutherland-Hodgman
+    algorithm, one edge of the clipping polygons at a time, for all pairs
+    at once.
+
+    Parameters
+    ----------
+    xv, yv : ndarray of float, shape (n_polygons, n_vertices)
+        Padded vertex coordinates of the polygons to clip.
+    clip_xv, clip_yv : ndarray of float, shape (n_polygons, n_clip_vertices)
+        Padded vertex coordinates of the convex clipping polygons. The
+        vertices may be ordered either clockwise or counter-clockwise.
+
+    Returns
+    -------
+    (xv, yv) : tuple of ndarray of float
+        Padded vertex coordinates of the clipped polygons. Polygons that
+        do not overlap their clipping polygon have all of their vertices
+        at the origin.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from pymt.grids.geometry import clip_polygons, polygon_areas
+    >>> square = (np.array([[0.0, 2.0, 2.0, 0.0]]), np.array([[0.0, 0.0, 2.0, 2.0]]))
+    >>> triangle = (np.array([[1.0, 3.0, 1.0]]), np.array([[1.0, 1.0, 3.0]]))
+    >>> (xv, yv) = clip_polygons(*square, *triangle)
+    >>> polygon_areas(xv, yv)
+    array([1.])
+    """
+    xv = np.asarray(xv, dtype=float)
+    yv = np.asarray(yv, dtype=float)
+    clip_xv = np.asarray(clip_xv, dtype=float)
+    clip_yv = np.asarray(clip_yv, dtype=float)
+
+    orientation = np.where(polygon_areas(clip_xv, clip_yv, signed=True) < 0, -1.0, 1.0)
+    orientation = orientation[:, np.newaxis]
+
+    n_edges = clip_xv.shape[1]
+    for edge in range(n_edges):
+        (ax, ay) = (clip_xv[:, edge, np.newaxis], clip_yv[:, edge, np.newaxis])
+        next_edge = (edge + 1) % n_edges
+        (bx, by) = (
+            clip_xv[:, next_edge, np.newaxis],
+            clip_yv[:, next_edge, np.newaxis],
+        )
+
+        side = orientation * ((bx - ax) * (yv - ay) - (by - ay) * (xv - ax))
+        is_inside = side >= 0.0
+
+        (prev_x, prev_y) = (np.roll(xv, 1, axis=1), np.roll(yv, 1, axis=1))
+        prev_side = np.roll(side, 1, axis=1)
+        prev_is_inside = np.roll(is_inside, 1, axis=1)
+
+        crosses = is_inside != prev_is_inside
+        with np.errstate(divide="ignore", invalid="ignore"):
+            frac = np.where(crosses, prev_side / (prev_side - side), 0.0)
+        cross_x = prev_x + frac * (xv - prev_x)
+        cross_y = prev_y + frac * (yv - prev_y)
+
+        out_x = np.stack((cross_x, xv), axis=2).reshape((len(xv), -1))
+        out_y = np.stack((cross_y, yv), axis=2).reshape((len(yv), -1))
+        emit = np.stack((crosses, is_inside), axis=2).reshape((len(xv), -1))
+
+        (xv, yv) = _compact(out_x, out_y, emit)
+
+    return xv, yv
+
+
+def overlap_areas(xv, yv, clip_xv, clip_yv):
+    """Areas of overlap between pairs of polygons.
+
+    Parameters
+    ----------
+    xv, yv : ndarray of float, shape (n_pairs, n_vertices)
+        Padded vertex coordinates of polygons.
+    clip_xv, clip_yv : ndarray of float, shape (n_pairs, n_clip_vertices)
+        Padded vertex coordinates of convex polygons.
+
+    Returns
+    -------
+    ndarray of float
+        Area of the intersection of each pair of polygons.
+    """
+    return polygon_areas(*clip_polygons(xv, yv, clip_xv, clip_yv))
@@ -0,0 +1,456 @@
+"""Locate points within the cells of a grid.
+
+Along the axis of a uniform rectilinear grid, the cell that contains a
+point follows directly from its coordinate, its origin, and its spacing.
+For a rectilinear grid, the cell is found with a binary search of the
+axis coordinates. In either case, points are located without building a
+spatial index.
+
+In a structured (curvilinear) grid of quadrilaterals, a point is located
+by walking from a nearby cell through neighboring cells, using the cells'
+logical (i, j) indices, until finding the cell whose bilinear map
+contains the point.
+
+Cells of an unstructured mesh are binned, by their bounding boxes, into
+a regular grid of buckets. A point is then only tested against the
+cells of the bucket that it falls into.
+
+Examples
+--------
+>>> from pymt.grids.locate import locate_on_axis, locate_on_uniform_axis
+
+>>> locate_on_uniform_axis([0.5, 2.25, 3.0, 3.5], 0.0, 1.0, 4)
+(array([ 0,  2,  2, -1]), array([0.5 , 0.25, 1.  , 0.  ]))
+
+>>> locate_on_axis([0.5, 2.5, 3.0, 4.5], [0.0, 1.0, 2.0, 4.0])
+(array([ 0,  2,  2, -1]), array([0.5 , 0.25, 0.5 , 0.  ]))
+"""
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from .geometry import _expand_buckets, bounding_boxes, contains_points
+
+
+def locate_on_uniform_axis(coords, origin, spacing, n_nodes):
+    """Locate points along an axis of uniformly-spaced nodes.
+
+    Parameters
+    ----------
+    coords : array_like
+        Coordinates of the points.
+    origin : float
+        Coordinate of the first node.
+    spacing : float
+        Spacing between nodes.
+    n_nodes : int
+        Number of nodes along the axis.
+
+    Returns
+    -------
+    (index, fraction) : tuple of ndarray
+        Index of the cell that contains each point, and the fractional
+        position of each point within that cell. Points outside of the
+        axis have an index of -1.
+    """
+    coords = np.asarray(coords, dtype=float)
+    n_cells = n_nodes - 1
+
+    position = (coords - origin) / spacing
+    position[~np.isfinite(position)] = -1.0
+
+    index = np.floor(position).astype(int)
+    index[position == n_cells] = n_cells - 1
+
+    is_outside = (index < 0) | (index >= n_cells)
+    index[is_outside] = -1
+
+    fraction = position - index
+    fraction[is_outside] = 0.0
+
+    return index, fraction
+
+
+def locate_on_axis(coords, nodes):
+    """Locate points along an axis of monotonic nodes.
+
+    Parameters
+    ----------
+    coords : array_like
+        Coordinates of the points.
+    nodes : array_like
+        Coordinates of the nodes, either increasing or decreasing.
+
+    Returns
+    -------
+    (index, fraction) : tuple of ndarray
+        Index of the cell that contains each point, and the fractional
+        position of each point within that cell. Points outside of the
+        axis have an index of -1.
+
+    Examples
+    --------
+    >>> from pymt.grids.locate import locate_on_axis
+    >>> locate_on_axis([0.5, 2.5], [4.0, 2.0, 1.0, 0.0])
+    (array([2, 0]), array([0.5 , 0.75]))
+    """
+    coords = np.asarray(coords, dtype=float)
+    nodes = np.asarray(nodes, dtype=float)
+
+    if len(nodes) > 1 and nodes[0] > nodes[-1]:
+        (index, fraction) = locate_on_axis(coords, nodes[::-1])
+        is_inside = index >= 0
+        index[is_inside] = len(nodes) - 2 - index[is_inside]
+        fraction[is_inside] = 1.0 - fraction[is_inside]
+        return index, fraction
+
+    n_cells = len(nodes) - 1
+
+    index = np.searchsorted(nodes, coords, side="right") - 1
+    index[coords == nodes[-1]] = n_cells - 1
+
+    is_outside = (index < 0) | (index >= n_cells)
+    index[is_outside] = -1
+
+    lower = nodes[index]
+    fraction = (coords - lower) / (nodes[index + 1] - lower)
+    fraction[is_outside] = 0.0
+
+    return index, fraction
+
+
+def is_monotonic(nodes):
+    """Test if coordinates are strictly increasing or decreasing.
+
+    Examples
+    --------
+    >>> from pymt.grids.locate import is_monotonic
+    >>> is_monotonic([0.0, 1.0, 3.0]), is_monotonic([3.0, 1.0, 0.0])
+    (True, True)
+    >>> is_monotonic([0.0, 1.0, 1.0])
+    False
+    """
+    delta = np.diff(nodes)
+    return bool(np.all(delta > 0) or np.all(delta < 0))
+
+
+def locate_in_rectilinear(grid, x, y):
+    """Locate points in the cells of a 2D rectilinear grid.
+
+    Parameters
+    ----------
+    grid : grid_like
+        A rectilinear or uniform rectilinear grid.
+    x, y : array_like
+        Coordinates of the points.
+
+    Returns
+    -------
+    ((row, row_fraction), (col, col_fraction)) : tuple of tuple of ndarray
+        Cell location of each point along the grid's y and x axes (see
+        :func:`locate_on_axis`).
+
+    Examples
+    --------
+    >>> from pymt.grids.map import UniformRectilinearMap
+    >>> from pymt.grids.locate import locate_in_rectilinear
+    >>> grid = UniformRectilinearMap((3, 4), (2.0, 1.0), (0.0, 0.0))
+    >>> ((row, _), (col, _)) = locate_in_rectilinear(grid, [0.5, 2.5], [1.0, 3.0])
+    >>> row, col
+    (array([0, 1]), array([0, 2]))
+    """
+    (n_rows, n_cols) = grid.get_shape()
+
+    try:
+        (spacing, origin) = grid.get_spacing(), grid.get_origin()
+    except AttributeError:
+        return (
+            locate_on_axis(y, grid.get_axis_coordinates(axis=0)),
+            locate_on_axis(x, grid.get_axis_coordinates(axis=1)),
+        )
+    else:
+        return (
+            locate_on_uniform_axis(y, origin[0], spacing[0], n_rows),
+            locate_on_uniform_axis(x, origin[1], spacing[1], n_cols),
+        )
+
+
+def _inverse_bilinear(corners, x, y, n_iters=8):
+    """Logical coordinates of points within quadrilaterals.
+
+    Parameters
+    ----------
+    corners : tuple of tuple of ndarray
+        The (x, y) coordinates of the lower-left, lower-right, upper-left,
+        and upper-right corners of each quadrilateral.
+    x, y : ndarray
+        Coordinates of the points.
+
+    Returns
+    -------
+    (s, t) : tuple of ndarray
+        Logical coordinates, along the column and row directions, of each
+        point. Points inside of their quadrilateral have coordinates
+        between 0 and 1.
+    """
+    (x00, y00), (x01, y01), (x10, y10), (x11, y11) = corners
+
+    (ex, ey) = (x01 - x00, y01 - y00)
+    (fx, fy) = (x10 - x00, y10 - y00)
+    (gx, gy) = (x11 - x10 - x01 + x00, y11 - y10 - y01 + y00)
+
+    s = np.full_like(x, 0.5)
+    t = np.full_like(x, 0.5)
+    for _ in range(n_iters):
+        rx = x00 + s * ex + t * fx + s * t * gx - x
+        ry = y00 + s * ey + t * fy + s * t * gy - y
+
+        (dxds, dyds) = (ex + t * gx, ey + t * gy)
+        (dxdt, dydt) = (fx + s * gx, fy + s * gy)
+        det = dxds * dydt - dxdt * dyds
+        det[det == 0.0] = np.finfo(float).tiny
+
+        s -= (rx * dydt - ry * dxdt) / det
+        t -= (ry * dxds - rx * dyds) / det
+
+    return s, t
+
+
+def locate_in_structured(x_nodes, y_nodes, x, y, start=None, max_steps=None, tol=1e-9):
+    """Locate points in the cells of a 2D structured grid.
+
+    Each point starts in a cell that contains the node given by *start*
+    and walks, one cell at a time, toward the cell that contains it. All
+    points are walked together, so the number of passes is the length of
+    the longest walk rather than the number of points.
+
+    Parameters
+    ----------
+    x_nodes, y_nodes : ndarray of float, shape (n_rows, n_cols)
+        Coordinates of the grid nodes.
+    x, y : array_like
+        Coordinates of the points.
+    start : array_like of int, optional
+        Flat index of a node near each point. If not provided, use the
+        node nearest each point.
+    max_steps : int, optional
+        Maximum number of cells to walk through. The default is the
+        number of cells along the grid's longest side.
+    tol : float, optional
+        Tolerance of the logical coordinates for a point to be considered
+        inside of a cell.
+
+    Returns
+    -------
+    ((row, row_fraction), (col, col_fraction)) : tuple of tuple of ndarray
+        Cell location of each point in the grid's row and column
+        directions (see :func:`locate_in_rectilinear`). Points outside of
+        the grid have indices of -1.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from pymt.grids.locate import locate_in_structured
+
+    A grid of quadrilaterals that is sheared to the right.
+
+    >>> (y_nodes, x_nodes) = np.meshgrid(
+    ...     [0.0, 1.0, 2.0], [0.0, 1.0, 2.0, 3.0], indexing="ij"
+    ... )
+    >>> x_nodes = x_nodes + y_nodes
+
+    >>> ((row, t), (col, s)) = locate_in_structured(
+    ...     x_nodes, y_nodes, [0.5, 3.0, 5.5, 0.0], [0.5, 1.5, 1.5, 2.0]
+    ... )
+    >>> row, col
+    (array([ 0,  1, -1, -1]), array([ 0,  1, -1, -1]))
+    >>> np.round(t, 6), np.round(s, 6)
+    (array([0.5, 0.5, 0. , 0. ]), array([0. , 0.5, 0. , 0. ]))
+    """
+    x_nodes = np.asarray(x_nodes, dtype=float)
+    y_nodes = np.asarray(y_nodes, dtype=float)
+    x = np.asarray(x, dtype=float).reshape((-1,))
+    y = np.asarray(y, dtype=float).reshape((-1,))
+
+    (n_rows, n_cols) = x_nodes.shape
+    if max_steps is None:
+        max_steps = max(n_rows, n_cols)
+
+    if start is None:
+        tree = cKDTree(
+            np.column_stack((x_nodes.reshape((-1,)), y_nodes.reshape((-1,))))
+        )
+        (_, start) = tree.query(np.column_stack((x, y)))
+    (row, col) = np.divmod(np.asarray(start, dtype=int), n_cols)
+
+    row = np.minimum(row, n_rows - 2)
+    col = np.minimum(col, n_cols - 2)
+    s = np.zeros(len(x))
+    t = np.zeros(len(x))
+
+    is_found = np.zeros(len(x), dtype=bool)
+    is_active = np.ones(len(x), dtype=bool)
+    for _ in range(max_steps + 1):
+        active = np.flatnonzero(is_active)
+        if len(active) == 0:
+            break
+
+        (i, j) = (row[active], col[active])
+        corners = [
+            (x_nodes[ii, jj], y_nodes[ii, jj])
+            for (ii, jj) in ((i, j), (i, j + 1), (i + 1, j), (i + 1, j + 1))
+        ]
+        (s_active, t_active) = _inverse_bilinear(corners, x[active], y[active])
+        s[active], t[active] = (s_active, t_active)
+
+        col_step = (s_active > 1.0 + tol).astype(int) - (s_active < -tol)
+        row_step = (t_active > 1.0 + tol).astype(int) - (t_active < -tol)
+
+        is_inside = (col_step == 0) & (row_step == 0)
+        is_found[active[is_inside]] = True
+
+        new_row = np.clip(i + row_step, 0, n_rows - 2)
+        new_col = np.clip(j + col_step, 0, n_cols - 2)
+        is_stuck = (new_row == i) & (new_col == j)
+
+        (row[active], col[active]) = (new_row, new_col)
+        is_active[active[is_inside | is_stuck]] = False
+
+    row[~is_found] = -1
+    col[~is_found] = -1
+    s = np.where(is_found, np.clip(s, 0.0, 1.0), 0.0)
+    t = np.where(is_found, np.clip(t, 0.0, 1.0), 0.0)
+
+    return (row, t), (col, s)
+
+
+class CellBuckets:
+    """A bucketed index of the bounding boxes of polygonal cells.
+
+    Parameters
+    ----------
+    xv, yv : ndarray of float, shape (n_cells, max_vertices)
+        Padded vertex coordinates of the cells (see
+        :func:`~pymt.grids.geometry.cell_vertices`).
+    bucket_size : float, optional
+        Width of the square buckets. The default is the median width or
+        height of the cells.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from pymt.grids.geometry import cell_vertices
+    >>> from pymt.grids.locate import CellBuckets
+
+    Two triangles that make up a square.
+
+    >>> x = np.array([0.0, 1.0, 0.0, 1.0])
+    >>> y = np.array([0.0, 0.0, 1.0, 1.0])
+    >>> buckets = CellBuckets(*cell_vertices(x, y, [0, 1, 3, 0, 3, 2], [3, 6]))
+    >>> buckets.locate([0.75, 0.25, 0.5, 2.0], [0.25, 0.75, 0.5, 0.5])
+    array([ 0,  1,  0, -1])
+    """
+
+    def __init__(self, xv, yv, bucket_size=None):
+        self._xv = np.asarray(xv, dtype=float)
+        self._yv = np.asarray(yv, dtype=float)
+
+        boxes = bounding_boxes(self._xv, self._yv)
+        if len(boxes) == 0:
+            boxes = np.zeros((0, 4))
+            (self._origin, extent) = (np.zeros(2), np.zeros(2))
+        else:
+            self._origin = boxes[:, :2].min(axis=0)
+            extent = boxes[:, 2:].max(axis=0) - self._origin
+
+        if bucket_size is None:
+            sizes = boxes[:, 2:] - boxes[:, :2]
+            bucket_size = np.median(sizes) if sizes.size else 1.0
+        bucket_size = max(
+            bucket_size, np.sqrt(extent[0] * extent[1] / (4 * max(len(boxes), 1)))
+        )
+        if not bucket_size > 0.0:
+            bucket_size = max(extent.max(), 1.0)
+        self._size = bucket_size
+        self._shape = tuple(np.floor(extent[::-1] / bucket_size).astype(int) + 1)
+
+        (cells, buckets) = _expand_buckets(boxes, self._origin, self._size, self._shape)
+        order = np.argsort(buckets, kind="stable")
+        self._cells = cells[order]
+        self._start = np.zeros(self._shape[0] * self._shape[1] + 1, dtype=int)
+        np.cumsum(
+            np.bincount(buckets, minlength=len(self._start) - 1), out=self._start[1:]
+        )
+
+    @property
+    def shape(self):
+        """Number of rows and columns of buckets."""
+        return self._shape
+
+    def candidates(self, x, y):
+        """Cells whose bounding boxes share a bucket with points.
+
+        Parameters
+        ----------
+        x, y : ndarray of float
+            Coordinates of the points.
+
+        Returns
+        -------
+        (points, cells) : tuple of ndarray of int
+            Pairs of point and cell ids, sorted by point and then by cell.
+        """
+        with np.errstate(invalid="ignore"):
+            col = np.floor((x - self._origin[0]) / self._size)
+            row = np.floor((y - self._origin[1]) / self._size)
+        is_inside = (
+            (col >= 0) & (col < self._shape[1]) & (row >= 0) & (row < self._shape[0])
+        )
+
+        points = np.flatnonzero(is_inside)
+        bucket = (row[points] * self._shape[1] + col[points]).astype(int)
+
+        start = self._start[bucket]
+        count = self._start[bucket + 1] - start
+
+        position = np.arange(count.sum()) - np.repeat(np.cumsum(count) - count, count)
+        return (
+            np.repeat(points, count),
+            self._cells[np.repeat(start, count) + position],
+        )
+
+    def locate(self, x, y, chunk_size=2**20):
+        """Locate points within cells.
+
+        Parameters
+        ----------
+        x, y : array_like
+            Coordinates of the points.
+        chunk_size : int, optional
+            Number of points to locate at a time.
+
+        Returns
+        -------
+        ndarray of int
+            Id of the cell that contains each point, or -1 for points
+            outside of every cell. Points on an edge shared by several
+            cells are given the lowest of their ids.
+        """
+        x = np.asarray(x, dtype=float).reshape((-1,))
+        y = np.asarray(y, dtype=float).reshape((-1,))
+
+        cell = np.full(len(x), -1, dtype=int)
+        for start in range(0, len(x), chunk_size):
+            chunk = slice(start, start + chunk_size)
+            (points, cells) = self.candidates(x[chunk], y[chunk])
+
+            is_inside = contains_points(
+                self._xv[cells], self._yv[cells], x[chunk][points], y[chunk][points]
+            )
+            (points, cells) = (points[is_inside], cells[is_inside])
+
+            is_first = np.ones(len(points), dtype=bool)
+            is_first[1:] = points[1:] != points[:-1]
+            cell[chunk][points[is_first]] = cells[is_first]
+
+        return cell
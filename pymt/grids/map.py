@@ -26,9 +26,9 @@ array([0., 0., 0., 2., 2., 2.])
 Node 1 is shared by both cell 0, and 1; node 5 only is part of cell 1.
 
 >>> g.get_shared_cells (1)
-[0, 1]
+array([0, 1])
 >>> g.get_shared_cells (5)
-[1]
+array([1])
 
 Point (.5, 1.) is contained only within cell 0.
 
@@ -63,32 +63,28 @@ class UnstructuredMap(Unstructured):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        self._point = {}
-        last_offset = 0
-        for cell_id, offset in enumerate(self._offset):
-            cell = self._connectivity[last_offset:offset]
-            last_offset = offset
-
-            for point_id in cell:
-                try:
-                    self._point[point_id].append(cell_id)
-                except KeyError:
-                    self._point[point_id] = [cell_id]
-
-        (point_x, point_y) = (self.get_x(), self.get_y())
-        self._polys = []
-        last_offset = 0
-        for cell_id, offset in enumerate(self._offset):
-            cell = self._connectivity[last_offset:offset]
-            last_offset = offset
-
-            (x, y) = (point_x.take(cell), point_y.take(cell))
-            if len(x) > 2:
-                self._polys.append(Polygon(zip(x, y)))
-            elif len(x) == 2:
-                self._polys.append(LineString(zip(x, y)))
-            else:
-                self._polys.append(Point(zip(x, y)))
+        self._polys = {}
+
+    def _get_cell_geometry(self, cell_id):
+        """The cell as a shapely geometry, which is built on first use."""
+        try:
+            return self._polys[cell_id]
+        except KeyError:
+            pass
+
+        start = self._offset[cell_id - 1] if cell_id > 0 else 0
+        cell = self._connectivity[start : self._offset[cell_id]]
+
+        (x, y) = (self.get_x().take(cell), self.get_y().take(cell))
+        if len(x) > 2:
+            poly = Polygon(zip(x, y))
+        elif len(x) == 2:
+            poly = LineString(zip(x, y))
+        else:
+            poly = Point(x[0], y[0])
+        self._polys[cell_id] = poly
+
+        return poly
 
     def get_shared_cells(self, point_id):
         """
@@ -102,7 +98,9 @@ class UnstructuredMap(Unstructured):
         ndarray of int
             Indices to cells that share a given node.
         """
-        return self._point[point_id]
+        (cells, offset) = self.get_cells_at_node()
+        (start, stop) = offset[point_id : point_id + 2]
+        return cells[start:stop]
 
     def is_in_cell(self, x, y, cell_id):
         """Check if a point is in a cell.
@@ -122,7 +120,8 @@ class UnstructuredMap(Unstructured):
             True if the point (x, y) is contained in the cell.
         """
         pt = Point((x, y))
-        return self._polys[cell_id].contains(pt) or self._polys[cell_id].touches(pt)
+        poly = self._get_cell_geometry(cell_id)
+        return poly.contains(pt) or poly.touches(pt)
 
 
 class UnstructuredPointsMap(UnstructuredPoints):
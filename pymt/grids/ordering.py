@@ -0,0 +1,259 @@
+"""Order the nodes and cells of unstructured grids along space-filling curves.
+
+Meshes are often generated with their nodes in an arbitrary order, so
+that nodes that are close to one another in space are far apart in
+memory. Sorting nodes and cells along a Hilbert (or Morton) curve puts
+neighbors close together, which makes spatial queries, sparse products
+and writes of large arrays more cache friendly.
+
+Examples
+--------
+>>> import numpy as np
+>>> from pymt.grids.ordering import curve_order
+
+Nodes of a 2x2 square, in an arbitrary order.
+
+>>> x = np.array([1.0, 0.0, 1.0, 0.0])
+>>> y = np.array([1.0, 0.0, 0.0, 1.0])
+>>> curve_order(x, y, curve="hilbert")
+array([1, 3, 0, 2])
+>>> curve_order(x, y, curve="morton")
+array([1, 2, 3, 0])
+"""
+
+import numpy as np
+
+from .assertions import is_structured
+from .unstructured import Unstructured
+
+CURVES = ("hilbert", "morton")
+
+
+def _quantize(coords, bits):
+    """Scale coordinates to integers between 0 and 2**bits - 1."""
+    coords = np.nan_to_num(np.asarray(coords, dtype=float))
+    if coords.size == 0:
+        return np.zeros(0, dtype=np.uint64)
+
+    (lower, upper) = (coords.min(), coords.max())
+    scale = (2**bits - 1) / (upper - lower) if upper > lower else 0.0
+    return ((coords - lower) * scale).astype(np.uint64)
+
+
+def _spread_bits(values, bits):
+    """Put a zero bit between each of the bits of integers."""
+    spread = np.zeros_like(values)
+    for bit in range(bits):
+        spread |= ((values >> np.uint64(bit)) & np.uint64(1)) << np.uint64(2 * bit)
+    return spread
+
+
+def morton_keys(x, y, bits=16):
+    """Position of points along a Morton (Z-order) curve.
+
+    Parameters
+    ----------
+    x, y : array_like
+        Coordinates of the points.
+    bits : int, optional
+        Number of bits of each coordinate that are used (at most 32).
+
+    Returns
+    -------
+    ndarray of uint64
+        Key of each point. Points sorted by key follow the curve.
+
+    Examples
+    --------
+    >>> from pymt.grids.ordering import morton_keys
+    >>> morton_keys([0.0, 1.0, 0.0, 1.0], [0.0, 0.0, 1.0, 1.0], bits=1)
+    array([0, 1, 2, 3], dtype=uint64)
+    """
+    (ix, iy) = (_quantize(x, bits), _quantize(y, bits))
+    return _spread_bits(ix, bits) | (_spread_bits(iy, bits) << np.uint64(1))
+
+
+def hilbert_keys(x, y, bits=16):
+    """Position of points along a Hilbert curve.
+
+    Parameters
+    ----------
+    x, y : array_like
+        Coordinates of the points.
+    bits : int, optional
+        Number of bits of each coordinate that are used (at most 31).
+
+    Returns
+    -------
+    ndarray of uint64
+        Key of each point. Points sorted by key follow the curve.
+
+    Examples
+    --------
+    >>> from pymt.grids.ordering import hilbert_keys
+    >>> hilbert_keys([0.0, 1.0, 0.0, 1.0], [0.0, 0.0, 1.0, 1.0], bits=1)
+    array([0, 3, 1, 2], dtype=uint64)
+    """
+    ix = _quantize(x, bits).astype(np.int64)
+    iy = _quantize(y, bits).astype(np.int64)
+    n = 2**bits
+
+    key = np.zeros(len(ix), dtype=np.uint64)
+    s = n // 2
+    while s > 0:
+        rx = (ix & s) > 0
+        ry = (iy & s) > 0
+        key += np.uint64(s) * np.uint64(s) * ((3 * rx) ^ ry).astype(np.uint64)
+
+        is_flipped = ~ry & rx
+        ix = np.where(is_flipped, n - 1 - ix, ix)
+        iy = np.where(is_flipped, n - 1 - iy, iy)
+        (ix, iy) = (np.where(ry, ix, iy), np.where(ry, iy, ix))
+
+        s //= 2
+
+    return key
+
+
+def curve_order(x, y=None, curve="hilbert", bits=16):
+    """Order of points along a space-filling curve.
+
+    Parameters
+    ----------
+    x, y : array_like
+        Coordinates of the points. If *y* is not given, points are
+        sorted by *x*.
+    curve : {'hilbert', 'morton'}, optional
+        The space-filling curve.
+    bits : int, optional
+        Number of bits of each coordinate that are used.
+
+    Returns
+    -------
+    ndarray of int
+        Indices that sort the points along the curve.
+    """
+    if curve not in CURVES:
+        raise ValueError(f"{curve}: curve not understood (not one of {CURVES})")
+
+    if y is None:
+        return np.argsort(np.ravel(x), kind="stable")
+
+    if curve == "hilbert":
+        keys = hilbert_keys(np.ravel(x), np.ravel(y), bits=bits)
+    else:
+        keys = morton_keys(np.ravel(x), np.ravel(y), bits=bits)
+
+    return np.argsort(keys, kind="stable")
+
+
+def _cell_centers(coords, connectivity, offset):
+    """Mean of the node coordinates of each cell."""
+    nodes_per_cell = np.diff(offset, prepend=0)
+    start = offset - nodes_per_cell
+    return tuple(
+        np.add.reduceat(c[connectivity], start) / nodes_per_cell for c in coords
+    )
+
+
+def _gather_cells(connectivity, offset, cell_order):
+    """Connectivity and offsets of cells, taken in a new order."""
+    nodes_per_cell = np.diff(offset, prepend=0)
+    start = offset - nodes_per_cell
+
+    count = nodes_per_cell[cell_order]
+    new_offset = np.cumsum(count)
+    position = np.arange(new_offset[-1] if len(count) else 0) - np.repeat(
+        new_offset - count, count
+    )
+
+    return connectivity[np.repeat(start[cell_order], count) + position], new_offset
+
+
+def reorder_grid(grid, curve="hilbert", bits=16):
+    """Copy an unstructured grid with its nodes and cells along a curve.
+
+    Nodes are sorted along the curve by their coordinates, and cells by
+    the mean of the coordinates of their nodes. Structured grids, whose
+    nodes already follow the grid's rows, are not reordered. Fields are
+    not copied.
+
+    Parameters
+    ----------
+    grid : Unstructured or UnstructuredPoints
+        The grid to reorder.
+    curve : {'hilbert', 'morton'}, optional
+        The space-filling curve.
+    bits : int, optional
+        Number of bits of each coordinate that are used.
+
+    Returns
+    -------
+    (grid, node_order, cell_order) : tuple
+        The reordered grid, and the old ids of its nodes and of its
+        cells. Node *i* of the new grid is node ``node_order[i]`` of
+        *grid*. Orders are ``None`` if there was nothing to reorder.
+
+    Examples
+    --------
+    >>> from pymt.grids import Unstructured
+    >>> from pymt.grids.ordering import reorder_grid
+
+    Two triangles with their nodes in an arbitrary order.
+
+    >>> g = Unstructured([1., 0., 0., 1.], [1., 1., 0., 0.],
+    ...                  connectivity=[2, 0, 1, 2, 3, 0], offset=[3, 6])
+    >>> (new, node_order, cell_order) = reorder_grid(g)
+    >>> node_order, cell_order
+    (array([2, 3, 0, 1]), array([1, 0]))
+
+    Nodes now follow the curve from the lower-left corner, up, across,
+    and down.
+
+    >>> new.get_x(), new.get_y()
+    (array([0., 0., 1., 1.]), array([0., 1., 1., 0.]))
+    >>> new.get_connectivity()
+    array([0, 1, 2, 0, 2, 3])
+    """
+    if is_structured(grid, strict=False):
+        return grid, None, None
+
+    n_dims = grid.get_dim_count()
+    coords = [np.asarray(grid.get_coordinate(dim)) for dim in range(n_dims)]
+    xy = (grid.get_x(), grid.get_y()) if n_dims > 1 else (grid.get_x(),)
+
+    node_order = curve_order(*xy, curve=curve, bits=bits)
+
+    kwds = {
+        "units": [grid.get_coordinate_units(dim) for dim in range(n_dims)],
+        "coordinate_names": [grid.get_coordinate_name(dim) for dim in range(n_dims)],
+    }
+
+    if not isinstance(grid, Unstructured):
+        return (
+            type(grid)(*(c[node_order] for c in coords), **kwds),
+            node_order,
+            None,
+        )
+
+    connectivity = np.asarray(grid.get_connectivity())
+    offset = np.asarray(grid.get_offset())
+
+    cell_order = curve_order(
+        *_cell_centers(xy, connectivity, offset), curve=curve, bits=bits
+    )
+    (connectivity, offset) = _gather_cells(connectivity, offset, cell_order)
+
+    new_id = np.empty_like(node_order)
+    new_id[node_order] = np.arange(len(node_order))
+
+    return (
+        type(grid)(
+            *(c[node_order] for c in coords),
+            connectivity=new_id[connectivity],
+            offset=offset,
+            **kwds,
+        ),
+        node_order,
+        cell_order,
+    )
@@ -0,0 +1,292 @@
+"""Coarsened versions of uniform and rectilinear grids.
+
+A pyramid holds the axes of a grid along with versions of them that are
+coarsened by factors of 2, 4, 8, and so on. Level *k* of a pyramid has
+one node for each block of ``2**k`` nodes (along each dimension) of the
+original grid. Values are restricted to a coarse level by taking the
+mean of each block, and prolonged back onto the original grid by
+copying each coarse value onto the nodes of its block. Blocks at the
+upper edges of a grid whose size is not a multiple of the block size
+are smaller.
+
+Examples
+--------
+>>> import numpy as np
+>>> from pymt.grids.pyramid import GridPyramid
+
+>>> pyramid = GridPyramid((4, 6), spacing=(1.0, 2.0))
+>>> pyramid.shape(1)
+(2, 3)
+>>> pyramid.axes(1)
+(array([0.5, 2.5]), array([1., 5., 9.]))
+
+>>> values = np.arange(24.0)
+>>> pyramid.restrict(values, 1)
+array([ 3.5,  5.5,  7.5, 15.5, 17.5, 19.5])
+>>> pyramid.prolong([[0.0, 1.0, 2.0], [3.0, 4.0, 5.0]], 1)
+array([[0., 0., 1., 1., 2., 2.],
+       [0., 0., 1., 1., 2., 2.],
+       [3., 3., 4., 4., 5., 5.],
+       [3., 3., 4., 4., 5., 5.]])
+
+At level 2, the first dimension collapses to a single node and the
+second has a block of 4 nodes and a block of 2.
+
+>>> pyramid.shape(2)
+(1, 2)
+>>> pyramid.restrict(values, 2)
+array([10.5, 13.5])
+"""
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+
+def _coarsen_axis(n_nodes, factor):
+    """Start and size of the blocks of nodes along a dimension."""
+    start = np.arange(0, n_nodes, factor)
+    count = np.diff(start, append=n_nodes)
+    return start, count
+
+
+def block_mean(values, factor, blocks=None):
+    """Mean of the values of blocks of an array.
+
+    Parameters
+    ----------
+    values : ndarray
+        Values to average.
+    factor : int
+        Number of elements of a block along each dimension.
+    blocks : sequence of (ndarray, ndarray), optional
+        Start and size of the blocks along each dimension, if already
+        known.
+
+    Returns
+    -------
+    ndarray
+        The mean of each block.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from pymt.grids.pyramid import block_mean
+    >>> block_mean(np.arange(16.0).reshape((4, 4)), 2)
+    array([[ 2.5,  4.5],
+           [10.5, 12.5]])
+    >>> block_mean(np.arange(5.0), 2)
+    array([0.5, 2.5, 4. ])
+    """
+    values = np.asarray(values)
+
+    if all(n % factor == 0 for n in values.shape):
+        split = []
+        for n in values.shape:
+            split += [n // factor, factor]
+        return values.reshape(split).mean(axis=tuple(range(1, 2 * values.ndim, 2)))
+
+    if blocks is None:
+        blocks = [_coarsen_axis(n, factor) for n in values.shape]
+
+    sums = values
+    count = np.ones((1,) * values.ndim, dtype=int)
+    for axis, (start, size) in enumerate(blocks):
+        sums = np.add.reduceat(sums, start, axis=axis)
+        count = count * size.reshape(
+            [-1 if dim == axis else 1 for dim in range(values.ndim)]
+        )
+
+    return sums / count
+
+
+class GridPyramid:
+    """A grid and its coarsened versions.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Number of nodes along each dimension of the grid.
+    spacing : tuple of float, optional
+        Spacing between nodes of a uniform rectilinear grid.
+    origin : tuple of float, optional
+        Coordinates of the lower-left node of a uniform rectilinear grid.
+    axes : tuple of ndarray, optional
+        Coordinates of the nodes along each dimension of a rectilinear
+        grid. If given, *spacing* and *origin* are ignored.
+    levels : int, optional
+        Number of coarse levels.
+    """
+
+    def __init__(self, shape, spacing=None, origin=None, axes=None, levels=3):
+        shape = tuple(int(n) for n in shape)
+
+        if axes is None:
+            spacing = np.ones(len(shape)) if spacing is None else spacing
+            origin = np.zeros(len(shape)) if origin is None else origin
+            axes = [
+                np.arange(n) * float(dx) + float(x0)
+                for n, dx, x0 in zip(shape, spacing, origin)
+            ]
+        axes = tuple(np.asarray(axis, dtype=float).reshape((-1,)) for axis in axes)
+
+        if len(axes) != len(shape) or any(
+            len(axis) != n for axis, n in zip(axes, shape)
+        ):
+            raise ValueError("size mismatch between grid shape and axes")
+        if levels < 0:
+            raise ValueError(f"{levels}: number of levels must not be negative")
+
+        self._levels = int(levels)
+        self._blocks = [None]
+        self._axes = [axes]
+        for level in range(1, self._levels + 1):
+            blocks = tuple(_coarsen_axis(n, 2**level) for n in shape)
+            self._blocks.append(blocks)
+            self._axes.append(
+                tuple(
+                    np.add.reduceat(axis, start) / count
+                    for axis, (start, count) in zip(axes, blocks)
+                )
+            )
+        self._operators = {}
+
+    @property
+    def levels(self):
+        """Number of coarse levels."""
+        return self._levels
+
+    def _check_level(self, level):
+        if not 0 <= level <= self._levels:
+            raise ValueError(f"{level}: level must be between 0 and {self._levels}")
+        return int(level)
+
+    def factor(self, level):
+        """Number of nodes of the grid, along a dimension, per coarse node."""
+        return 2 ** self._check_level(level)
+
+    def shape(self, level=0):
+        """Number of nodes along each dimension of a level."""
+        return tuple(len(axis) for axis in self.axes(level))
+
+    def size(self, level=0):
+        """Number of nodes of a level."""
+        return int(np.prod(self.shape(level)))
+
+    def axes(self, level=0):
+        """Coordinates of the nodes along each dimension of a level.
+
+        The coordinate of a coarse node is the mean of the coordinates of
+        the nodes of its block.
+        """
+        return self._axes[self._check_level(level)]
+
+    def restrict(self, values, level):
+        """Values of the grid's nodes averaged onto a coarse level.
+
+        Parameters
+        ----------
+        values : array_like
+            Values on the nodes of the grid.
+        level : int
+            The coarse level.
+
+        Returns
+        -------
+        ndarray
+            Values on the nodes of the coarse level. The result is flat
+            if *values* is flat.
+        """
+        level = self._check_level(level)
+
+        values = np.asarray(values)
+        if values.size != self.size():
+            raise ValueError("size mismatch between values and grid")
+
+        if level == 0:
+            return values
+
+        coarse = block_mean(
+            values.reshape(self.shape()), 2**level, blocks=self._blocks[level]
+        )
+
+        return coarse.reshape((-1,)) if values.ndim == 1 else coarse
+
+    def prolong(self, values, level):
+        """Values of a coarse level copied onto the grid's nodes.
+
+        Parameters
+        ----------
+        values : array_like
+            Values on the nodes of the coarse level.
+        level : int
+            The coarse level.
+
+        Returns
+        -------
+        ndarray
+            Values on the nodes of the grid. The result is flat if
+            *values* is flat.
+        """
+        level = self._check_level(level)
+
+        values = np.asarray(values)
+        if values.size != self.size(level):
+            raise ValueError("size mismatch between values and level")
+
+        if level == 0:
+            return values
+
+        fine = values.reshape(self.shape(level))
+        for axis, (_, count) in enumerate(self._blocks[level]):
+            fine = np.repeat(fine, count, axis=axis)
+
+        return fine.reshape((-1,)) if values.ndim == 1 else fine
+
+    def _coarse_ids(self, level):
+        """Id of the coarse node that each of the grid's nodes belongs to."""
+        factor = 2**level
+        ids = np.indices(self.shape()).reshape((len(self.shape()), -1)) // factor
+        return np.ravel_multi_index(tuple(ids), self.shape(level))
+
+    def restriction_matrix(self, level):
+        """Sparse matrix that restricts the grid's values onto a level.
+
+        The matrix has a row for each coarse node and a column for each
+        of the grid's nodes.
+        """
+        level = self._check_level(level)
+        try:
+            return self._operators["restrict", level]
+        except KeyError:
+            pass
+
+        coarse_id = self._coarse_ids(level)
+        count = np.bincount(coarse_id, minlength=self.size(level))
+        matrix = csr_matrix(
+            (1.0 / count[coarse_id], (coarse_id, np.arange(self.size()))),
+            shape=(self.size(level), self.size()),
+        )
+        self._operators["restrict", level] = matrix
+
+        return matrix
+
+    def prolongation_matrix(self, level):
+        """Sparse matrix that prolongs the values of a level onto the grid.
+
+        The matrix has a row for each of the grid's nodes and a column
+        for each coarse node.
+        """
+        level = self._check_level(level)
+        try:
+            return self._operators["prolong", level]
+        except KeyError:
+            pass
+
+        coarse_id = self._coarse_ids(level)
+        matrix = csr_matrix(
+            (np.ones(self.size()), (np.arange(self.size()), coarse_id)),
+            shape=(self.size(), self.size(level)),
+        )
+        self._operators["prolong", level] = matrix
+
+        return matrix
@@ -106,6 +106,7 @@ array([4, 3, 2])
 
 import numpy as np
 
+from pymt.grids.locate import locate_in_rectilinear
 from pymt.grids.meshgrid import meshgrid
 
 from .structured import Structured, StructuredPoints
@@ -120,30 +121,32 @@ class RectilinearPoints(StructuredPoints):
         if n_dim < 1 or n_dim > 3:
             raise ValueError("number of dimensions must be between 1 and 3")
 
+        coord_dtype = kwds.get("coord_dtype", np.float64)
+
         coords = []
         for arg in args:
-            coords.append(np.array(arg, dtype=np.float64))
+            coords.append(np.array(arg, dtype=coord_dtype))
 
         if n_dim > 1:
-            XI = meshgrid(*coords, indexing="ij")
+            XI = list(meshgrid(*coords, indexing="ij", copy=False))
         else:
-            XI = [np.array(args[0], dtype=np.float64)]
+            XI = [np.array(args[0], dtype=coord_dtype)]
 
         shape = XI[0].shape
 
-        self._x_coordinates = np.array(coords[-1], dtype=np.float64)
+        self._x_coordinates = np.array(coords[-1], dtype=coord_dtype)
         try:
-            self._y_coordinates = np.array(coords[-2], dtype=np.float64)
+            self._y_coordinates = np.array(coords[-2], dtype=coord_dtype)
         except IndexError:
             pass
 
         try:
-            self._z_coordinates = np.array(coords[-3], dtype=np.float64)
+            self._z_coordinates = np.array(coords[-3], dtype=coord_dtype)
         except IndexError:
             pass
 
         args = XI + [shape]
-        super().__init__(*args, **kwds)
+        super().__init__(*args, implicit_coordinates=True, **kwds)
 
     def get_x_coordinates(self):
         """
@@ -235,6 +238,40 @@ class Rectilinear(RectilinearPoints, Structured):
         kwds["set_connectivity"] = True
         super().__init__(*args, **kwds)
 
+    def locate_points(self, x, y):
+        """Ids of the cells that contain points.
+
+        Points are located along each axis with a binary search of the
+        axis coordinates or, if the grid is uniform, directly from its
+        origin and spacing. No other index is needed.
+
+        Parameters
+        ----------
+        x, y : array_like
+            Coordinates of the points.
+
+        Returns
+        -------
+        ndarray of int
+            Id of the cell that contains each point, or -1 for points
+            outside of the grid.
+
+        Examples
+        --------
+        >>> g = Rectilinear([0., 1., 4.], [0., 1., 2., 3.])
+        >>> g.locate_points([0.5, 2.5, 2.5, 4.0], [0.5, 0.5, 3.0, 0.5])
+        array([ 0,  2,  5, -1])
+        """
+        if self.get_dim_count() != 2:
+            raise ValueError("points can only be located on 2D grids")
+
+        ((row, _), (col, _)) = locate_in_rectilinear(self, x, y)
+
+        cell = row * (self.get_shape()[1] - 1) + col
+        cell[(row < 0) | (col < 0)] = -1
+
+        return cell.astype(self._index_dtype, copy=False)
+
 
 if __name__ == "__main__":
     import doctest
@@ -0,0 +1,238 @@
+"""A process-wide store of grid arrays, keyed by their content.
+
+Components of an ensemble, or several components on the same mesh, each
+describe their grids with their own (identical) arrays of coordinates
+and connectivity. Arrays that are interned in the registry are stored
+once, as read-only arrays, and every consumer of the same geometry gets
+the same array.
+
+Arrays are kept only as long as something refers to them. They can
+optionally be backed by shared memory, so that they can be attached to
+by worker processes, or by memory-mapped files.
+
+Interning is opt-in. Unless a process-wide registry is set, either with
+:func:`set_registry` or by using a registry as a context manager,
+:func:`intern_array` returns arrays unchanged, and grids keep their own,
+writable, arrays. Arrays of grids that are created while a registry is
+set are read-only and so can no longer be changed in place.
+
+Examples
+--------
+>>> import numpy as np
+>>> from pymt.grids.registry import GridRegistry
+
+>>> registry = GridRegistry()
+>>> x = registry.intern(np.array([0.0, 1.0, 2.0]))
+>>> x.flags.writeable
+False
+>>> registry.intern([0.0, 1.0, 2.0]) is x
+True
+>>> len(registry)
+1
+
+Arrays of a different type are distinct.
+
+>>> registry.intern(np.array([0, 1, 2])) is x
+False
+
+Intern the arrays of grids created within a block.
+
+>>> from pymt.grids import Unstructured
+>>> with GridRegistry():
+...     grid = Unstructured([0.0, 1.0, 0.0], [0.0, 0.0, 1.0], [0, 1, 2], [3])
+>>> grid.get_connectivity().flags.writeable
+False
+"""
+
+import os
+import tempfile
+import threading
+import weakref
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .utils import fingerprint_arrays
+
+BACKINGS = ("memory", "shared_memory", "memmap")
+
+
+def _release_block(block):
+    block.close()
+    block.unlink()
+
+
+class GridRegistry:
+    """A store of read-only arrays keyed by a digest of their content.
+
+    Within a ``with`` block, the registry is the process-wide registry.
+
+    Parameters
+    ----------
+    backing : {'memory', 'shared_memory', 'memmap'}, optional
+        Where to keep the arrays.
+    directory : str, optional
+        Folder for the files of memory-mapped arrays. The default is a
+        new temporary folder.
+    """
+
+    def __init__(self, backing="memory", directory=None):
+        if backing not in BACKINGS:
+            raise ValueError(
+                f"{backing}: backing not understood (not one of {BACKINGS})"
+            )
+
+        self._backing = backing
+        self._directory = directory
+        self._arrays = weakref.WeakValueDictionary()
+        self._locations = {}
+        self._lock = threading.Lock()
+        self._previous = []
+
+    def __enter__(self):
+        self._previous.append(set_registry(self))
+        return self
+
+    def __exit__(self, exception_type, value, traceback):
+        set_registry(self._previous.pop())
+
+    @property
+    def backing(self):
+        """Where arrays are kept."""
+        return self._backing
+
+    def __len__(self):
+        return len(self._arrays)
+
+    def __contains__(self, key):
+        return key in self._arrays
+
+    def key(self, array):
+        """The key of an array, a digest of its type, shape and values."""
+        return fingerprint_arrays(array)
+
+    def location(self, key):
+        """Name of the shared memory block, or file, that holds an array.
+
+        Returns
+        -------
+        str or None
+            The location, or ``None`` for arrays kept in process memory.
+        """
+        return self._locations.get(key)
+
+    def intern(self, array, copy=True):
+        """The registry's copy of an array.
+
+        Parameters
+        ----------
+        array : array_like
+            The array to intern.
+        copy : bool, optional
+            If ``False``, an array that owns its data, and is kept in
+            process memory, is stored without a copy and made read-only.
+            The caller must not keep a writable reference to it.
+
+        Returns
+        -------
+        ndarray
+            A read-only array, shared with every other consumer of an
+            array with the same content.
+        """
+        array = np.asarray(array)
+        key = self.key(array)
+
+        with self._lock:
+            try:
+                return self._arrays[key]
+            except KeyError:
+                stored = self._store(key, array, copy=copy)
+                stored.flags.writeable = False
+                self._arrays[key] = stored
+                return stored
+
+    def _store(self, key, array, copy=True):
+        if self._backing == "memory":
+            if not copy and array.flags.owndata:
+                return array
+            return np.array(array, copy=True)
+
+        if self._backing == "shared_memory":
+            block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+            stored = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+            self._locations[key] = block.name
+        else:
+            if self._directory is None:
+                self._directory = tempfile.mkdtemp(prefix="pymt-grids-")
+            path = os.path.join(self._directory, key + ".npy")
+            if array.size == 0:
+                return np.array(array, copy=True)
+            stored = np.lib.format.open_memmap(
+                path, mode="w+", dtype=array.dtype, shape=array.shape
+            )
+            self._locations[key] = path
+            block = None
+
+        stored[...] = array
+        weakref.finalize(stored, self._forget, key, block)
+
+        return stored
+
+    def _forget(self, key, block):
+        location = self._locations.pop(key, None)
+        if block is not None:
+            _release_block(block)
+        elif location is not None and os.path.isfile(location):
+            os.remove(location)
+
+
+_REGISTRY = None
+
+
+def get_registry():
+    """The process-wide grid registry, or ``None`` if there isn't one."""
+    return _REGISTRY
+
+
+def set_registry(registry):
+    """Replace the process-wide grid registry.
+
+    Parameters
+    ----------
+    registry : GridRegistry or None
+        The new registry, or ``None`` to stop interning arrays.
+
+    Returns
+    -------
+    GridRegistry or None
+        The previous registry.
+    """
+    global _REGISTRY
+
+    (previous, _REGISTRY) = (_REGISTRY, registry)
+
+    return previous
+
+
+def intern_array(array, copy=True):
+    """Intern an array in the process-wide grid registry.
+
+    See :meth:`GridRegistry.intern`. If there is no process-wide registry,
+    the array is returned unchanged.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from pymt.grids.registry import GridRegistry, intern_array
+    >>> a = np.arange(4)
+    >>> intern_array(a) is a
+    True
+
+    >>> with GridRegistry():
+    ...     a = intern_array(np.arange(4))
+    ...     intern_array(np.arange(4)) is a
+    True
+    """
+    if _REGISTRY is None:
+        return array
+    return _REGISTRY.intern(array, copy=copy)
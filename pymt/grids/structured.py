@@ -111,7 +111,7 @@ import warnings
 
 import numpy as np
 
-from pymt.grids.connectivity import get_connectivity
+from pymt.grids.connectivity import StructuredStencil
 from pymt.grids.utils import get_default_coordinate_names, get_default_coordinate_units
 
 from .unstructured import Unstructured, UnstructuredPoints
@@ -200,12 +200,41 @@ class Structured(StructuredPoints, Unstructured):
         shape = args[-1]
 
         if kwds["set_connectivity"]:
-            (c, o) = get_connectivity(shape, ordering=ordering, with_offsets=True)
-            self._set_connectivity(c, o)
+            self._set_stencil(StructuredStencil(shape, ordering=ordering))
             kwds["set_connectivity"] = False
 
         super().__init__(*args, **kwds)
 
+    def get_cell_nodes(self, cells):
+        """Node ids of cells.
+
+        The connectivity of structured grids is implicit, so nodes are
+        found without creating the connectivity of the entire grid.
+
+        Parameters
+        ----------
+        cells : int or array_like of int
+            Cell ids.
+
+        Returns
+        -------
+        ndarray of int
+            Node ids with one row for each cell.
+
+        Examples
+        --------
+        >>> from pymt.grids import Structured
+        >>> g = Structured([0, 0, 0, 1, 1, 1], [0, 1, 2, 0, 1, 2], (2, 3))
+        >>> g.get_cell_nodes([1, 0])
+        array([[1, 2, 5, 4],
+               [0, 1, 4, 3]])
+        """
+        if self._stencil is not None:
+            return self._stencil[cells]
+        else:
+            connectivity = self.get_connectivity().reshape((self.get_cell_count(), -1))
+            return connectivity[cells]
+
 
 if __name__ == "__main__":
     import doctest
@@ -1,9 +1,14 @@
 import numpy as np
 
+from .dtypes import as_index_array, check_index_range, get_index_dtype
+from .geometry import bounding_boxes, cell_vertices, polygon_areas, polygon_centroids
 from .igrid import IGrid
+from .locate import CellBuckets
+from .registry import intern_array
 from .utils import (
     args_as_numpy_arrays,
     coordinates_to_numpy_matrix,
+    get_cells_at_node,
     get_default_coordinate_names,
     get_default_coordinate_units,
 )
@@ -12,11 +17,16 @@ MAXSIZE = np.iinfo(int).max
 
 
 class UnstructuredPoints(IGrid):
+    _stencil = None
+    _connectivity_array = None
+    _offset_array = None
+
     def __init__(self, *args, **kwds):
         """
         UnstructuredPoints(x0 [, x1 [, x2]])
         """
         set_connectivity = kwds.pop("set_connectivity", False)
+        self._coord_dtype = np.dtype(kwds.pop("coord_dtype", float))
         units = kwds.pop("units", get_default_coordinate_units(len(args)))
         coordinate_names = kwds.pop(
             "coordinate_names", get_default_coordinate_names(len(args))
@@ -26,22 +36,101 @@ class UnstructuredPoints(IGrid):
         if len(args) < 1 or len(args) > 3:
             raise ValueError("number of arguments must be between 1 and 3")
 
-        args = args_as_numpy_arrays(*args)
+        if kwds.pop("implicit_coordinates", False):
+            self._implicit_coords = tuple(np.asarray(arg) for arg in args)
+            self._node_coords = {}
+            self._coord_matrix = None
+        else:
+            args = args_as_numpy_arrays(*args)
+            self._coords = coordinates_to_numpy_matrix(*args, dtype=self._coord_dtype)
 
         self._n_dims = len(args)
         self._point_count = args[0].size
-
-        self._coords = coordinates_to_numpy_matrix(*args)
+        check_index_range(self._point_count - 1)
         self._units = np.array(units)
         self._coordinate_name = np.array(coordinate_names)
 
         if set_connectivity:
-            self._connectivity = np.arange(self._point_count, dtype=int)
+            check_index_range(self._point_count)
+            self._index_dtype = get_index_dtype()
+            self._connectivity = np.arange(self._point_count, dtype=self._index_dtype)
             self._offset = self._connectivity + 1
             self._cell_count = 0
 
         super().__init__()
 
+    @property
+    def _connectivity(self):
+        """Node ids of each cell, one cell after another.
+
+        For grids whose connectivity is implicit (see
+        :class:`~pymt.grids.connectivity.StructuredStencil`), this is only
+        created the first time it is needed, as a read-only array that is
+        shared by grids of the same shape.
+        """
+        if self._connectivity_array is None:
+            if self._stencil is None:
+                raise AttributeError("_connectivity")
+            (self._connectivity_array, self._offset_array) = self._stencil.as_arrays(
+                dtype=self._index_dtype
+            )
+        return self._connectivity_array
+
+    @_connectivity.setter
+    def _connectivity(self, connectivity):
+        self._connectivity_array = connectivity
+
+    @property
+    def _offset(self):
+        """Offset to the end of each cell within the connectivity array."""
+        if self._offset_array is None:
+            if self._stencil is None:
+                raise AttributeError("_offset")
+            (self._connectivity_array, self._offset_array) = self._stencil.as_arrays(
+                dtype=self._index_dtype
+            )
+        return self._offset_array
+
+    @_offset.setter
+    def _offset(self, offset):
+        self._offset_array = offset
+
+    @property
+    def _coords(self):
+        """Node coordinates as a matrix with one row for each dimension.
+
+        For grids whose coordinates are implicit, the matrix is only
+        created (as a writable copy) the first time it is needed.
+        """
+        if self._coord_matrix is None:
+            self._coord_matrix = coordinates_to_numpy_matrix(
+                *(np.ravel(coords) for coords in self._implicit_coords),
+                dtype=self._coord_dtype,
+            )
+        return self._coord_matrix
+
+    @_coords.setter
+    def _coords(self, coords):
+        self._coord_matrix = coords
+
+    def _get_coordinate(self, i):
+        """Coordinates of nodes along one dimension.
+
+        Coordinates that are implicit are computed when first asked for,
+        and returned as read-only arrays.
+        """
+        if self._coord_matrix is not None:
+            return self._coord_matrix[i]
+
+        dim = range(self._n_dims)[i]
+        try:
+            return self._node_coords[dim]
+        except KeyError:
+            coords = np.ravel(self._implicit_coords[dim]).astype(self._coord_dtype)
+            coords.flags.writeable = False
+            self._node_coords[dim] = coords
+            return coords
+
     def get_attrs(self):
         return self._attrs
 
@@ -50,19 +139,19 @@ class UnstructuredPoints(IGrid):
 
     def get_x(self):
         try:
-            return self._coords[-1]
+            return self._get_coordinate(-1)
         except IndexError:
             raise IndexError("Dimension out of bounds")
 
     def get_y(self):
         try:
-            return self._coords[-2]
+            return self._get_coordinate(-2)
         except IndexError:
             raise IndexError("Dimension out of bounds")
 
     def get_z(self):
         try:
-            return self._coords[-3]
+            return self._get_coordinate(-3)
         except IndexError:
             raise IndexError("Dimension out of bounds")
 
@@ -137,7 +226,7 @@ class UnstructuredPoints(IGrid):
 
     def get_coordinate(self, i):
         try:
-            return self._coords[i]
+            return self._get_coordinate(i)
         except IndexError:
             raise IndexError("Dimension out of bounds")
 
@@ -160,21 +249,18 @@ class UnstructuredPoints(IGrid):
         nodes_per_cell = np.diff(self._offset)
         return max(self._offset[0], nodes_per_cell.max())
 
-    def get_connectivity_as_matrix(self, fill_val=MAXSIZE):
-        nodes_per_cell = np.diff(self._offset)
+    def get_connectivity_as_matrix(self, fill_val=None):
+        dtype = self._connectivity.dtype
+        if fill_val is None:
+            fill_val = np.iinfo(dtype).max
 
-        max_vertices = max(self._offset[0], nodes_per_cell.max())
-        matrix = np.empty((self._cell_count, max_vertices), dtype=int)
+        nodes_per_cell = np.diff(self._offset, prepend=0)
+        max_vertices = nodes_per_cell.max()
 
-        offset = self._offset[0]
-        matrix[0, :offset] = self._connectivity[:offset]
-        matrix[0, offset:] = fill_val
-        for cell, offset in enumerate(self._offset[:-1]):
-            n_vertices = nodes_per_cell[cell]
-            matrix[cell + 1, :n_vertices] = self._connectivity[
-                offset : offset + n_vertices
-            ]
-            matrix[cell + 1, n_vertices:] = fill_val
+        is_vertex = np.arange(max_vertices) < nodes_per_cell[:, np.newaxis]
+
+        matrix = np.full((self._cell_count, max_vertices), fill_val, dtype=dtype)
+        matrix[is_vertex] = self._connectivity[: self._offset[-1]]
 
         return (matrix, fill_val)
 
@@ -185,11 +271,18 @@ class UnstructuredPoints(IGrid):
         return np.diff(offsets)
 
     def reverse_element_ordering(self):
-        last_offset = 0
-        for offset in self._offset:
-            c = self._connectivity[last_offset:offset].copy()
-            self._connectivity[last_offset:offset] = c[::-1]
-            last_offset = offset
+        if not self._connectivity.flags.writeable:
+            self._connectivity = self._connectivity.copy()
+
+        end = np.asarray(self._offset)
+        start = np.concatenate(([0], end[:-1]))
+
+        position = np.arange(end[-1] if len(end) else 0)
+        cell = np.repeat(np.arange(len(end)), end - start)
+        self._connectivity[position] = self._connectivity[
+            start[cell] + end[cell] - 1 - position
+        ]
+        self._cell_geometry = None
 
 
 class Unstructured(UnstructuredPoints):
@@ -254,6 +347,9 @@ class Unstructured(UnstructuredPoints):
     array([0., 0., 0., 0., 1., 1., 1., 1.])
     """
 
+    _cell_index = None
+    _cell_geometry = None
+
     def __init__(self, *args, **kwds):
         set_connectivity = kwds.pop("set_connectivity", True)
         connectivity = kwds.pop("connectivity", None)
@@ -270,12 +366,166 @@ class Unstructured(UnstructuredPoints):
         super().__init__(*args, **kwds)
 
     def _set_connectivity(self, connectivity, offset):
-        self._connectivity = np.array(connectivity, dtype=int)
-        self._offset = np.array(offset, dtype=int)
-        self._connectivity.shape = self._connectivity.size
-        self._offset.shape = self._offset.size
+        self._index_dtype = get_index_dtype()
+        self._connectivity = intern_array(
+            as_index_array(connectivity, dtype=self._index_dtype), copy=False
+        )
+        self._offset = intern_array(
+            as_index_array(offset, dtype=self._index_dtype), copy=False
+        )
         self._cell_count = self._offset.size
 
+    def _set_stencil(self, stencil):
+        """Set the connectivity of a structured grid implicitly."""
+        self._index_dtype = get_index_dtype()
+        check_index_range(len(stencil) * stencil.nodes_per_cell, self._index_dtype)
+        self._stencil = stencil
+        (self._connectivity, self._offset) = (None, None)
+        self._cell_count = len(stencil)
+
+    def _cached_geometry(self, name, func):
+        """Geometry of the grid's cells, computed on first use.
+
+        Arrays are kept read-only so that they can be shared, without
+        copying, by everything that uses the grid.
+        """
+        if self._cell_geometry is None:
+            self._cell_geometry = {}
+        try:
+            return self._cell_geometry[name]
+        except KeyError:
+            value = func()
+            for array in value if isinstance(value, tuple) else (value,):
+                array.flags.writeable = False
+            self._cell_geometry[name] = value
+            return value
+
+    def get_cell_vertices(self):
+        """Padded vertex coordinates of each cell.
+
+        Returns
+        -------
+        (xv, yv) : tuple of ndarray of float, shape (n_cells, max_vertices)
+            Vertex coordinates of each cell (see
+            :func:`~pymt.grids.geometry.cell_vertices`).
+        """
+        if self.get_dim_count() != 2:
+            raise ValueError("cell geometry is only available for 2D grids")
+
+        return self._cached_geometry(
+            "vertices",
+            lambda: cell_vertices(
+                self.get_x(), self.get_y(), self._connectivity, self._offset
+            ),
+        )
+
+    def get_cell_areas(self):
+        """Area of each cell.
+
+        Examples
+        --------
+        >>> from pymt.grids import Unstructured
+        >>> g = Unstructured([0, 0, 1, 1], [0, 2, 1, 3],
+        ...                  connectivity=[0, 2, 1, 2, 3, 1], offset=[3, 6])
+        >>> g.get_cell_areas()
+        array([1., 1.])
+        """
+        return self._cached_geometry(
+            "areas", lambda: polygon_areas(*self.get_cell_vertices())
+        )
+
+    def get_cell_centroids(self):
+        """Coordinates of the centroid of each cell.
+
+        Examples
+        --------
+        >>> from pymt.grids import Unstructured
+        >>> g = Unstructured([0, 0, 1, 1], [0, 2, 1, 3],
+        ...                  connectivity=[0, 2, 1, 2, 3, 1], offset=[3, 6])
+        >>> g.get_cell_centroids()
+        (array([1., 2.]), array([0.33333333, 0.66666667]))
+        """
+        return self._cached_geometry(
+            "centroids", lambda: polygon_centroids(*self.get_cell_vertices())
+        )
+
+    def get_cell_bounding_boxes(self):
+        """The (x_min, y_min, x_max, y_max) of each cell.
+
+        Examples
+        --------
+        >>> from pymt.grids import Unstructured
+        >>> g = Unstructured([0, 0, 1, 1], [0, 2, 1, 3],
+        ...                  connectivity=[0, 2, 1, 2, 3, 1], offset=[3, 6])
+        >>> g.get_cell_bounding_boxes()
+        array([[0., 0., 2., 1.],
+               [1., 0., 3., 1.]])
+        """
+        return self._cached_geometry(
+            "bounding_boxes", lambda: bounding_boxes(*self.get_cell_vertices())
+        )
+
+    def get_cells_at_node(self):
+        """Cells that share each node, as compressed sparse rows.
+
+        Returns
+        -------
+        (cells, cell_offset) : tuple of ndarray of int
+            The cells of node *i* are
+            ``cells[cell_offset[i]:cell_offset[i + 1]]`` (see
+            :func:`~pymt.grids.utils.get_cells_at_node`).
+
+        Examples
+        --------
+        >>> from pymt.grids import Unstructured
+        >>> g = Unstructured([0, 0, 1, 1], [0, 2, 1, 3],
+        ...                  connectivity=[0, 2, 1, 2, 3, 1], offset=[3, 6])
+        >>> (cells, offset) = g.get_cells_at_node()
+        >>> cells[offset[1] : offset[2]]
+        array([0, 1])
+        """
+        return self._cached_geometry(
+            "cells_at_node",
+            lambda: get_cells_at_node(
+                self._connectivity, self._offset, self.get_point_count()
+            ),
+        )
+
+    def locate_points(self, x, y):
+        """Ids of the cells that contain points.
+
+        Cells are binned into a grid of buckets, by their bounding boxes,
+        the first time points are located. This index is kept with the
+        grid so that later calls only test points against the cells of
+        the bucket that they fall into.
+
+        Parameters
+        ----------
+        x, y : array_like
+            Coordinates of the points.
+
+        Returns
+        -------
+        ndarray of int
+            Id of the cell that contains each point, or -1 for points
+            outside of the grid.
+
+        Examples
+        --------
+        >>> from pymt.grids import Unstructured
+        >>> g = Unstructured([0, 0, 1, 1], [0, 2, 1, 3],
+        ...                  connectivity=[0, 2, 1, 2, 3, 1], offset=[3, 6])
+        >>> g.locate_points([1.0, 2.0, 4.0], [0.25, 0.75, 0.5])
+        array([ 0,  1, -1])
+        """
+        if self.get_dim_count() != 2:
+            raise ValueError("points can only be located on 2D grids")
+
+        if self._cell_index is None:
+            self._cell_index = CellBuckets(*self.get_cell_vertices())
+
+        return self._cell_index.locate(x, y).astype(self._index_dtype, copy=False)
+
 
 if __name__ == "__main__":
     import doctest
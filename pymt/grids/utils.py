@@ -1,6 +1,13 @@
+import hashlib
+
 import numpy as np
 
-from pymt.grids.assertions import is_rectilinear, is_structured, is_unstructured
+from pymt.grids.assertions import (
+    is_rectilinear,
+    is_structured,
+    is_uniform_rectilinear,
+    is_unstructured,
+)
 
 
 def get_default_coordinate_units(n_dims):
@@ -34,11 +41,11 @@ def args_as_numpy_arrays(*args):
     return tuple(np_arrays)
 
 
-def coordinates_to_numpy_matrix(*args):
+def coordinates_to_numpy_matrix(*args, **kwds):
     args = args_as_numpy_arrays(*args)
     assert_arrays_are_equal_size(*args)
 
-    coords = np.empty((len(args), len(args[0])), dtype=float)
+    coords = np.empty((len(args), len(args[0])), dtype=kwds.get("dtype", float))
     for dim, arg in enumerate(args):
         coords[dim][:] = arg.flatten()
     return coords
@@ -86,27 +93,223 @@ def non_singleton_dimension_shape(grid):
         return np.tile(shape, (grid.get_dim_count(), 1))
 
 
-def _find_first(array, value):
-    try:
-        return np.where(array == value)[0][0]
-    except IndexError:
-        return len(array)
-
-
 def connectivity_matrix_as_array(face_nodes, bad_val):
-    nodes_per_face = np.empty(face_nodes.shape[0], dtype=int)
-    for face_id, face in enumerate(face_nodes):
-        nnodes = _find_first(face, bad_val)
-        if nnodes > 0:
-            nodes_per_face[face_id] = _find_first(face, bad_val)
-        else:
-            raise ValueError("face contains no nodes")
+    face_nodes = np.asarray(face_nodes)
+
+    is_bad = face_nodes == bad_val
+    nodes_per_face = np.where(
+        is_bad.any(axis=1), is_bad.argmax(axis=1), face_nodes.shape[1]
+    )
+    if np.any(nodes_per_face == 0):
+        raise ValueError("face contains no nodes")
     offsets = np.cumsum(nodes_per_face)
 
-    connectivity = np.empty(offsets[-1], dtype=int)
-    offset = 0
-    for n_nodes, face in zip(nodes_per_face, face_nodes):
-        connectivity[offset : offset + n_nodes] = face[:n_nodes]
-        offset += n_nodes
+    is_node = np.arange(face_nodes.shape[1]) < nodes_per_face[:, np.newaxis]
+    connectivity = face_nodes[is_node].astype(int)
 
     return (connectivity, offsets)
+
+
+def get_cells_at_node(connectivity, offset, n_points):
+    """Cells that share each node, as compressed sparse rows.
+
+    Parameters
+    ----------
+    connectivity : ndarray of int
+        Node ids of each cell, one cell after another.
+    offset : ndarray of int
+        Offset to the end of each cell within *connectivity*.
+    n_points : int
+        Number of nodes in the grid.
+
+    Returns
+    -------
+    (cells, cell_offset) : tuple of ndarray of int
+        The cells of node *i* are ``cells[cell_offset[i]:cell_offset[i + 1]]``,
+        in increasing order.
+
+    Examples
+    --------
+    >>> from pymt.grids.utils import get_cells_at_node
+    >>> (cells, offset) = get_cells_at_node([0, 1, 4, 3, 1, 2, 5, 4], [4, 8], 6)
+    >>> cells
+    array([0, 0, 1, 1, 0, 0, 1, 1])
+    >>> offset
+    array([0, 1, 3, 4, 5, 7, 8])
+    >>> cells[offset[1] : offset[2]]
+    array([0, 1])
+    """
+    connectivity = np.asarray(connectivity).reshape((-1,))
+    offset = np.asarray(offset).reshape((-1,))
+
+    nodes_per_cell = np.diff(offset, prepend=0)
+    cell_at_vertex = np.repeat(np.arange(len(offset)), nodes_per_cell)
+
+    cells = cell_at_vertex[np.argsort(connectivity, kind="stable")]
+
+    cell_offset = np.empty(n_points + 1, dtype=int)
+    cell_offset[0] = 0
+    np.cumsum(np.bincount(connectivity, minlength=n_points), out=cell_offset[1:])
+
+    return cells, cell_offset
+
+
+def fingerprint_arrays(*arrays):
+    """A digest of the contents of a set of arrays.
+
+    The digest depends on the data type, shape and values of each array.
+
+    Examples
+    --------
+    >>> from pymt.grids.utils import fingerprint_arrays
+    >>> fingerprint_arrays([1, 2, 3]) == fingerprint_arrays(np.array([1, 2, 3]))
+    True
+    >>> fingerprint_arrays([1, 2, 3]) == fingerprint_arrays([1, 2, 4])
+    False
+    >>> fingerprint_arrays([1, 2, 3]) == fingerprint_arrays([1.0, 2.0, 3.0])
+    False
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for array in arrays:
+        array = np.ascontiguousarray(array)
+        digest.update(f"{array.dtype.str}{array.shape}".encode())
+        digest.update(array.data)
+    return digest.hexdigest()
+
+
+def grid_fingerprint(grid, grid_id=None):
+    """A cheap, content-based identifier of a grid's geometry.
+
+    Uniform rectilinear grids are identified by their shape, spacing and
+    origin, rectilinear grids by their axis coordinates, and all other
+    grids by their node coordinates along with their connectivity. Grids
+    that have the same fingerprint have the same nodes and cells.
+
+    Objects that are not grids themselves, but whose grid methods take a
+    grid id (a :class:`~pymt.component.component.Component`, for
+    example), are identified by the type, node *x* and *y* coordinates
+    and either the shape or, for unstructured grids, the connectivity of
+    one of their grids.
+
+    Parameters
+    ----------
+    grid : grid_like
+        A grid.
+    grid_id : int, optional
+        Id of the grid of an object whose grid methods take a grid id.
+        The default is grid 0.
+
+    Returns
+    -------
+    str
+        The grid's fingerprint.
+
+    Examples
+    --------
+    >>> from pymt.grids import UniformRectilinear, Rectilinear
+    >>> from pymt.grids.utils import grid_fingerprint
+    >>> grid = UniformRectilinear((2, 3), (1.0, 2.0), (0.0, 0.0))
+    >>> grid_fingerprint(grid) == grid_fingerprint(
+    ...     UniformRectilinear((2, 3), (1.0, 2.0), (0.0, 0.0))
+    ... )
+    True
+    >>> grid_fingerprint(grid) == grid_fingerprint(
+    ...     UniformRectilinear((2, 3), (1.0, 2.0), (0.0, 1.0))
+    ... )
+    False
+    >>> grid_fingerprint(Rectilinear([0, 1], [0, 2, 4])) == grid_fingerprint(
+    ...     Rectilinear([0.0, 1.0], [0.0, 2.0, 4.0])
+    ... )
+    True
+    """
+    if grid_id is not None or not hasattr(grid, "get_dim_count"):
+        return _grid_id_fingerprint(grid, grid_id or 0)
+
+    if is_uniform_rectilinear(grid):
+        kind = "uniform_rectilinear"
+        arrays = [
+            np.asarray(grid.get_shape(), dtype=int),
+            np.asarray(grid.get_spacing(), dtype=float),
+            np.asarray(grid.get_origin(), dtype=float),
+        ]
+    elif is_rectilinear(grid):
+        kind = "rectilinear"
+        arrays = [
+            np.asarray(grid.get_axis_coordinates(axis=axis), dtype=float)
+            for axis in range(grid.get_dim_count())
+        ]
+    else:
+        kind = "structured" if is_structured(grid, strict=False) else "unstructured"
+        arrays = [
+            np.asarray(grid.get_coordinate(dim), dtype=float)
+            for dim in range(grid.get_dim_count())
+        ]
+        if kind == "structured":
+            arrays.append(np.asarray(grid.get_shape(), dtype=int))
+        else:
+            try:
+                arrays += [grid.get_connectivity(), grid.get_offset()]
+            except AttributeError:
+                pass
+
+    return kind + ":" + fingerprint_arrays(*arrays)
+
+
+def _grid_id_fingerprint(grid, grid_id):
+    """Fingerprint of a grid of an object whose methods take a grid id."""
+    kind = str(grid.get_grid_type(grid_id)).lower()
+
+    arrays = [
+        np.asarray(grid.get_x(grid_id), dtype=float),
+        np.asarray(grid.get_y(grid_id), dtype=float),
+    ]
+    if kind == "unstructured":
+        arrays += [grid.get_connectivity(grid_id), grid.get_offset(grid_id)]
+    elif kind not in ("scalar", "points", "vector"):
+        arrays.append(np.asarray(grid.get_grid_shape(grid_id), dtype=int))
+
+    return kind + ":" + fingerprint_arrays(*arrays)
+
+
+def variable_fingerprint(grid, name):
+    """Location, and grid fingerprint, of a variable.
+
+    Variables of grid-like objects whose grid methods take a grid id are
+    identified by the grid they are defined on. Variables of grids are
+    identified by the grid itself. Values are on nodes unless the object
+    says otherwise.
+
+    Parameters
+    ----------
+    grid : grid_like
+        A grid, or an object with grids (such as a component).
+    name : str
+        Name of a variable.
+
+    Returns
+    -------
+    (str, str)
+        The location of the variable and the fingerprint of its grid.
+
+    Examples
+    --------
+    >>> from pymt.grids import UniformRectilinear
+    >>> from pymt.grids.utils import grid_fingerprint, variable_fingerprint
+    >>> grid = UniformRectilinear((2, 3), (1.0, 2.0), (0.0, 0.0))
+    >>> variable_fingerprint(grid, "elevation") == ("node", grid_fingerprint(grid))
+    True
+    """
+    try:
+        location = grid.get_var_location(name)
+    except AttributeError:
+        location = "node"
+
+    if hasattr(grid, "get_dim_count"):
+        return location, grid_fingerprint(grid)
+
+    try:
+        grid_id = grid.get_var_grid(name)
+    except AttributeError:
+        grid_id = 0
+
+    return location, grid_fingerprint(grid, grid_id)
@@ -1,12 +1,30 @@
+from .bilinear import Bilinear
+from .binning import Binning
+from .cache import MapperCache
 from .celltopoint import CellToPoint
+from .conservative import Conservative
+from .identity import IdentityMapper
+from .idw import InverseDistance
 from .mapper import IncompatibleGridError, find_mapper
 from .pointtocell import PointToCell
 from .pointtopoint import NearestVal
+from .reordered import ReorderedMapper
+from .sparse import SparseMapper
+from .vector import VectorMapper
 
 __all__ = [
     "find_mapper",
     "IncompatibleGridError",
+    "MapperCache",
+    "Bilinear",
+    "Binning",
     "CellToPoint",
+    "Conservative",
+    "IdentityMapper",
+    "InverseDistance",
     "NearestVal",
     "PointToCell",
+    "ReorderedMapper",
+    "SparseMapper",
+    "VectorMapper",
 ]
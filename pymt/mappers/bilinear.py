@@ -0,0 +1,260 @@
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from ..grids.assertions import is_rectilinear, is_structured
+from ..grids.dtypes import check_index_range, get_index_dtype
+from ..grids.locate import is_monotonic, locate_in_rectilinear, locate_in_structured
+from ..grids.utils import grid_fingerprint
+from .imapper import IncompatibleGridError
+from .kdtree import get_kdtree, query_nearest
+from .sparse import SparseMapper
+from .tracker import PointTracker
+
+
+def bilinear_weights(shape, row, col):
+    """Bilinear weights of the corner nodes of cells.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Shape of the source grid, measured in nodes.
+    row, col : tuple of ndarray
+        Cell index, and fractional position within that cell, along each
+        axis for each destination point (see
+        :func:`~pymt.grids.locate.locate_on_axis`).
+
+    Returns
+    -------
+    scipy.sparse.csr_matrix
+        Weights with one row for each destination point. Points outside
+        of the source grid have no weights.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from pymt.mappers.bilinear import bilinear_weights
+    >>> row = (np.array([0, -1]), np.array([0.5, 0.]))
+    >>> col = (np.array([1, 0]), np.array([0.25, 0.]))
+    >>> bilinear_weights((2, 3), row, col).toarray()
+    array([[0.   , 0.375, 0.125, 0.   , 0.375, 0.125],
+           [0.   , 0.   , 0.   , 0.   , 0.   , 0.   ]])
+    """
+    (n_rows, n_cols) = shape
+    ((i, fi), (j, fj)) = (row, col)
+
+    is_inside = (i >= 0) & (j >= 0)
+    (i, fi, j, fj) = (i[is_inside], fi[is_inside], j[is_inside], fj[is_inside])
+
+    lower_left = i * n_cols + j
+    nodes = np.column_stack(
+        (lower_left, lower_left + 1, lower_left + n_cols, lower_left + n_cols + 1)
+    )
+    weights = np.column_stack(
+        ((1.0 - fi) * (1.0 - fj), (1.0 - fi) * fj, fi * (1.0 - fj), fi * fj)
+    )
+
+    n_dst = len(is_inside)
+    index_dtype = get_index_dtype()
+    check_index_range(4 * n_dst, index_dtype)
+    indptr = np.zeros(n_dst + 1, dtype=index_dtype)
+    indptr[1:] = np.cumsum(is_inside * 4)
+
+    matrix = csr_matrix(
+        (weights.reshape((-1,)), nodes.reshape((-1,)).astype(index_dtype), indptr),
+        shape=(n_dst, n_rows * n_cols),
+    )
+    matrix.eliminate_zeros()
+
+    return matrix
+
+
+def _fingerprint(grid):
+    try:
+        return grid_fingerprint(grid)
+    except (AttributeError, TypeError):
+        return None
+
+
+def _locate(src_grid, x, y, cells=None):
+    """Locate points in a source grid, starting from their previous cells."""
+    if not is_structured(src_grid):
+        return locate_in_rectilinear(src_grid, x, y)
+
+    shape = src_grid.get_shape()
+    if cells is None:
+        (row, col) = (np.full(len(x), -1), np.full(len(x), -1))
+    else:
+        (row, col) = cells
+
+    start = row * shape[1] + col
+    is_lost = row < 0
+    if np.any(is_lost):
+        (_, start[is_lost]) = query_nearest(
+            get_kdtree(src_grid), x[is_lost], y[is_lost]
+        )
+
+    return locate_in_structured(
+        src_grid.get_x().reshape(shape),
+        src_grid.get_y().reshape(shape),
+        x,
+        y,
+        start=start,
+    )
+
+
+class Bilinear(SparseMapper):
+    """Map points with bilinear interpolation from a quadrilateral grid.
+
+    The cell that contains each destination point is found arithmetically
+    for uniform rectilinear grids, or with a binary search along each axis
+    for rectilinear grids. For structured (curvilinear) grids, each point
+    walks from the cell of its nearest source node to the cell that
+    contains it.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from pymt.grids.map import RectilinearMap, UniformRectilinearMap
+    >>> from pymt.mappers.bilinear import Bilinear
+    >>> src = UniformRectilinearMap((3, 3), (1.0, 1.0), (0.0, 0.0))
+    >>> dst = RectilinearMap([0.5, 1.5, 2.5], [0.25, 1.5])
+
+    >>> mapper = Bilinear()
+    >>> mapper.initialize(dst, src)
+    >>> mapper.run(np.arange(9.))
+    array([   1.75,    3.  ,    4.75,    6.  , -999.  , -999.  ])
+
+    The same grid, but rotated by 45 degrees.
+
+    >>> from pymt.grids.map import StructuredMap
+    >>> (x, y) = (src.get_x(), src.get_y())
+    >>> (x, y) = ((x - y) / np.sqrt(2), (x + y) / np.sqrt(2))
+    >>> src = StructuredMap(y, x, (3, 3))
+    >>> dst = RectilinearMap([.5, 1., 1.5], [0.])
+
+    >>> mapper.initialize(dst, src)
+    >>> mapper.run(np.arange(9.))
+    array([1.41421356, 2.82842712, 4.24264069])
+    """
+
+    _name = "Bilinear"
+
+    def initialize(self, dest_grid, src_grid, **kwds):
+        """Locate destination points and compute their weights.
+
+        Parameters
+        ----------
+        dest_grid : grid_like
+            Grid onto which points are mapped
+        src_grid : grid_like
+            Rectilinear or structured grid from which points are taken.
+        tiles : int, optional
+            Compute weights for this many tiles of destination points
+            separately (see :mod:`pymt.mappers.tiled`).
+        max_workers : int, optional
+            Number of processes used to compute the weights of tiles.
+        """
+        if not Bilinear.test(dest_grid, src_grid):
+            raise IncompatibleGridError(dest_grid.name, src_grid.name)
+
+        if self._initialize_tiled(dest_grid, src_grid, **kwds):
+            self._tracker = None
+            return
+
+        (x, y) = (np.ravel(dest_grid.get_x()), np.ravel(dest_grid.get_y()))
+        self._tracker = PointTracker(x, y)
+        self._shape = tuple(src_grid.get_shape())
+        self._src_fingerprint = _fingerprint(src_grid)
+
+        (self._row, self._col) = _locate(src_grid, x, y)
+        self._weights = bilinear_weights(self._shape, self._row, self._col)
+
+    def update(self, dest_grid, src_grid, **kwds):
+        """Update the mapper after the nodes of either grid have moved.
+
+        If only destination points have moved, only they are located
+        again. If the nodes of a structured source grid have moved, each
+        point starts its search from the cell that contained it before, so
+        points that remain in their cell are found in a single step.
+
+        Parameters
+        ----------
+        dest_grid : grid_like
+            Grid onto which points are mapped
+        src_grid : grid_like
+            Rectilinear or structured grid from which points are taken.
+        """
+        if self._tracker is None:
+            kwds = dict(self._tiled_kwds, **kwds)
+            return self.initialize(dest_grid, src_grid, **kwds)
+
+        (x, y) = (np.ravel(dest_grid.get_x()), np.ravel(dest_grid.get_y()))
+        moved = self._tracker.update(x, y)
+
+        if moved is None or tuple(src_grid.get_shape()) != self._shape:
+            return self.initialize(dest_grid, src_grid, **kwds)
+
+        src_fingerprint = _fingerprint(src_grid)
+        if src_fingerprint is None or src_fingerprint != self._src_fingerprint:
+            moved = np.arange(len(x))
+            self._src_fingerprint = src_fingerprint
+        elif len(moved) == 0:
+            return
+
+        (row, col) = _locate(
+            src_grid,
+            x[moved],
+            y[moved],
+            cells=(self._row[0][moved], self._col[0][moved]),
+        )
+        for (old, new) in ((self._row, row), (self._col, col)):
+            (old[0][moved], old[1][moved]) = new
+
+        self._weights = bilinear_weights(self._shape, self._row, self._col)
+
+    @classmethod
+    def point_weights(cls, src_grid, x, y, **kwds):
+        """Bilinear weights of destination points.
+
+        Parameters
+        ----------
+        src_grid : grid_like
+            Rectilinear or structured grid from which points are taken.
+        x, y : ndarray
+            Coordinates of the destination points.
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+            Weights with one row for each destination point.
+        """
+        (row, col) = _locate(src_grid, np.ravel(x), np.ravel(y))
+        return bilinear_weights(tuple(src_grid.get_shape()), row, col)
+
+    @staticmethod
+    def test(dst_grid, src_grid):
+        """Test if grids are compatible with this mapper.
+
+        The source grid must be a 2D structured grid or a 2D rectilinear
+        grid whose axes are monotonic.
+
+        Parameters
+        ----------
+        dst_grid : grid_like
+            Grid onto which points are mapped
+        src_grid : grid_like
+            Grid from which points are taken.
+        """
+        if dst_grid is None or not is_structured(src_grid, strict=False):
+            return False
+
+        shape = src_grid.get_shape()
+        if len(shape) != 2 or np.any(shape < 2):
+            return False
+
+        if not is_rectilinear(src_grid, strict=False):
+            return True
+
+        return all(
+            is_monotonic(src_grid.get_axis_coordinates(axis=axis)) for axis in (0, 1)
+        )
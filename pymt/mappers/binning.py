@@ -0,0 +1,229 @@
+import numpy as np
+
+from ..grids.assertions import is_rectilinear
+from ..grids.locate import is_monotonic, locate_in_rectilinear
+from .imapper import IGridMapper, IncompatibleGridError
+from .pointtocell import _METHOD_NAMES
+
+
+def bin_points(grid, x, y):
+    """Find the cells of a rectilinear grid that contain points.
+
+    Parameters
+    ----------
+    grid : grid_like
+        A 2D rectilinear or uniform rectilinear grid.
+    x, y : array_like
+        Coordinates of the points.
+
+    Returns
+    -------
+    ndarray of int
+        Index of the cell that contains each point, or -1 for points
+        outside of the grid.
+
+    Examples
+    --------
+    >>> from pymt.grids.map import UniformRectilinearMap
+    >>> from pymt.mappers.binning import bin_points
+    >>> grid = UniformRectilinearMap((3, 4), (1.0, 1.0), (0.0, 0.0))
+    >>> bin_points(grid, [0.5, 2.5, 1.5, 4.0], [0.5, 1.5, 1.0, 0.0])
+    array([ 0,  5,  4, -1])
+    """
+    (n_rows, n_cols) = grid.get_shape()
+    ((row, _), (col, _)) = locate_in_rectilinear(grid, np.ravel(x), np.ravel(y))
+
+    cell = row * (n_cols - 1) + col
+    cell[(row < 0) | (col < 0)] = -1
+
+    return cell
+
+
+class Binning(IGridMapper):
+    """Aggregate values on points into the cells of a rectilinear grid.
+
+    Points are binned arithmetically (uniform rectilinear grids) or with a
+    binary search along each axis (rectilinear grids), and values are
+    aggregated with :func:`numpy.bincount`.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from pymt.grids.map import UniformRectilinearMap, UnstructuredPointsMap
+    >>> from pymt.mappers.binning import Binning
+    >>> src = UnstructuredPointsMap(
+    ...     np.array([0.5, 0.5, 1.5, 0.2]), np.array([0.5, 0.6, 2.5, 1.2])
+    ... )
+    >>> dst = UniformRectilinearMap((3, 4), (1.0, 1.0), (0.0, 0.0))
+
+    >>> mapper = Binning()
+    >>> mapper.initialize(dst, src)
+    >>> mapper.run(np.array([1.0, 2.0, 4.0, 8.0]))
+    array([   1.5,    8. , -999. , -999. , -999. ,    4. ])
+    >>> mapper.run(np.array([1.0, 2.0, 4.0, 8.0]), method="count")
+    array([2, 1, 0, 0, 0, 1])
+
+    When points move, only their cells need to be found again.
+
+    >>> mapper.relocate(np.array([0.5, 0.5, 0.5, 0.5]), np.array([0.5, 0.5, 0.5, 0.5]))
+    >>> mapper.run(np.array([1.0, 2.0, 4.0, 8.0]), method="max")
+    array([   8., -999., -999., -999., -999., -999.])
+    """
+
+    _name = "Binning"
+
+    def initialize(self, dest_grid, src_grid, **kwds):
+        """Find the destination cells that contain each source point.
+
+        Parameters
+        ----------
+        dest_grid : grid_like
+            Rectilinear grid onto which values are aggregated.
+        src_grid : grid_like
+            Grid of points from which values are taken.
+        """
+        if not Binning.test(dest_grid, src_grid):
+            raise IncompatibleGridError(dest_grid.name, src_grid.name)
+
+        self._dst_grid = dest_grid
+        self._dst_cell_count = dest_grid.get_cell_count()
+        self.relocate(src_grid.get_x(), src_grid.get_y())
+
+    def update(self, dest_grid, src_grid, **kwds):
+        """Update the mapper after the source points have moved.
+
+        Parameters
+        ----------
+        dest_grid : grid_like
+            Rectilinear grid onto which values are aggregated.
+        src_grid : grid_like
+            Grid of points from which values are taken.
+        """
+        if dest_grid is not self._dst_grid:
+            return self.initialize(dest_grid, src_grid, **kwds)
+        self.relocate(src_grid.get_x(), src_grid.get_y())
+
+    def relocate(self, x, y):
+        """Find the cells of points that have moved.
+
+        Parameters
+        ----------
+        x, y : array_like
+            New coordinates of the source points. The number of points may
+            differ from that of the initial source grid.
+        """
+        self._cell = bin_points(self._dst_grid, x, y)
+        self._sorted = None
+
+    def _sorted_by_cell(self, values, is_good):
+        if self._sorted is None:
+            order = np.argsort(self._cell, kind="stable")
+            self._sorted = (order, self._cell[order])
+        (order, cell) = self._sorted
+
+        keep = is_good[order]
+        (order, cell) = (order[keep], cell[keep])
+        (cell_ids, start) = np.unique(cell, return_index=True)
+
+        return values[order], cell_ids, start
+
+    def run(self, src_values, **kwds):
+        """Aggregate source values into destination cells.
+
+        Parameters
+        ----------
+        src_values : ndarray
+            Source values on points.
+        dst_vals : ndarray, optional
+            Destination array to put aggregated values. Except for 'sum'
+            and 'count', cells without good points are left unchanged.
+        bad_val : float, optional
+            Value below which indicates a bad value.
+        method : {'mean', 'sum', 'count', 'max', 'min'}, optional
+            How to aggregate the values of points within a cell. The numpy
+            equivalents (:func:`numpy.mean`, and so on) are also accepted.
+
+        Returns
+        -------
+        ndarray
+            The (possibly newly-created) destination array. If
+            newly-created, cells without points are 0 for 'sum' and 'count',
+            and *bad_val* otherwise.
+        """
+        dst_vals = kwds.get("dst_vals", None)
+        bad_val = kwds.get("bad_val", -999)
+        method = kwds.get("method", "mean")
+        method = _METHOD_NAMES.get(method, method)
+
+        src_values = np.ravel(src_values)
+        if src_values.size != self._cell.size:
+            raise ValueError("size mismatch between source values and point count")
+
+        is_good = (src_values > bad_val) & (self._cell >= 0)
+        cell = self._cell[is_good]
+
+        if method in ("count", "sum", "mean"):
+            count = np.bincount(cell, minlength=self._dst_cell_count)
+            if method == "count":
+                reduced, has_values = count, np.ones_like(count, dtype=bool)
+            else:
+                total = np.bincount(
+                    cell, weights=src_values[is_good], minlength=self._dst_cell_count
+                )
+                if method == "sum":
+                    reduced, has_values = total, np.ones_like(count, dtype=bool)
+                else:
+                    has_values = count > 0
+                    reduced = np.zeros_like(total)
+                    reduced[has_values] = total[has_values] / count[has_values]
+        elif method in ("max", "min"):
+            (values, cell_ids, start) = self._sorted_by_cell(src_values, is_good)
+            reduced = np.zeros(self._dst_cell_count, dtype=float)
+            has_values = np.zeros(self._dst_cell_count, dtype=bool)
+            if len(cell_ids) > 0:
+                ufunc = np.maximum if method == "max" else np.minimum
+                reduced[cell_ids] = ufunc.reduceat(values, start)
+                has_values[cell_ids] = True
+        else:
+            raise ValueError(f"{method}: aggregation method not understood")
+
+        if dst_vals is None:
+            if method == "count":
+                return reduced
+            dst_vals = np.full(self._dst_cell_count, bad_val, dtype=float)
+        elif dst_vals.size != self._dst_cell_count:
+            raise ValueError("size mismatch between destination and cell count")
+
+        dst_vals.reshape((-1,))[has_values] = reduced[has_values]
+
+        return dst_vals
+
+    @staticmethod
+    def test(dst_grid, src_grid):
+        """Test if grids are compatible with this mapper.
+
+        The destination grid must be a 2D rectilinear grid whose axes are
+        monotonic.
+
+        Parameters
+        ----------
+        dst_grid : grid_like
+            Grid onto which values are aggregated.
+        src_grid : grid_like
+            Grid of points from which values are taken.
+        """
+        if src_grid is None or not is_rectilinear(dst_grid, strict=False):
+            return False
+
+        shape = dst_grid.get_shape()
+        if len(shape) != 2 or np.any(shape < 2):
+            return False
+
+        return all(
+            is_monotonic(dst_grid.get_axis_coordinates(axis=axis)) for axis in (0, 1)
+        )
+
+    @property
+    def name(self):
+        """Name of the grid mapper."""
+        return self._name
@@ -0,0 +1,138 @@
+"""Share initialized mappers between couplings that use the same grids.
+
+Mappers are keyed by their class, the keywords used to initialize them,
+and the fingerprints of the source and destination grids (see
+:func:`~pymt.grids.utils.grid_fingerprint`). If variables to map are
+given (with the *vars* or *var_names* keyword), the grids are those
+that the variables are defined on. Couplings between grids that have
+the same geometry therefore share a single, initialized mapper.
+
+Examples
+--------
+>>> import numpy as np
+>>> from pymt.grids.map import RectilinearMap
+>>> from pymt.mappers import NearestVal
+>>> from pymt.mappers.cache import MapperCache
+
+>>> cache = MapperCache(maxsize=2)
+>>> src = RectilinearMap([0, 1, 2], [0, 2])
+>>> dst = RectilinearMap([.25, 1.25, 2.25], [.25, 1.25])
+>>> mapper = cache.get(NearestVal, dst, src)
+>>> mapper.run(np.arange(6.))
+array([0., 1., 2., 3., 4., 5.])
+
+A second pair of grids with the same geometry reuses the mapper.
+
+>>> cache.get(
+...     NearestVal,
+...     RectilinearMap([.25, 1.25, 2.25], [.25, 1.25]),
+...     RectilinearMap([0, 1, 2], [0, 2]),
+... ) is mapper
+True
+>>> len(cache)
+1
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+
+from ..grids.utils import fingerprint_arrays, grid_fingerprint, variable_fingerprint
+
+
+def _freeze(value):
+    if isinstance(value, np.ndarray):
+        return fingerprint_arrays(value)
+    elif isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    elif isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    else:
+        hash(value)
+        return value
+
+
+def _grids_key(dest_grid, src_grid, kwds):
+    """Fingerprints of the grids, or of the grids of the mapped variables."""
+    var_names = kwds.get("vars") or kwds.get("var_names")
+    if not var_names:
+        return grid_fingerprint(dest_grid), grid_fingerprint(src_grid)
+
+    return tuple(
+        (variable_fingerprint(dest_grid, dst), variable_fingerprint(src_grid, src))
+        for dst, src in var_names
+    )
+
+
+class MapperCache:
+    """A size-bounded, least-recently-used cache of initialized mappers.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of mappers to keep. When full, the least-recently
+        used mapper is evicted.
+    """
+
+    def __init__(self, maxsize=32):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self._maxsize = maxsize
+        self._mappers = OrderedDict()
+
+    @property
+    def maxsize(self):
+        """Maximum number of cached mappers."""
+        return self._maxsize
+
+    def get(self, cls, dest_grid, src_grid, **kwds):
+        """Get an initialized mapper between two grids.
+
+        Parameters
+        ----------
+        cls : class
+            Class of the mapper.
+        dest_grid : grid_like
+            Grid onto which values are mapped.
+        src_grid : grid_like
+            Grid from which values are mapped.
+        **kwds
+            Keywords passed to the mapper's `initialize` method.
+
+        Returns
+        -------
+        mapper
+            A (possibly shared) initialized mapper. If either grid cannot
+            be fingerprinted, the mapper is not cached.
+        """
+        try:
+            key = (cls, _grids_key(dest_grid, src_grid, kwds), _freeze(kwds))
+        except (AttributeError, TypeError, KeyError):
+            return self._new_mapper(cls, dest_grid, src_grid, **kwds)
+
+        try:
+            mapper = self._mappers.pop(key)
+        except KeyError:
+            mapper = self._new_mapper(cls, dest_grid, src_grid, **kwds)
+
+        self._mappers[key] = mapper
+        while len(self._mappers) > self.maxsize:
+            self._mappers.popitem(last=False)
+
+        return mapper
+
+    @staticmethod
+    def _new_mapper(cls, dest_grid, src_grid, **kwds):
+        mapper = cls()
+        mapper.initialize(dest_grid, src_grid, **kwds)
+        return mapper
+
+    def clear(self):
+        """Remove all mappers from the cache."""
+        self._mappers.clear()
+
+    def __len__(self):
+        return len(self._mappers)
+
+
+MAPPER_CACHE = MapperCache()
@@ -1,7 +1,8 @@
 import numpy as np
-from scipy.spatial import KDTree
 
+from ..grids.dtypes import get_index_dtype
 from .imapper import IGridMapper, IncompatibleGridError
+from .kdtree import get_kdtree, query_nearest
 
 # from .mapper import IncompatibleGridError
 
@@ -9,7 +10,7 @@ from .imapper import IGridMapper, IncompatibleGridError
 def map_points_to_cells(coords, src_grid, src_point_ids, bad_val=-1):
     (dst_x, dst_y) = coords
 
-    point_to_cell_id = np.empty(len(dst_x), dtype=int)
+    point_to_cell_id = np.empty(len(dst_x), dtype=get_index_dtype())
     point_to_cell_id.fill(bad_val)
 
     for j, point_id in enumerate(src_point_ids):
@@ -29,8 +30,8 @@ class CellToPoint(IGridMapper):
         dst_x = dest_grid.get_x()
         dst_y = dest_grid.get_y()
 
-        tree = KDTree(list(zip(src_grid.get_x(), src_grid.get_y())))
-        (_, self._nearest_src_id) = tree.query(list(zip(dst_x, dst_y)))
+        tree = get_kdtree(src_grid)
+        (_, self._nearest_src_id) = query_nearest(tree, dst_x, dst_y)
 
         self._map = map_points_to_cells(
             (dst_x, dst_y), src_grid, self._nearest_src_id, bad_val=-1
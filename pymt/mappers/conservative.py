@@ -0,0 +1,193 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from ..grids.geometry import (
+    bounding_boxes,
+    cell_vertices,
+    overlap_areas,
+    overlapping_boxes,
+    polygon_areas,
+)
+from .imapper import IncompatibleGridError
+from .sparse import SparseMapper
+
+
+def _cell_vertices(grid):
+    try:
+        return grid.get_cell_vertices()
+    except AttributeError:
+        return cell_vertices(
+            grid.get_x(), grid.get_y(), grid.get_connectivity(), grid.get_offset()
+        )
+
+
+def _cell_areas(grid, cells):
+    try:
+        return grid.get_cell_areas()
+    except AttributeError:
+        return polygon_areas(*cells)
+
+
+def _has_polygon_cells(grid):
+    try:
+        offset = grid.get_offset()
+    except AttributeError:
+        return False
+    return len(offset) > 0 and np.all(np.diff(offset, prepend=0) > 2)
+
+
+def overlap_weights(dst_cells, src_cells, chunk_size=65536, workers=None):
+    """Areas of overlap between destination and source cells.
+
+    Parameters
+    ----------
+    dst_cells : tuple of ndarray
+        Padded vertex coordinates of the (convex) destination cells.
+    src_cells : tuple of ndarray
+        Padded vertex coordinates of the source cells.
+    chunk_size : int, optional
+        Number of candidate pairs of cells to clip at a time.
+    workers : int, optional
+        Number of threads used to clip chunks of cell pairs. The default is
+        the number of processors.
+
+    Returns
+    -------
+    scipy.sparse.csr_matrix
+        Area of overlap with one row for each destination cell and one
+        column for each source cell.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from pymt.mappers.conservative import overlap_weights
+    >>> dst = (np.array([[0.0, 2.0, 2.0, 0.0]]), np.array([[0.0, 0.0, 1.0, 1.0]]))
+    >>> src = (
+    ...     np.array([[-1.0, 1.0, 1.0, -1.0], [1.0, 3.0, 3.0, 1.0]]),
+    ...     np.array([[0.0, 0.0, 1.0, 1.0], [0.0, 0.0, 1.0, 1.0]]),
+    ... )
+    >>> overlap_weights(dst, src).toarray()
+    array([[1., 1.]])
+    """
+    (dst_x, dst_y) = dst_cells
+    (src_x, src_y) = src_cells
+
+    (dst_ids, src_ids) = overlapping_boxes(
+        bounding_boxes(dst_x, dst_y), bounding_boxes(src_x, src_y)
+    )
+
+    def clip(start):
+        (dst, src) = (
+            dst_ids[start : start + chunk_size],
+            src_ids[start : start + chunk_size],
+        )
+        return overlap_areas(src_x[src], src_y[src], dst_x[dst], dst_y[dst])
+
+    chunks = range(0, len(dst_ids), chunk_size)
+    if len(chunks) > 1:
+        with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+            areas = list(executor.map(clip, chunks))
+    else:
+        areas = [clip(start) for start in chunks]
+    areas = np.concatenate(areas) if areas else np.empty(0)
+
+    matrix = csr_matrix(
+        (areas, (dst_ids, src_ids)), shape=(len(dst_x), len(src_x))
+    )
+    matrix.eliminate_zeros()
+
+    return matrix
+
+
+class Conservative(SparseMapper):
+    """Map cell values with first-order, area-weighted conservative remapping.
+
+    The value of a destination cell is the area-weighted mean of the values
+    of the source cells that it overlaps. Destination cells must be convex.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from pymt.grids.map import UniformRectilinearMap
+    >>> from pymt.mappers.conservative import Conservative
+    >>> src = UniformRectilinearMap((3, 5), (1.0, 1.0), (0.0, 0.0))
+    >>> dst = UniformRectilinearMap((2, 3), (2.0, 2.0), (0.0, 0.0))
+
+    >>> mapper = Conservative()
+    >>> mapper.initialize(dst, src)
+    >>> src_vals = np.arange(8.)
+    >>> dst_vals = mapper.run(src_vals)
+    >>> dst_vals
+    array([2.5, 4.5])
+    >>> mapper.conservation_error(src_vals, dst_vals)
+    0.0
+    """
+
+    _name = "Conservative"
+
+    def initialize(self, dest_grid, src_grid, **kwds):
+        """Compute the overlap of destination and source cells.
+
+        Parameters
+        ----------
+        dest_grid : grid_like
+            Grid onto which cell values are mapped.
+        src_grid : grid_like
+            Grid from which cell values are taken.
+        workers : int, optional
+            Number of threads used to compute cell overlaps.
+        """
+        if not Conservative.test(dest_grid, src_grid):
+            raise IncompatibleGridError(dest_grid.name, src_grid.name)
+
+        dst_cells = _cell_vertices(dest_grid)
+        src_cells = _cell_vertices(src_grid)
+
+        self._dst_area = _cell_areas(dest_grid, dst_cells)
+        self._src_area = _cell_areas(src_grid, src_cells)
+
+        overlap = overlap_weights(dst_cells, src_cells, workers=kwds.get("workers"))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scale = np.where(self._dst_area > 0.0, 1.0 / self._dst_area, 0.0)
+        self._weights = csr_matrix(overlap.multiply(scale[:, np.newaxis]))
+
+    def conservation_error(self, src_values, dst_values):
+        """Relative difference in the global integrals of mapped values.
+
+        Parameters
+        ----------
+        src_values : ndarray
+            Values on the source cells.
+        dst_values : ndarray
+            Values mapped to the destination cells.
+
+        Returns
+        -------
+        float
+            Difference in the area-weighted sums of destination and source
+            values, relative to the source sum. The error is only expected
+            to be zero where each grid covers the other.
+        """
+        src_total = np.sum(np.ravel(src_values) * self._src_area)
+        dst_total = np.sum(np.ravel(dst_values) * self._dst_area)
+        if src_total == 0.0:
+            return float(dst_total)
+        return float((dst_total - src_total) / src_total)
+
+    @staticmethod
+    def test(dst_grid, src_grid):
+        """Test if grids are compatible with this mapper.
+
+        Both grids must be made up of polygonal cells.
+
+        Parameters
+        ----------
+        dst_grid : grid_like
+            Grid onto which cell values are mapped.
+        src_grid : grid_like
+            Grid from which cell values are taken.
+        """
+        return _has_polygon_cells(dst_grid) and _has_polygon_cells(src_grid)
@@ -0,0 +1,118 @@
+import numpy as np
+
+from ..grids.utils import grid_fingerprint, variable_fingerprint
+from .imapper import IGridMapper, IncompatibleGridError
+from .pointtopoint import copy_good_values
+
+
+class IdentityMapper(IGridMapper):
+    """Map values between grids that have the same geometry.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from pymt.grids.map import RectilinearMap
+    >>> from pymt.mappers.identity import IdentityMapper
+    >>> src = RectilinearMap([0, 1, 2], [0, 2])
+    >>> dst = RectilinearMap([0, 1, 2], [0, 2])
+    >>> IdentityMapper.test(dst, src)
+    True
+
+    Without a destination array, the source values are returned as is.
+
+    >>> mapper = IdentityMapper()
+    >>> mapper.initialize(dst, src)
+    >>> src_vals = np.arange(6.)
+    >>> mapper.run(src_vals) is src_vals
+    True
+
+    Otherwise, good values are copied into the destination.
+
+    >>> src_vals[2] = -999
+    >>> mapper.run(src_vals, dst_vals=np.full(6, -1.))
+    array([ 0.,  1., -1.,  3.,  4.,  5.])
+    """
+
+    _name = "Identity"
+
+    def initialize(self, dest_grid, src_grid, **kwds):
+        """Initialize the mapper.
+
+        Parameters
+        ----------
+        dest_grid : grid_like
+            Grid onto which values are mapped.
+        src_grid : grid_like
+            Grid from which values are mapped.
+        vars : iterable of tuples, optional
+            (*dest*, *src*) names of the variables to map.
+        """
+        var_names = kwds.get("vars") or kwds.get("var_names")
+        if not IdentityMapper.test(dest_grid, src_grid, vars=var_names):
+            raise IncompatibleGridError(dest_grid.name, src_grid.name)
+
+    def run(self, src_values, **kwds):
+        """Map source values onto destination values.
+
+        Parameters
+        ----------
+        src_values : ndarray
+            Source values.
+        dst_vals : ndarray, optional
+            Destination array into which good values are copied.
+        bad_val : float, optional
+            Value below which indicates a bad value.
+        copy : bool, optional
+            If no destination array is given, return a copy of the source
+            values rather than the source values themselves.
+
+        Returns
+        -------
+        ndarray
+            The destination values.
+        """
+        dst_vals = kwds.get("dst_vals", None)
+        bad_val = kwds.get("bad_val", -999)
+
+        if dst_vals is None:
+            if kwds.get("copy", False):
+                return np.array(src_values)
+            return src_values
+
+        return copy_good_values(src_values, dst_vals, bad_val=bad_val)
+
+    @staticmethod
+    def test(dst_grid, src_grid, vars=None):
+        """Test if two grids have the same geometry.
+
+        Parameters
+        ----------
+        dst_grid : grid_like
+            Grid onto which values are mapped.
+        src_grid : grid_like
+            Grid from which values are mapped.
+        vars : iterable of tuples, optional
+            (*dest*, *src*) names of variables to map. If given, each pair
+            of variables must be at the same location on grids with the
+            same geometry.
+
+        Returns
+        -------
+        bool
+            ``True`` if values can be passed through unchanged.
+        """
+        try:
+            if vars:
+                return all(
+                    variable_fingerprint(dst_grid, dst)
+                    == variable_fingerprint(src_grid, src)
+                    for dst, src in vars
+                )
+            return grid_fingerprint(dst_grid) == grid_fingerprint(src_grid)
+        except (AttributeError, TypeError, KeyError):
+            return False
+
+    @property
+    def name(self):
+        """Name of the grid mapper."""
+        return self._name
@@ -0,0 +1,206 @@
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from .imapper import IncompatibleGridError
+from .kdtree import get_kdtree, query_nearest
+from .pointtopoint import _query_points
+from .sparse import SparseMapper
+from .tracker import PointTracker
+
+
+def idw_weights(dist, ids, n_src, power=2.0):
+    """Inverse-distance weights of neighboring points.
+
+    Parameters
+    ----------
+    dist : ndarray of float, shape (n_dst, k)
+        Distances to the *k* nearest source points of each destination.
+    ids : ndarray of int, shape (n_dst, k)
+        Indices of the nearest source points.
+    n_src : int
+        Number of source points.
+    power : float, optional
+        Power of the distance to weight by.
+
+    Returns
+    -------
+    scipy.sparse.csr_matrix
+        Normalized weights with one row for each destination point. A
+        destination point that coincides with a source point takes that
+        source point's value.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from pymt.mappers.idw import idw_weights
+    >>> dist = np.array([[1., 1.], [0., 2.]])
+    >>> ids = np.array([[0, 1], [2, 1]])
+    >>> idw_weights(dist, ids, 3).toarray()
+    array([[0.5, 0.5, 0. ],
+           [0. , 0. , 1. ]])
+    """
+    (n_dst, k) = dist.shape
+
+    with np.errstate(divide="ignore"):
+        weights = 1.0 / dist**power
+
+    is_exact = dist == 0.0
+    on_point = is_exact.any(axis=1)
+    weights[on_point] = is_exact[on_point]
+    weights /= weights.sum(axis=1, keepdims=True)
+
+    return csr_matrix(
+        (weights.reshape((-1,)), ids.reshape((-1,)), np.arange(0, n_dst * k + 1, k)),
+        shape=(n_dst, n_src),
+    )
+
+
+class InverseDistance(SparseMapper):
+    """Map points with inverse-distance weighting of the nearest points.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from pymt.grids.map import RectilinearMap
+    >>> from pymt.mappers.idw import InverseDistance
+    >>> src = RectilinearMap([0, 1, 2], [0, 2])
+    >>> dst = RectilinearMap([0, 2], [1])
+
+    >>> mapper = InverseDistance()
+    >>> mapper.initialize(dst, src, k=2)
+    >>> mapper.run(np.arange(6.))
+    array([0.5, 4.5])
+
+    Bad values are excluded from the weighting.
+
+    >>> mapper.run(np.array([0., 1., 2., 3., -999., 5.]))
+    array([0.5, 5. ])
+    """
+
+    _name = "InverseDistance"
+
+    def initialize(self, dest_grid, src_grid, **kwds):
+        """Find the nearest source points and their weights.
+
+        Parameters
+        ----------
+        dest_grid : grid_like
+            Grid onto which points are mapped
+        src_grid : grid_like
+            Grid from which points are taken.
+        k : int, optional
+            Number of nearest source points to weight.
+        power : float, optional
+            Power of the distance to weight by.
+        var_names : iterable of tuples (optional)
+            Iterable of (*dest*, *src*) variable names.
+        tiles : int, optional
+            Compute weights for this many tiles of destination points
+            separately (see :mod:`pymt.mappers.tiled`). Tiles cannot be
+            used along with *var_names*.
+        max_workers : int, optional
+            Number of processes used to compute the weights of tiles.
+        """
+        k = kwds.get("k", 4)
+        if k < 1:
+            raise ValueError("k must be at least 1")
+
+        if not InverseDistance.test(dest_grid, src_grid):
+            raise IncompatibleGridError(dest_grid.name, src_grid.name)
+
+        if self._initialize_tiled(dest_grid, src_grid, **kwds):
+            self._tracker = None
+            return
+
+        (self._tree, x, y) = _query_points(dest_grid, src_grid, **kwds)
+        self._tracker = PointTracker(x, y)
+        self._power = kwds.get("power", 2.0)
+        self._k = min(k, self._tree.n)
+
+        (self._dist, self._ids) = self._query(x, y)
+        self._set_weights()
+
+    def update(self, dest_grid, src_grid, **kwds):
+        """Update the mapper after the nodes of either grid have moved.
+
+        If only destination points have moved, only their neighbors and
+        weights are found again. Otherwise, all points are weighted by the
+        moved source points.
+
+        Parameters
+        ----------
+        dest_grid : grid_like
+            Grid onto which points are mapped
+        src_grid : grid_like
+            Grid from which points are taken.
+        var_names : iterable of tuples (optional)
+            Iterable of (*dest*, *src*) variable names.
+        """
+        if self._tracker is None:
+            kwds = dict(self._tiled_kwds, **kwds)
+            return self.initialize(dest_grid, src_grid, **kwds)
+
+        (tree, x, y) = _query_points(dest_grid, src_grid, **kwds)
+        moved = self._tracker.update(x, y)
+
+        if moved is None or tree is not self._tree:
+            self._tree = tree
+            self._k = min(self._k, tree.n)
+            (self._dist, self._ids) = self._query(x, y)
+        elif len(moved) > 0:
+            (self._dist[moved], self._ids[moved]) = self._query(x[moved], y[moved])
+        else:
+            return
+        self._set_weights()
+
+    @classmethod
+    def point_weights(cls, src_grid, x, y, **kwds):
+        """Inverse-distance weights of destination points.
+
+        Parameters
+        ----------
+        src_grid : grid_like
+            Grid from which points are taken.
+        x, y : ndarray
+            Coordinates of the destination points.
+        k : int, optional
+            Number of nearest source points to weight.
+        power : float, optional
+            Power of the distance to weight by.
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+            Weights with one row for each destination point.
+        """
+        tree = get_kdtree(src_grid)
+        k = min(kwds.get("k", 4), tree.n)
+        (dist, ids) = query_nearest(tree, x, y, k=k)
+        return idw_weights(
+            np.reshape(dist, (-1, k)),
+            np.reshape(ids, (-1, k)),
+            tree.n,
+            power=kwds.get("power", 2.0),
+        )
+
+    def _query(self, x, y):
+        (dist, ids) = query_nearest(self._tree, x, y, k=self._k)
+        return np.reshape(dist, (-1, self._k)), np.reshape(ids, (-1, self._k))
+
+    def _set_weights(self):
+        self._weights = idw_weights(
+            self._dist, self._ids, self._tree.n, power=self._power
+        )
+
+    @staticmethod
+    def test(dst_grid, src_grid):
+        """Test if grids are compatible with this mapper.
+
+        Parameters
+        ----------
+        dst_grid : grid_like
+            Grid onto which points are mapped
+        src_grid : grid_like
+            Grid from which points are taken.
+        """
+        return dst_grid is not None and src_grid is not None
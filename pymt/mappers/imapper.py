@@ -38,3 +38,11 @@ class IGridMapper:
     def run(self, src_values, **kwds):
         """Map values on the source grid to the destination grid."""
         pass
+
+    def update(self, dest_grid, src_grid, **kwds):
+        """Update the mapper after the nodes of either grid have moved.
+
+        Mappers that can reuse their previous state override this method.
+        By default, the mapper is initialized again.
+        """
+        self.initialize(dest_grid, src_grid, **kwds)
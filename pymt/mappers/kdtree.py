@@ -0,0 +1,143 @@
+"""KD-trees of grid coordinates that are shared between mappers.
+
+Building a KD-tree of a large grid is one of the more expensive steps when
+initializing a mapper. Trees are therefore cached for each grid so that
+several mappers (or several variables) that use the same grid share a
+single tree. A cached tree is reused without looking at the points again
+if they are the same arrays as when it was built, unless the grid is
+dynamic. Otherwise, the tree is rebuilt only if the points have changed.
+
+Examples
+--------
+>>> import numpy as np
+>>> from pymt.grids.map import RectilinearMap
+>>> from pymt.mappers.kdtree import get_kdtree, query_nearest
+
+>>> grid = RectilinearMap([0, 1, 2], [0, 2])
+>>> tree = get_kdtree(grid)
+>>> tree is get_kdtree(grid)
+True
+
+>>> (dist, ids) = query_nearest(tree, [0.25, 1.75], [0.25, 1.25])
+>>> ids
+array([0, 3])
+"""
+
+import weakref
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from ..grids.assertions import is_dynamic
+from ..grids.dtypes import get_index_dtype
+from ..grids.utils import fingerprint_arrays
+
+_TREES = weakref.WeakKeyDictionary()
+
+
+def _as_points(x, y):
+    return np.column_stack((np.ravel(x), np.ravel(y)))
+
+
+def _same_buffer(array, other):
+    """Test if two arrays view the same memory in the same way."""
+    return array.__array_interface__ == other.__array_interface__
+
+
+def points_key(grid, name):
+    """Key of the points that the values of a variable are defined on.
+
+    Variables defined at the same location of the same grid have the
+    same key, and so share a tree.
+
+    Parameters
+    ----------
+    grid : grid_like
+        An object with grids, such as a component.
+    name : str
+        Name of a variable.
+
+    Returns
+    -------
+    hashable
+        The location and grid id of the variable, or its name if *grid*
+        does not say which grid the variable is defined on.
+    """
+    try:
+        grid_id = grid.get_var_grid(name)
+    except AttributeError:
+        return name
+
+    try:
+        location = grid.get_var_location(name)
+    except AttributeError:
+        location = "node"
+
+    return location, grid_id
+
+
+def get_kdtree(grid, x=None, y=None, key=None):
+    """Get a KD-tree for the points of a grid.
+
+    Parameters
+    ----------
+    grid : grid_like
+        The grid that the points belong to.
+    x, y : array_like, optional
+        Coordinates of the points. If not provided, use the grid's nodes.
+    key : hashable, optional
+        Identifier for *x* and *y* if they are not the grid's nodes
+        (see :func:`points_key`).
+
+    Returns
+    -------
+    scipy.spatial.cKDTree
+        A (possibly cached) tree of the points.
+    """
+    if x is None:
+        x = grid.get_x()
+    if y is None:
+        y = grid.get_y()
+
+    try:
+        trees = _TREES.setdefault(grid, {})
+    except TypeError:
+        trees = {}
+
+    (x, y) = (np.asarray(x), np.asarray(y))
+    try:
+        (tree, points, fingerprint) = trees[key]
+    except KeyError:
+        tree = None
+    else:
+        if not is_dynamic(grid) and all(map(_same_buffer, (x, y), points)):
+            return tree
+
+    new_fingerprint = fingerprint_arrays(np.ravel(x), np.ravel(y))
+    if tree is None or new_fingerprint != fingerprint:
+        tree = cKDTree(_as_points(x, y))
+    trees[key] = (tree, (x, y), new_fingerprint)
+
+    return tree
+
+
+def query_nearest(tree, x, y, **kwds):
+    """Find the nearest tree points to a set of points.
+
+    Parameters
+    ----------
+    tree : scipy.spatial.cKDTree
+        Tree to query.
+    x, y : array_like
+        Coordinates of the query points.
+
+    Returns
+    -------
+    (dist, ids) : tuple of ndarray
+        Distances to, and indices of, the nearest tree points. Indices are
+        of the grid index type (see :func:`pymt.grids.set_index_dtype`).
+        Additional keywords are passed along to :meth:`cKDTree.query`.
+    """
+    kwds.setdefault("workers", -1)
+    (dist, ids) = tree.query(_as_points(x, y), **kwds)
+    return dist, np.asarray(ids).astype(get_index_dtype(), copy=False)
@@ -36,7 +36,7 @@ array([0., 1., 2., 3., 4., 5.])
 
 >>> mappers = find_mapper(dst, src)
 >>> len(mappers)
-3
+7
 >>> mappers[0].name
 'PointToPoint'
 
@@ -150,12 +150,26 @@ A big mapper
 >>> assert_array_equal(dst_vals, src_vals)
 """
 
+from .bilinear import Bilinear
+from .binning import Binning
 from .celltopoint import CellToPoint
+from .conservative import Conservative
+from .identity import IdentityMapper
+from .idw import InverseDistance
 from .imapper import IncompatibleGridError
 from .pointtocell import PointToCell
 from .pointtopoint import NearestVal
 
-_MAPPERS = [NearestVal, CellToPoint, PointToCell]
+_MAPPERS = [
+    IdentityMapper,
+    NearestVal,
+    InverseDistance,
+    Bilinear,
+    CellToPoint,
+    PointToCell,
+    Binning,
+    Conservative,
+]
 
 
 def find_mapper(dst_grid, src_grid):
@@ -1,23 +1,97 @@
-from collections import defaultdict
-
 import numpy as np
-from scipy.spatial import KDTree
 
+from ..grids.dtypes import get_index_dtype
 from .imapper import IGridMapper, IncompatibleGridError
+from .kdtree import get_kdtree, query_nearest
 
 # from .mapper import IncompatibleGridError
 
+_METHOD_NAMES = {
+    np.mean: "mean",
+    np.sum: "sum",
+    np.min: "min",
+    np.amin: "min",
+    np.max: "max",
+    np.amax: "max",
+    len: "count",
+}
+
 
 def map_cells_to_points(coords, dst_grid, dst_point_ids, bad_val=-1):
+    """Find the destination cells that contain each source point.
+
+    Returns
+    -------
+    (cell_ids, point_ids) : tuple of ndarray of int
+        Pairs of cells and the source points they contain. A point that
+        lies on a border between cells is paired with each of the cells.
+    """
     src_x, src_y = coords
 
-    cell_to_point_id = defaultdict(list)
+    cell_ids, point_ids = [], []
     for j, point_id in enumerate(dst_point_ids):
         for cell_id in dst_grid.get_shared_cells(point_id):
             if dst_grid.is_in_cell(src_x[j], src_y[j], cell_id):
-                cell_to_point_id[cell_id].append(j)
-
-    return cell_to_point_id
+                cell_ids.append(cell_id)
+                point_ids.append(j)
+
+    return (
+        np.array(cell_ids, dtype=get_index_dtype()),
+        np.array(point_ids, dtype=get_index_dtype()),
+    )
+
+
+def reduce_segments(values, start, method="mean"):
+    """Reduce consecutive segments of an array.
+
+    Parameters
+    ----------
+    values : ndarray
+        Values to reduce, grouped into consecutive, non-empty segments.
+    start : ndarray of int
+        Index to the start of each segment.
+    method : str or callable, optional
+        One of 'mean', 'sum', 'min', 'max' or 'count', or a function that
+        reduces an array to a scalar. Functions other than the numpy
+        equivalents of the named reductions are applied segment by segment.
+
+    Returns
+    -------
+    ndarray
+        The reduced value of each segment.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from pymt.mappers.pointtocell import reduce_segments
+    >>> values = np.array([1.0, 2.0, 3.0, 10.0, 4.0, 6.0])
+    >>> start = np.array([0, 3, 4])
+    >>> reduce_segments(values, start)
+    array([ 2., 10.,  5.])
+    >>> reduce_segments(values, start, method=np.max)
+    array([ 3., 10.,  6.])
+    >>> reduce_segments(values, start, method="count")
+    array([3, 1, 2])
+    >>> reduce_segments(values, start, method=np.median)
+    array([ 2., 10.,  5.])
+    """
+    method = _METHOD_NAMES.get(method, method)
+
+    if method == "count" or method == "mean":
+        count = np.diff(start, append=len(values))
+        if method == "count":
+            return count
+        return np.add.reduceat(values, start) / count
+    elif method == "sum":
+        return np.add.reduceat(values, start)
+    elif method == "min":
+        return np.minimum.reduceat(values, start)
+    elif method == "max":
+        return np.maximum.reduceat(values, start)
+    elif callable(method):
+        return np.array([method(segment) for segment in np.split(values, start[1:])])
+    else:
+        raise ValueError(f"{method}: reduction method not understood")
 
 
 class PointToCell(IGridMapper):
@@ -29,13 +103,18 @@ class PointToCell(IGridMapper):
         src_x = src_grid.get_x()
         src_y = src_grid.get_y()
 
-        tree = KDTree(list(zip(dest_grid.get_x(), dest_grid.get_y())))
-        (_, nearest_dest_id) = tree.query(list(zip(src_x, src_y)))
+        tree = get_kdtree(dest_grid)
+        (_, nearest_dest_id) = query_nearest(tree, src_x, src_y)
 
-        self._map = map_cells_to_points(
+        (cell_ids, point_ids) = map_cells_to_points(
             (src_x, src_y), dest_grid, nearest_dest_id, bad_val=-1
         )
 
+        order = np.argsort(cell_ids, kind="stable")
+        (cell_ids, self._point_ids) = (cell_ids[order], point_ids[order])
+
+        (self._cell_ids, self._cell_start) = np.unique(cell_ids, return_index=True)
+
         self._dst_cell_count = dest_grid.get_cell_count()
         self._src_point_count = src_grid.get_point_count()
 
@@ -48,13 +127,19 @@ class PointToCell(IGridMapper):
             raise ValueError("size mismatch between source and point count")
 
         if dst_vals is None:
-            dst_vals = np.array([bad_val] * self._dst_cell_count, dtype=float)
+            dst_vals = np.full(self._dst_cell_count, bad_val, dtype=float)
         if dst_vals.size != self._dst_cell_count:
             raise ValueError("size mismatch between destination and cell count")
 
-        for cell_id, point_ids in self._map.items():
-            if all(src_values[point_ids] > bad_val):
-                dst_vals[cell_id] = method(src_values[point_ids])
+        if len(self._cell_ids) == 0:
+            return dst_vals
+
+        values = src_values.reshape((-1,)).take(self._point_ids)
+
+        is_good = ~np.logical_or.reduceat(~(values > bad_val), self._cell_start)
+
+        reduced = reduce_segments(values, self._cell_start, method=method)
+        dst_vals[self._cell_ids[is_good]] = reduced[is_good]
 
         return dst_vals
 
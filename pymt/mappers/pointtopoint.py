@@ -1,7 +1,8 @@
 import numpy as np
-from scipy.spatial import KDTree
 
 from .imapper import IGridMapper, IncompatibleGridError
+from .kdtree import get_kdtree, points_key, query_nearest
+from .tracker import PointTracker
 
 # from .mapper import IncompatibleGridError
 
@@ -53,6 +54,31 @@ def copy_good_values(src, dst, bad_val=-999):
     return dst
 
 
+def _query_points(dest_grid, src_grid, **kwds):
+    """The KD-tree of source points, and the destination points to query."""
+    var_names = kwds.get("var_names", None)
+    if var_names is None:
+        var_names = []
+
+    if len(var_names) > 1:
+        raise ValueError("only 0 or 1 var_names allowed")
+
+    if len(var_names) == 0:
+        tree = get_kdtree(src_grid)
+        (x, y) = dest_grid.get_x(), dest_grid.get_y()
+    else:
+        dst_name, src_name = var_names[0]
+        tree = get_kdtree(
+            src_grid,
+            src_grid.get_x(src_name),
+            src_grid.get_y(src_name),
+            key=points_key(src_grid, src_name),
+        )
+        (x, y) = (dest_grid.get_x(dst_name), dest_grid.get_y(dst_name))
+
+    return tree, np.ravel(x), np.ravel(y)
+
+
 class NearestVal(IGridMapper):
     """
     Examples
@@ -82,31 +108,37 @@ class NearestVal(IGridMapper):
         var_names : iterable of tuples (optional)
             Iterable of (*dest*, *src*) variable names.
         """
-        var_names = kwds.get("var_names", None)
-        if var_names is None:
-            var_names = []
-
-        if len(var_names) > 1:
-            raise ValueError("only 0 or 1 var_names allowed")
-
         if not NearestVal.test(dest_grid, src_grid):
             raise IncompatibleGridError(dest_grid.name, src_grid.name)
 
-        if len(var_names) == 0:
-            (x, y) = src_grid.get_x().flat, src_grid.get_y().flat
-        else:
-            dst_name, src_name = var_names[0]
-            (x, y) = (src_grid.get_x(src_name).flat, src_grid.get_y(src_name).flat)
+        (self._tree, x, y) = _query_points(dest_grid, src_grid, **kwds)
+        self._tracker = PointTracker(x, y)
 
-        tree = KDTree(list(zip(x, y)))
+        (_, self._nearest_src_id) = query_nearest(self._tree, x, y)
 
-        if len(var_names) == 0:
-            (x, y) = dest_grid.get_x().flat, dest_grid.get_y().flat
-        else:
-            dst_name, src_name = var_names[0]
-            (x, y) = (dest_grid.get_x(dst_name).flat, dest_grid.get_y(dst_name).flat)
+    def update(self, dest_grid, src_grid, **kwds):
+        """Update the mapper after the nodes of either grid have moved.
 
-        (_, self._nearest_src_id) = tree.query(list(zip(x, y)))
+        If only destination points have moved, only they are mapped again.
+        Otherwise, all points are mapped to the moved source points.
+
+        Parameters
+        ----------
+        dest_grid : grid_like
+            Grid onto which points are mapped
+        src_grid : grid_like
+            Grid from which points are taken.
+        var_names : iterable of tuples (optional)
+            Iterable of (*dest*, *src*) variable names.
+        """
+        (tree, x, y) = _query_points(dest_grid, src_grid, **kwds)
+        moved = self._tracker.update(x, y)
+
+        if moved is None or tree is not self._tree:
+            (_, self._nearest_src_id) = query_nearest(tree, x, y)
+        elif len(moved) > 0:
+            (_, self._nearest_src_id[moved]) = query_nearest(tree, x[moved], y[moved])
+        self._tree = tree
 
     def run(self, src_values, **kwds):
         """Map source values onto destination values.
@@ -0,0 +1,178 @@
+"""Map values between grids whose elements are ordered along a curve.
+
+The nodes and cells of unstructured grids are reordered along a
+space-filling curve (see :mod:`pymt.grids.ordering`) before a mapper is
+initialized, so that the mapper's spatial queries and its weights work
+on elements that are close together in memory. Values passed to, and
+returned from, the mapper stay in the order of the original grids.
+
+For sparse mappers, the permutation of the source grid is folded into
+the column indices of the weights so that source values are gathered,
+in their original order, as part of the sparse product. Rows remain in
+curve order, and mapped values are scattered back to the original order
+of the destination grid.
+
+Examples
+--------
+>>> import numpy as np
+>>> from pymt.grids.map import UnstructuredPointsMap
+>>> from pymt.mappers import InverseDistance
+>>> from pymt.mappers.reordered import ReorderedMapper
+
+>>> src = UnstructuredPointsMap([1.0, 0.0, 1.0, 0.0], [0.0, 0.0, 1.0, 1.0])
+>>> dst = UnstructuredPointsMap([0.9, 0.1], [0.1, 0.9])
+
+>>> mapper = ReorderedMapper(InverseDistance())
+>>> mapper.initialize(dst, src, k=1)
+>>> mapper.run(np.array([0.0, 1.0, 2.0, 3.0]))
+array([0., 3.])
+"""
+
+import numpy as np
+
+from ..grids.ordering import reorder_grid
+from .imapper import IGridMapper
+from .sparse import weighted_sum
+
+
+def _element_order(size, orders):
+    """The order of a grid's nodes or cells, whichever has *size* elements.
+
+    Values are taken to be on nodes if a grid has as many nodes as
+    cells.
+    """
+    (n_points, node_order, n_cells, cell_order) = orders
+    if size == n_points:
+        return node_order
+    elif size == n_cells:
+        return cell_order
+    else:
+        raise ValueError("size mismatch between values and grid")
+
+
+def _reorder(grid, curve):
+    (reordered, node_order, cell_order) = reorder_grid(grid, curve=curve)
+    try:
+        n_cells = grid.get_cell_count()
+    except AttributeError:
+        n_cells = None
+    return reordered, (grid.get_point_count(), node_order, n_cells, cell_order)
+
+
+class ReorderedMapper(IGridMapper):
+    """Map values with grids that are reordered along a space-filling curve.
+
+    Parameters
+    ----------
+    mapper : IGridMapper
+        The mapper that maps values between the reordered grids.
+    curve : {'hilbert', 'morton'}, optional
+        The space-filling curve.
+    """
+
+    def __init__(self, mapper, curve="hilbert"):
+        self._mapper = mapper
+        self._curve = curve
+        self._dst_orders = None
+        self._src_orders = None
+        self._weights = None
+
+    def initialize(self, dest_grid, src_grid, **kwds):
+        """Reorder the grids and initialize the mapper with them.
+
+        Parameters
+        ----------
+        dest_grid : grid_like
+            Grid onto which values are mapped.
+        src_grid : grid_like
+            Grid from which values are taken.
+        **kwds
+            Keywords passed to the underlying mapper.
+        """
+        (dst, self._dst_orders) = _reorder(dest_grid, self._curve)
+        (src, self._src_orders) = _reorder(src_grid, self._curve)
+
+        self._mapper.initialize(dst, src, **kwds)
+        self._fuse_weights()
+
+    def update(self, dest_grid, src_grid, **kwds):
+        """Update the mapper after the nodes of the grids have moved."""
+        (dst, self._dst_orders) = _reorder(dest_grid, self._curve)
+        (src, self._src_orders) = _reorder(src_grid, self._curve)
+
+        self._mapper.update(dst, src, **kwds)
+        self._fuse_weights()
+
+    def _fuse_weights(self):
+        """Fold the source permutation into the weights of a sparse mapper."""
+        try:
+            weights = self._mapper.weights
+        except AttributeError:
+            self._weights = None
+            return
+
+        src_order = _element_order(weights.shape[1], self._src_orders)
+        if src_order is not None:
+            weights = weights.copy()
+            weights.indices = src_order[weights.indices].astype(
+                weights.indices.dtype, copy=False
+            )
+            weights.has_sorted_indices = False
+        self._weights = weights
+
+    def run(self, src_values, **kwds):
+        """Map source values onto destination values.
+
+        Parameters
+        ----------
+        src_values : ndarray
+            Source values, in the order of the original source grid.
+        dst_vals : ndarray, optional
+            Destination array, in the order of the original destination
+            grid.
+        bad_val : float, optional
+            Value below which indicates a bad value.
+
+        Returns
+        -------
+        ndarray
+            The (possibly newly-created) destination array.
+        """
+        dst_vals = kwds.get("dst_vals", None)
+        bad_val = kwds.get("bad_val", -999)
+
+        src_values = np.ravel(src_values)
+
+        if self._weights is not None:
+            if src_values.size != self._weights.shape[1]:
+                raise ValueError("size mismatch between source values and mapper")
+            (mapped, has_values) = weighted_sum(
+                self._weights, src_values, src_values > bad_val
+            )
+            n_dst = self._weights.shape[0]
+        else:
+            src_order = _element_order(src_values.size, self._src_orders)
+            if src_order is not None:
+                src_values = src_values[src_order]
+
+            mapped = self._mapper.run(src_values, bad_val=bad_val).reshape((-1,))
+            has_values = mapped > bad_val
+            n_dst = mapped.size
+
+        if dst_vals is None:
+            dst_vals = np.full(n_dst, bad_val, dtype=float)
+        elif dst_vals.size != n_dst:
+            raise ValueError("size mismatch between destination values and mapper")
+
+        dst_order = _element_order(n_dst, self._dst_orders)
+        if dst_order is None:
+            dst_vals.reshape((-1,))[has_values] = mapped[has_values]
+        else:
+            dst_vals.reshape((-1,))[dst_order[has_values]] = mapped[has_values]
+
+        return dst_vals
+
+    @property
+    def name(self):
+        """Name of the grid mapper."""
+        return f"Reordered{self._mapper.name}"
@@ -0,0 +1,207 @@
+"""Mappers that are a sparse, linear operator.
+
+Many mappers reduce to a weighted sum of source values for each
+destination point. These mappers compute their weights once, when they
+are initialized, and store them as a CSR matrix with one row for each
+destination element and one column for each source element. Mapping
+values is then a single sparse matrix-vector product.
+
+Examples
+--------
+>>> import numpy as np
+>>> from scipy.sparse import csr_matrix
+>>> from pymt.mappers.sparse import apply_weights
+
+>>> weights = csr_matrix([[.5, .5, 0.], [0., .25, .75]])
+>>> apply_weights(weights, np.array([1., 3., 5.]))
+array([2. , 4.5])
+
+Bad source values are dropped and the remaining weights of each row
+rescaled to the row's original total.
+
+>>> apply_weights(weights, np.array([1., -999., 5.]), bad_val=-999)
+array([1., 5.])
+>>> apply_weights(weights, np.array([1., -999., -999.]), bad_val=-999)
+array([   1., -999.])
+"""
+
+import numpy as np
+
+from .imapper import IGridMapper
+from .tiled import tiled_weights
+
+
+def weighted_sum(weights, src_values, is_good):
+    """Weighted sums of good source values.
+
+    Parameters
+    ----------
+    weights : scipy.sparse.csr_matrix
+        Weights with one row for each destination element.
+    src_values : ndarray
+        Source values, either one value for each source element or, to
+        map several components in a single product, one row of values for
+        each source element.
+    is_good : ndarray of bool
+        Source elements whose values are good.
+
+    Returns
+    -------
+    tuple of ndarray
+        The mapped values and, for each destination element, if it has
+        any good source values. The weights of good source values are
+        rescaled to the row's original total.
+    """
+    if is_good.all():
+        mapped = weights @ src_values
+        has_values = np.diff(weights.indptr) > 0
+    else:
+        weight_sum = weights @ is_good.astype(float)
+        has_values = weight_sum > 0.0
+        mapped = weights @ np.where(
+            is_good.reshape((-1,) + (1,) * (src_values.ndim - 1)), src_values, 0.0
+        )
+        scale = weights.sum(axis=1).A1[has_values] / weight_sum[has_values]
+        mapped[has_values] *= scale.reshape((-1,) + (1,) * (mapped.ndim - 1))
+
+    return mapped, has_values
+
+
+def apply_weights(weights, src_values, dst_vals=None, bad_val=-999):
+    """Map source values with a matrix of weights.
+
+    Parameters
+    ----------
+    weights : scipy.sparse.csr_matrix
+        Weights with one row for each destination element.
+    src_values : ndarray
+        Source values.
+    dst_vals : ndarray, optional
+        Destination array. Elements that have no good source values are
+        left unchanged.
+    bad_val : float, optional
+        Value below which indicates a bad value.
+
+    Returns
+    -------
+    ndarray
+        The (possibly newly-created) destination array. If newly-created,
+        elements without good source values are set to *bad_val*.
+    """
+    src_values = np.ravel(src_values)
+    if src_values.size != weights.shape[1]:
+        raise ValueError("size mismatch between source values and mapper")
+
+    if dst_vals is None:
+        dst_vals = np.full(weights.shape[0], bad_val, dtype=float)
+    elif dst_vals.size != weights.shape[0]:
+        raise ValueError("size mismatch between destination values and mapper")
+
+    (mapped, has_values) = weighted_sum(weights, src_values, src_values > bad_val)
+
+    dst_vals.reshape((-1,))[has_values] = mapped[has_values]
+
+    return dst_vals
+
+
+class SparseMapper(IGridMapper):
+    """Base class for mappers that are a sparse matrix of weights.
+
+    Subclasses set the ``_weights`` attribute when they are initialized.
+    Subclasses whose weights for each destination point depend only on
+    that point's coordinates also implement :meth:`point_weights`, which
+    allows their weights to be computed tile by tile (see
+    :mod:`pymt.mappers.tiled`).
+    """
+
+    _name = None
+    _weights = None
+    _tiled_kwds = None
+
+    @classmethod
+    def point_weights(cls, src_grid, x, y, **kwds):
+        """Weights of destination points.
+
+        Parameters
+        ----------
+        src_grid : grid_like
+            Grid from which points are taken.
+        x, y : ndarray
+            Coordinates of the destination points.
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+            Weights with one row for each destination point.
+        """
+        raise NotImplementedError("point_weights")
+
+    def _initialize_tiled(self, dest_grid, src_grid, **kwds):
+        """Compute weights tile by tile, if the *tiles* keyword is given.
+
+        Returns
+        -------
+        bool
+            ``True`` if the weights were computed by tiles.
+
+        Raises
+        ------
+        ValueError
+            If tiles are asked for along with *var_names*.
+        """
+        n_tiles = kwds.pop("tiles", None)
+        max_workers = kwds.pop("max_workers", None)
+        if n_tiles is None and max_workers is None:
+            self._tiled_kwds = None
+            return False
+
+        if kwds.get("var_names") is not None:
+            raise ValueError("tiles and max_workers cannot be used with var_names")
+
+        self._weights = tiled_weights(
+            type(self),
+            dest_grid,
+            src_grid,
+            n_tiles=n_tiles,
+            max_workers=max_workers,
+            **kwds,
+        )
+        self._tiled_kwds = dict(kwds, tiles=n_tiles, max_workers=max_workers)
+
+        return True
+
+    def run(self, src_values, **kwds):
+        """Map source values onto destination values.
+
+        Parameters
+        ----------
+        src_values : ndarray
+            Source values.
+        dst_vals : ndarray, optional
+            Destination array to put mapped values.
+        bad_val : float, optional
+            Value below which indicates a bad value.
+
+        Returns
+        -------
+        ndarray
+            The (possibly newly-created) destination array.
+        """
+        return apply_weights(
+            self.weights,
+            src_values,
+            dst_vals=kwds.get("dst_vals", None),
+            bad_val=kwds.get("bad_val", -999),
+        )
+
+    @property
+    def weights(self):
+        """Matrix of weights as a CSR matrix."""
+        if self._weights is None:
+            raise RuntimeError("mapper has not been initialized")
+        return self._weights
+
+    @property
+    def name(self):
+        """Name of the grid mapper."""
+        return self._name
@@ -0,0 +1,312 @@
+"""Compute the weights of sparse mappers tile by tile.
+
+Initializing a mapper between very large grids can take a long time and,
+because all of the destination points are located at once, a lot of
+memory. Destination points are instead split into spatially-compact
+tiles whose weights are computed separately (in parallel, if several
+worker processes are used) and then stitched back together into a single
+CSR matrix. The coordinates of the source grid are placed in shared
+memory so that they are not copied to each of the workers.
+
+Examples
+--------
+>>> import numpy as np
+>>> from pymt.grids.map import RectilinearMap
+>>> from pymt.mappers.tiled import spatial_tiles
+
+>>> grid = RectilinearMap([0., 1., 2., 3.], [0., 1., 2., 3.])
+>>> for tile in spatial_tiles(grid.get_x(), grid.get_y(), 4):
+...     print(tile)
+[0 1 4 5]
+[2 3 6 7]
+[ 8  9 12 13]
+[10 11 14 15]
+"""
+
+import collections
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import scipy.sparse
+
+from ..grids.assertions import is_rectilinear, is_structured, is_uniform_rectilinear
+
+_WORKER_GRIDS = {}
+
+
+def spatial_tiles(x, y, n_tiles):
+    """Split points into tiles of nearby points.
+
+    Points are binned into a regular grid of (about) *n_tiles* tiles that
+    covers their bounding box.
+
+    Parameters
+    ----------
+    x, y : array_like
+        Coordinates of the points.
+    n_tiles : int
+        Number of tiles to split the points into.
+
+    Returns
+    -------
+    list of ndarray of int
+        Indices of the points in each non-empty tile.
+    """
+    (x, y) = (np.ravel(x), np.ravel(y))
+    if n_tiles < 1:
+        raise ValueError("number of tiles must be at least 1")
+    if len(x) == 0:
+        return []
+
+    n_per_side = int(np.ceil(np.sqrt(n_tiles)))
+
+    def _bin(coords):
+        (lower, upper) = (np.nanmin(coords), np.nanmax(coords))
+        if not upper > lower:
+            return np.zeros(len(coords), dtype=int)
+        position = (coords - lower) * (n_per_side / (upper - lower))
+        position = np.nan_to_num(position, nan=0.0)
+        return np.clip(position.astype(int), 0, n_per_side - 1)
+
+    tile = _bin(y) * n_per_side + _bin(x)
+
+    order = np.argsort(tile, kind="stable")
+    boundaries = np.flatnonzero(np.diff(tile[order])) + 1
+
+    return np.split(order, boundaries)
+
+
+def _share_array(array, blocks):
+    array = np.ascontiguousarray(array)
+    block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+    blocks.append(block)
+    return (block.name, array.shape, array.dtype.str)
+
+
+def _attach_array(spec, blocks):
+    (name, shape, dtype) = spec
+    try:
+        block = shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        block = shared_memory.SharedMemory(name=name)
+    blocks.append(block)
+    return np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+
+def share_grid(grid, blocks):
+    """Describe a grid with its coordinates in shared memory.
+
+    Parameters
+    ----------
+    grid : grid_like
+        The grid to share.
+    blocks : list
+        List to which newly-created shared memory blocks are appended. The
+        caller must close and unlink these when they are no longer needed.
+
+    Returns
+    -------
+    dict
+        Description of the grid that is passed to worker processes.
+    """
+    spec = {
+        "x": _share_array(np.ravel(grid.get_x()), blocks),
+        "y": _share_array(np.ravel(grid.get_y()), blocks),
+    }
+    if is_structured(grid, strict=False):
+        spec["shape"] = tuple(grid.get_shape())
+    if is_uniform_rectilinear(grid):
+        spec["spacing"] = tuple(grid.get_spacing())
+        spec["origin"] = tuple(grid.get_origin())
+    elif is_rectilinear(grid, strict=False):
+        spec["axes"] = tuple(
+            np.asarray(grid.get_axis_coordinates(axis=axis)) for axis in (0, 1)
+        )
+    return spec
+
+
+class SharedPoints:
+    """Points of a grid whose coordinates are in shared memory."""
+
+    def __init__(self, spec):
+        self._blocks = []
+        self._x = _attach_array(spec["x"], self._blocks)
+        self._y = _attach_array(spec["y"], self._blocks)
+
+    def get_x(self):
+        return self._x
+
+    def get_y(self):
+        return self._y
+
+    def get_point_count(self):
+        return len(self._x)
+
+    def close(self):
+        (self._x, self._y) = (None, None)
+        for block in self._blocks:
+            block.close()
+
+
+class SharedStructured(SharedPoints):
+    """Nodes of a structured grid whose coordinates are in shared memory."""
+
+    def __init__(self, spec):
+        super().__init__(spec)
+        self._shape = np.array(spec["shape"])
+
+    def get_shape(self):
+        return self._shape
+
+
+class SharedRectilinear(SharedStructured):
+    """Nodes of a rectilinear grid whose coordinates are in shared memory."""
+
+    def __init__(self, spec):
+        super().__init__(spec)
+        self._axes = spec["axes"]
+
+    def get_axis_coordinates(self, axis=None):
+        if axis is None:
+            return self._axes
+        return self._axes[axis]
+
+    def get_xyz_coordinates(self):
+        return self._axes
+
+
+class SharedUniformRectilinear(SharedStructured):
+    """Nodes of a uniform rectilinear grid whose coordinates are in shared memory."""
+
+    def __init__(self, spec):
+        super().__init__(spec)
+        self._spacing = np.array(spec["spacing"])
+        self._origin = np.array(spec["origin"])
+
+    def get_spacing(self):
+        return self._spacing
+
+    def get_origin(self):
+        return self._origin
+
+    def get_axis_coordinates(self, axis=None):
+        axes = tuple(
+            self._origin[dim] + self._spacing[dim] * np.arange(self._shape[dim])
+            for dim in range(len(self._shape))
+        )
+        if axis is None:
+            return axes
+        return axes[axis]
+
+    def get_xyz_coordinates(self):
+        return self.get_axis_coordinates()
+
+
+def attach_grid(spec):
+    """Create a grid from its description in shared memory.
+
+    Parameters
+    ----------
+    spec : dict
+        Description of a grid created with :func:`share_grid`.
+
+    Returns
+    -------
+    SharedPoints
+        A grid whose coordinates are views of the shared memory.
+    """
+    if "spacing" in spec:
+        return SharedUniformRectilinear(spec)
+    elif "axes" in spec:
+        return SharedRectilinear(spec)
+    elif "shape" in spec:
+        return SharedStructured(spec)
+    else:
+        return SharedPoints(spec)
+
+
+def _tile_weights(mapper_class, spec, x, y, kwds):
+    """Weights of a tile of destination points, run by a worker."""
+    try:
+        src_grid = _WORKER_GRIDS[spec["x"][0]]
+    except KeyError:
+        for grid in _WORKER_GRIDS.values():
+            grid.close()
+        _WORKER_GRIDS.clear()
+        src_grid = _WORKER_GRIDS[spec["x"][0]] = attach_grid(spec)
+
+    return mapper_class.point_weights(src_grid, x, y, **kwds)
+
+
+def tiled_weights(
+    mapper_class, dest_grid, src_grid, n_tiles=None, max_workers=None, **kwds
+):
+    """Compute the weights of a sparse mapper, tile by tile.
+
+    Parameters
+    ----------
+    mapper_class : type
+        A :class:`~pymt.mappers.sparse.SparseMapper` that implements
+        ``point_weights``.
+    dest_grid : grid_like
+        Grid onto which points are mapped.
+    src_grid : grid_like
+        Grid from which points are taken.
+    n_tiles : int, optional
+        Number of tiles to split the destination points into. The default
+        is four tiles for each worker.
+    max_workers : int, optional
+        Number of worker processes. If 1, tiles are processed, one after
+        another, in the current process. The default is the number of
+        processors. At most two tiles for each worker are handed to the
+        workers at a time.
+    **kwds
+        Keyword arguments passed to the mapper's ``point_weights``.
+
+    Returns
+    -------
+    scipy.sparse.csr_matrix
+        Weights with one row for each destination point and one column for
+        each source point.
+    """
+    (x, y) = (np.ravel(dest_grid.get_x()), np.ravel(dest_grid.get_y()))
+    n_src = np.size(src_grid.get_x())
+
+    max_workers = max_workers or os.cpu_count() or 1
+    tiles = spatial_tiles(x, y, n_tiles or 4 * max_workers)
+    if len(tiles) == 0:
+        return scipy.sparse.csr_matrix((0, n_src))
+
+    if max_workers == 1:
+        parts = [
+            mapper_class.point_weights(src_grid, x[tile], y[tile], **kwds)
+            for tile in tiles
+        ]
+    else:
+        blocks = []
+        try:
+            spec = share_grid(src_grid, blocks)
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                parts = []
+                futures = collections.deque()
+                for tile in tiles:
+                    if len(futures) == 2 * max_workers:
+                        parts.append(futures.popleft().result())
+                    futures.append(
+                        executor.submit(
+                            _tile_weights, mapper_class, spec, x[tile], y[tile], kwds
+                        )
+                    )
+                parts += [future.result() for future in futures]
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+
+    order = np.empty(len(x), dtype=int)
+    order[np.concatenate(tiles)] = np.arange(len(x))
+
+    return scipy.sparse.vstack(parts, format="csr")[order]
@@ -0,0 +1,70 @@
+"""Track points that move between updates of a mapper.
+
+Examples
+--------
+>>> import numpy as np
+>>> from pymt.mappers.tracker import PointTracker
+
+>>> tracker = PointTracker([0.0, 1.0, 2.0], [0.0, 0.0, 0.0])
+>>> tracker.update([0.0, 1.5, 2.0], [0.0, 0.0, 0.0])
+array([1])
+>>> tracker.update([0.0, 1.5, 2.0], [0.0, 0.0, 0.0])
+array([], dtype=int64)
+
+If the number of points changes, there is no point-by-point correspondence.
+
+>>> tracker.update([0.0, 1.0], [0.0, 0.0]) is None
+True
+"""
+
+import numpy as np
+
+
+class PointTracker:
+    """Coordinates of a set of points.
+
+    Parameters
+    ----------
+    x, y : array_like
+        Coordinates of the points.
+    """
+
+    def __init__(self, x, y):
+        self._x = np.array(x, dtype=float).reshape((-1,))
+        self._y = np.array(y, dtype=float).reshape((-1,))
+
+    @property
+    def x(self):
+        """x-coordinates of the points."""
+        return self._x
+
+    @property
+    def y(self):
+        """y-coordinates of the points."""
+        return self._y
+
+    def update(self, x, y):
+        """Update the coordinates of the points.
+
+        Parameters
+        ----------
+        x, y : array_like
+            New coordinates of the points.
+
+        Returns
+        -------
+        ndarray of int or None
+            Indices of the points that moved, or ``None`` if the number of
+            points changed.
+        """
+        x = np.array(x, dtype=float).reshape((-1,))
+        y = np.array(y, dtype=float).reshape((-1,))
+
+        if x.size != self._x.size:
+            moved = None
+        else:
+            moved = np.flatnonzero((x != self._x) | (y != self._y))
+
+        (self._x, self._y) = (x, y)
+
+        return moved
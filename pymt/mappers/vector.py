@@ -0,0 +1,244 @@
+"""Map the components of vector fields together.
+
+The two components of a vector (the x and y components of a velocity,
+for instance) are mapped with a single product of a sparse matrix of
+weights and a two-column array of values, rather than as two independent
+scalars.
+
+On a curvilinear (strictly structured) grid, vector components are
+taken to be along the grid's local axes: the first component along
+increasing column index and the second along increasing row index. Such
+components are rotated to eastward and northward components before they
+are mapped, and then rotated onto the axes of the destination grid. The
+angles of both grids are found when the mapper is initialized.
+
+Examples
+--------
+>>> import numpy as np
+>>> from pymt.grids.map import StructuredMap, UniformRectilinearMap
+>>> from pymt.mappers import InverseDistance
+>>> from pymt.mappers.vector import VectorMapper, grid_angles
+
+A grid rotated by 90 degrees, so that its columns run northward.
+
+>>> src = UniformRectilinearMap((2, 3), (1.0, 1.0), (0.0, 0.0))
+>>> dst = StructuredMap(src.get_x(), -src.get_y(), (2, 3))
+>>> np.degrees(grid_angles(dst))
+array([90., 90., 90., 90., 90., 90.])
+
+An eastward vector on the source grid is, on the destination grid,
+along decreasing row index.
+
+>>> mapper = VectorMapper(InverseDistance())
+>>> mapper.initialize(dst, src, k=1)
+>>> (u, v) = mapper.run((np.ones(6), np.zeros(6)))
+>>> np.round(u, 6) + 0.0, np.round(v, 6) + 0.0
+(array([0., 0., 0., 0., 0., 0.]), array([-1., -1., -1., -1., -1., -1.]))
+"""
+
+import numpy as np
+
+from ..grids.assertions import is_structured
+from .imapper import IGridMapper
+from .sparse import weighted_sum
+
+
+def grid_angles(grid):
+    """Angles of the local axes of a curvilinear grid.
+
+    Parameters
+    ----------
+    grid : grid_like
+        A grid.
+
+    Returns
+    -------
+    ndarray or None
+        Angle, in radians counter-clockwise from east, of the direction
+        of increasing column index at each node of a 2D curvilinear
+        grid. ``None`` if the grid is not curvilinear, in which case
+        vector components are eastward and northward.
+    """
+    if not is_structured(grid, strict=True):
+        return None
+
+    shape = tuple(grid.get_shape())
+    if len(shape) != 2 or shape[1] < 2:
+        return None
+
+    x = np.asarray(grid.get_x(), dtype=float).reshape(shape)
+    y = np.asarray(grid.get_y(), dtype=float).reshape(shape)
+
+    return np.arctan2(np.gradient(y, axis=1), np.gradient(x, axis=1)).reshape((-1,))
+
+
+def rotate(u, v, angle):
+    """Rotate the components of vectors counter-clockwise.
+
+    Parameters
+    ----------
+    u, v : ndarray
+        Components of the vectors.
+    angle : tuple of ndarray
+        Cosine and sine of the angles of rotation.
+
+    Returns
+    -------
+    tuple of ndarray
+        The rotated components.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from pymt.mappers.vector import rotate
+    >>> rotate(np.array([1.0]), np.array([2.0]), (np.array([0.0]), np.array([1.0])))
+    (array([-2.]), array([1.]))
+    """
+    (cos, sin) = angle
+    return u * cos - v * sin, u * sin + v * cos
+
+
+class VectorMapper(IGridMapper):
+    """Map the two components of vectors together.
+
+    Parameters
+    ----------
+    mapper : IGridMapper
+        Mapper used to map values between the grids. If it is a
+        :class:`~pymt.mappers.sparse.SparseMapper`, both components are
+        mapped with a single sparse product.
+    """
+
+    def __init__(self, mapper):
+        self._mapper = mapper
+        self._src_angle = None
+        self._dst_angle = None
+        self._dst_size = None
+
+    def initialize(self, dest_grid, src_grid, **kwds):
+        """Initialize the mapper and find the angles of the grids.
+
+        Parameters
+        ----------
+        dest_grid : grid_like
+            Grid onto which vectors are mapped.
+        src_grid : grid_like
+            Grid from which vectors are taken.
+        rotate : bool, optional
+            If ``False``, do not rotate vector components.
+        **kwds
+            Other keywords are passed to the underlying mapper.
+        """
+        rotate = kwds.pop("rotate", True)
+        self._mapper.initialize(dest_grid, src_grid, **kwds)
+        self.set_rotation(dest_grid, src_grid, rotate=rotate)
+
+    def update(self, dest_grid, src_grid, **kwds):
+        """Update the mapper, and grid angles, after grid nodes have moved."""
+        rotate = kwds.pop("rotate", True)
+        self._mapper.update(dest_grid, src_grid, **kwds)
+        self.set_rotation(dest_grid, src_grid, rotate=rotate)
+
+    def set_rotation(self, dest_grid, src_grid, rotate=True):
+        """Find the angles of the local axes of the grids.
+
+        Use this method, rather than :meth:`initialize`, if the underlying
+        mapper has already been initialized.
+
+        Parameters
+        ----------
+        dest_grid : grid_like
+            Grid onto which vectors are mapped.
+        src_grid : grid_like
+            Grid from which vectors are taken.
+        rotate : bool, optional
+            If ``False``, do not rotate vector components.
+        """
+        (self._dst_angle, self._src_angle) = (None, None)
+        self._dst_size = None
+        if rotate:
+            for grid, attr in ((dest_grid, "_dst_angle"), (src_grid, "_src_angle")):
+                angle = grid_angles(grid)
+                if angle is not None:
+                    setattr(self, attr, (np.cos(angle), np.sin(angle)))
+
+    def run(self, src_values, **kwds):
+        """Map the components of vectors.
+
+        Parameters
+        ----------
+        src_values : tuple of ndarray
+            The two components of the source vectors.
+        dst_vals : tuple of ndarray, optional
+            Destination arrays for the two components.
+        bad_val : float, optional
+            Value below which indicates a bad value. A vector is bad if
+            either of its components is bad.
+
+        Returns
+        -------
+        tuple of ndarray
+            The (possibly newly-created) destination components. If
+            newly-created, vectors without good source values are set to
+            *bad_val*.
+        """
+        dst_vals = kwds.get("dst_vals", None)
+        bad_val = kwds.get("bad_val", -999)
+
+        (u, v) = (np.ravel(src_values[0]), np.ravel(src_values[1]))
+        if u.size != v.size:
+            raise ValueError("size mismatch between vector components")
+        is_good = (u > bad_val) & (v > bad_val)
+
+        if self._src_angle is not None:
+            (u, v) = rotate(u, v, self._src_angle)
+
+        try:
+            weights = self._mapper.weights
+        except AttributeError:
+            (mapped, has_values) = self._run_components(u, v, is_good, bad_val)
+        else:
+            if u.size != weights.shape[1]:
+                raise ValueError("size mismatch between source values and mapper")
+            (mapped, has_values) = weighted_sum(
+                weights, np.column_stack((u, v)), is_good
+            )
+        (u, v) = (mapped[:, 0], mapped[:, 1])
+
+        if self._dst_angle is not None:
+            (cos, sin) = self._dst_angle
+            (u, v) = rotate(u, v, (cos, -sin))
+
+        if dst_vals is None:
+            dst_vals = (
+                np.full(len(has_values), bad_val, dtype=float),
+                np.full(len(has_values), bad_val, dtype=float),
+            )
+        for dst, mapped in zip(dst_vals, (u, v)):
+            if dst.size != len(has_values):
+                raise ValueError("size mismatch between destination values and mapper")
+            dst.reshape((-1,))[has_values] = mapped[has_values]
+
+        return dst_vals
+
+    def _run_components(self, u, v, is_good, bad_val):
+        """Map components, one after the other, with a non-sparse mapper."""
+        if self._dst_size is None:
+            self._dst_size = np.size(self._mapper.run(u, bad_val=bad_val))
+
+        mapped = []
+        for values in (u, v):
+            dst = np.full(self._dst_size, bad_val, dtype=float)
+            mapped.append(
+                self._mapper.run(
+                    np.where(is_good, values, bad_val), bad_val=bad_val, dst_vals=dst
+                )
+            )
+        mapped = np.column_stack(mapped)
+
+        return mapped, np.all(mapped > bad_val, axis=1)
+
+    @property
+    def name(self):
+        """Name of the grid mapper."""
+        return f"Vector{self._mapper.name}"
@@ -276,10 +276,11 @@ class NetcdfRectilinearField(NetcdfField):
 
     def _set_mesh_coordinate_data(self):
         for name, axis in zip(self.axis_coordinates, self.field_axes):
-            self.create_variable(name, "f8", (name,))
+            coords = self.field.get_axis_coordinates(axis=axis)
+            self.create_variable(name, _NP_TO_NC_TYPE[str(coords.dtype)], (name,))
             self.set_variable(
                 name,
-                self.field.get_axis_coordinates(axis=axis),
+                coords,
                 attrs={
                     "units": self.field.get_coordinate_units(axis),
                     "standard_name": self.field.get_coordinate_name(axis),
@@ -314,10 +315,11 @@ class NetcdfStructuredField(NetcdfRectilinearField):
         dims = self.node_data_dimensions
         # for (name, axis) in zip(self.node_coordinates, self.field_axes):
         for name, axis in zip(self.node_data_dimensions, self.field_axes):
-            self.create_variable(name, "f8", dims)
+            coords = self.field.get_coordinate(axis)
+            self.create_variable(name, _NP_TO_NC_TYPE[str(coords.dtype)], dims)
             self.set_variable(
                 name,
-                self.field.get_coordinate(axis),
+                coords,
                 attrs={
                     "units": self.field.get_coordinate_units(axis),
                     "standard_name": self.field.get_coordinate_name(axis),
@@ -368,10 +370,11 @@ class NetcdfUnstructuredField(NetcdfStructuredField):
         # for (name, axis) in zip(self.node_data_dimensions, self.field_axes):
         # for (name, axis) in zip(self.node_coordinates, self.field_axes):
         for axis, name in enumerate(self.node_coordinates):
-            self.create_variable(name, "f8", dims)
+            coords = self.field.get_coordinate(axis)
+            self.create_variable(name, _NP_TO_NC_TYPE[str(coords.dtype)], dims)
             self.set_variable(
                 name,
-                self.field.get_coordinate(axis),
+                coords,
                 attrs={
                     "units": self.field.get_coordinate_units(axis),
                     "standard_name": self.field.get_coordinate_name(axis),
@@ -380,10 +383,15 @@ class NetcdfUnstructuredField(NetcdfStructuredField):
             )
 
     def _set_face_node_connectivity_data(self):
-        self.create_variable("face_nodes_connectivity", "i8", ("n_vertex",))
+        connectivity = self.field.get_connectivity()
+        self.create_variable(
+            "face_nodes_connectivity",
+            _NP_TO_NC_TYPE[str(connectivity.dtype)],
+            ("n_vertex",),
+        )
         self.set_variable(
             "face_nodes_connectivity",
-            self.field.get_connectivity(),
+            connectivity,
             attrs={
                 "cf_role": "face_node_connectivity",
                 "long_name": "Maps every face to its corner nodes.",
@@ -391,10 +399,13 @@ class NetcdfUnstructuredField(NetcdfStructuredField):
             },
         )
 
-        self.create_variable("face_nodes_offset", "i8", ("n_face",))
+        offset = self.field.get_offset()
+        self.create_variable(
+            "face_nodes_offset", _NP_TO_NC_TYPE[str(offset.dtype)], ("n_face",)
+        )
         self.set_variable(
             "face_nodes_offset",
-            self.field.get_offset(),
+            offset,
             attrs={
                 "cf_role": "face_node_offset",
                 "long_name": "Maps face index into connectivity array",
@@ -404,7 +415,10 @@ class NetcdfUnstructuredField(NetcdfStructuredField):
         (connectivity, fill_val) = self.field.get_connectivity_as_matrix()
 
         self.create_variable(
-            "face_nodes", "i8", ("n_face", "n_max_face_nodes"), fill_value=fill_val
+            "face_nodes",
+            _NP_TO_NC_TYPE[str(connectivity.dtype)],
+            ("n_face", "n_max_face_nodes"),
+            fill_value=fill_val,
         )
         self.set_variable(
             "face_nodes",
@@ -67,7 +67,63 @@ one-timer
 ('event', 2)
 """
 
-import bisect
+import heapq
+import itertools
+import math
+import numbers
+from fractions import Fraction
+
+
+_MAX_DENOMINATOR = 10**6
+_SNAP_TOLERANCE = 1e-12
+
+
+def as_fraction(value):
+    """Convert a time, or time interval, to an exact fraction.
+
+    Floats are snapped to the nearest fraction with a small denominator,
+    if it is within round-off of the float, so that, for example, an
+    interval of ``1 / 3`` is exactly one third and a time of
+    ``0.1 + 0.2`` is exactly three tenths. Otherwise they are converted
+    from their shortest decimal representation so that a time of
+    ``1e-9`` is exactly one billionth.
+
+    Parameters
+    ----------
+    value : float, int, Fraction or str
+        The time.
+
+    Returns
+    -------
+    Fraction
+        The time as a fraction.
+
+    Examples
+    --------
+    >>> from pymt.timeline import as_fraction
+    >>> as_fraction(0.1)
+    Fraction(1, 10)
+    >>> as_fraction(1 / 3)
+    Fraction(1, 3)
+    >>> as_fraction(1 / 24)
+    Fraction(1, 24)
+    >>> as_fraction(0.1 + 0.2)
+    Fraction(3, 10)
+    >>> as_fraction(1e-9)
+    Fraction(1, 1000000000)
+    >>> as_fraction(2)
+    Fraction(2, 1)
+    >>> as_fraction("1.5")
+    Fraction(3, 2)
+    """
+    if isinstance(value, (numbers.Rational, str)):
+        return Fraction(value)
+
+    value = float(value)
+    fraction = Fraction(value).limit_denominator(_MAX_DENOMINATOR)
+    if math.isclose(fraction, value, rel_tol=_SNAP_TOLERANCE):
+        return fraction
+    return Fraction(repr(value))
 
 
 class Timeline:
@@ -125,11 +181,11 @@ class Timeline:
     def __init__(self, events=None, start=0.0):
         events = events or {}
 
-        self._time = float(start)
+        self._denominator = 1
+        self._queue = []
+        self._count = itertools.count()
 
-        self._events = []
-        self._times = []
-        self._intervals = []
+        (self._time,) = self._to_ticks(start)
 
         self.add_recurring_events(events)
 
@@ -146,7 +202,7 @@ class Timeline:
         >>> timeline.time
         2.0
         """
-        return self._time
+        return self._time / self._denominator
 
     @property
     def next_event(self):
@@ -164,7 +220,7 @@ class Timeline:
         0.0
         """
         try:
-            return self._events[0]
+            return self._queue[0][2]
         except IndexError:
             raise IndexError("empty timeline")
 
@@ -178,10 +234,7 @@ class Timeline:
         >>> timeline.time_of_next_event
         1.0
         """
-        try:
-            return self._times[0]
-        except IndexError:
-            raise IndexError("empty timeline")
+        return self._time_of_next_event() / self._denominator
 
     @property
     def events(self):
@@ -196,7 +249,7 @@ class Timeline:
         >>> sorted(events)
         ['an event', 'another event']
         """
-        return set(self._events)
+        return {entry[2] for entry in self._queue}
 
     def add_recurring_events(self, events):
         """Add a series of recurring events to the timeline.
@@ -241,8 +294,14 @@ class Timeline:
         except AttributeError:
             event_items = events
 
-        for event, interval in event_items:
-            self.add_recurring_event(event, interval)
+        event_items = list(event_items)
+        (events, intervals) = zip(*event_items) if event_items else ((), ())
+        intervals = self._to_ticks(*intervals)
+
+        self._insert_events(
+            (event, self._time + interval, interval)
+            for event, interval in zip(events, intervals)
+        )
 
     def add_recurring_event(self, event, interval):
         """Add a recurring event to the timeline.
@@ -264,7 +323,8 @@ class Timeline:
         >>> timeline.events == {'say hello'}
         True
         """
-        self._insert_event(event, self.time + interval, interval)
+        (interval,) = self._to_ticks(interval)
+        self._insert_event(event, self._time + interval, interval)
 
     def add_one_time_event(self, event, time):
         """Add an event that will only happen once.
@@ -288,14 +348,88 @@ class Timeline:
         Traceback (most recent call last):
         IndexError: empty timeline
         """
+        (time,) = self._to_ticks(time)
         self._insert_event(event, time, None)
 
+    def add_one_time_events(self, events):
+        """Add a series of events that will only happen once.
+
+        Parameters
+        ----------
+        events : dict-like
+            Event object/time pairs to add to the timeline.
+
+        Examples
+        --------
+        >>> timeline = Timeline([('recurring', 1.)])
+        >>> timeline.add_one_time_events([('c', 1.5), ('a', .5), ('b', 1.)])
+        >>> timeline.pop_until(2.)
+        ['a', 'recurring', 'b', 'c', 'recurring']
+        """
+        try:
+            event_items = events.items()
+        except AttributeError:
+            event_items = events
+
+        event_items = list(event_items)
+        (events, times) = zip(*event_items) if event_items else ((), ())
+        times = self._to_ticks(*times)
+
+        self._insert_events((event, time, None) for event, time in zip(events, times))
+
+    def _to_ticks(self, *times):
+        """Convert times to integer ticks of the timeline.
+
+        A tick is ``1 / denominator`` time units, where the denominator is
+        a multiple of the denominators of every time and interval on the
+        timeline. If a new time needs a finer tick, the times already on
+        the timeline are rescaled. Times that are not finite are not
+        exact, and remain floats.
+        """
+        fractions = []
+        for time in times:
+            try:
+                fractions.append(as_fraction(time))
+            except (ValueError, OverflowError):
+                fractions.append(float(time))
+
+        denominator = self._denominator
+        for fraction in fractions:
+            if isinstance(fraction, Fraction):
+                denominator = math.lcm(denominator, fraction.denominator)
+        if denominator != self._denominator:
+            self._rescale(denominator)
+
+        return [
+            (
+                fraction.numerator * (denominator // fraction.denominator)
+                if isinstance(fraction, Fraction)
+                else fraction * denominator
+            )
+            for fraction in fractions
+        ]
+
+    def _rescale(self, denominator):
+        """Change the length of a tick, keeping the order of events."""
+        scale = denominator // self._denominator
+
+        self._time *= scale
+        self._queue[:] = [
+            (time * scale, count, event, interval and interval * scale)
+            for time, count, event, interval in self._queue
+        ]
+        self._denominator = denominator
+
     def _insert_event(self, event, time, interval):
-        index = bisect.bisect_right(self._times, time)
+        heapq.heappush(self._queue, (time, next(self._count), event, interval))
 
-        self._times.insert(index, time)
-        self._events.insert(index, event)
-        self._intervals.insert(index, interval)
+    def _insert_events(self, events):
+        """Insert many events, restoring the heap once they are all added."""
+        self._queue.extend(
+            (time, next(self._count), event, interval)
+            for event, time, interval in events
+        )
+        heapq.heapify(self._queue)
 
     def pop(self):
         """Pop the next event from the timeline.
@@ -307,18 +441,12 @@ class Timeline:
         'hello'
         """
         try:
-            (event, time, interval) = (
-                self._events.pop(0),
-                self._times.pop(0),
-                self._intervals.pop(0),
-            )
+            (time, _, event, interval) = heapq.heappop(self._queue)
         except IndexError:
             raise IndexError("pop from empty timeline")
 
-        try:
+        if interval is not None:
             self._insert_event(event, time + interval, interval)
-        except TypeError:
-            pass
 
         self._time = time
 
@@ -339,13 +467,70 @@ class Timeline:
         event
             The next event object as the timeline advances to *stop*.
         """
-        if stop < self.time:
+        for _ in self._iter_ticks_until(stop):
+            yield self.pop()
+
+    def iter_groups_until(self, stop):
+        """Iterate the timeline until a given time, a tick at a time.
+
+        Iterate the timeline until *stop*, popping all of the events that
+        happen at the same time together.
+
+        Parameters
+        ----------
+        stop : float
+            Time to iterate until.
+
+        Returns
+        -------
+        list
+            The events that happen at the next time along the timeline,
+            in the order they would be popped.
+
+        Examples
+        --------
+        >>> timeline = Timeline([('a', 1.), ('b', .5), ('c', 1.)])
+        >>> for events in timeline.iter_groups_until(2.):
+        ...     print(timeline.time, events)
+        0.5 ['b']
+        1.0 ['a', 'c', 'b']
+        1.5 ['b']
+        2.0 ['a', 'c', 'b']
+        """
+        for time in self._iter_ticks_until(stop):
+            events = []
+            while self._queue and self._queue[0][0] == time:
+                events.append(self.pop())
+            yield events
+
+    def _iter_ticks_until(self, stop):
+        """Times, in ticks, of the next events until a given time.
+
+        The caller pops the events. Events that are added along the way
+        may refine the ticks, in which case *stop* is rescaled with them.
+        """
+        (stop,) = self._to_ticks(stop)
+        if stop < self._time:
             raise ValueError("stop time is less than current time")
 
-        while self.time_of_next_event <= stop:
-            yield self.pop()
+        denominator = self._denominator
+        while True:
+            if self._denominator != denominator:
+                stop *= self._denominator // denominator
+                denominator = self._denominator
+
+            time = self._time_of_next_event()
+            if time > stop:
+                break
+            yield time
         self._time = stop
 
+    def _time_of_next_event(self):
+        try:
+            return self._queue[0][0]
+        except IndexError:
+            raise IndexError("empty timeline")
+
     def pop_until(self, stop):
         """Advance the timeline, popping events along the way.
 
@@ -1,7 +1,9 @@
 import os
 
 from pymt.component.component import Component
+from pymt.events.manager import WORKING_DIRECTORY
 from pymt.framework.services import del_component_instances
+from pymt.testing.services import AirPort, EarthPort
 
 
 def test_no_events(with_no_components):
@@ -48,3 +50,39 @@ print:
 
         assert os.path.isfile("glacier_top_surface__slope.nc")
         assert os.path.isfile("air__temperature.nc")
+
+
+def test_dependencies(tmpdir):
+    with tmpdir.as_cwd():
+        air = Component(AirPort())
+        earth = Component(EarthPort(), uses=["air_port"])
+        assert earth.dependencies == ([WORKING_DIRECTORY], [earth._port])
+
+        earth.connect(
+            "air_port",
+            air,
+            vars_to_map=[("earth_surface__temperature", "air__density")],
+        )
+        (reads, writes) = earth.dependencies
+        assert air._port in writes
+        assert earth._port in writes
+
+
+def test_concurrent_dispatch(with_no_components):
+    del_component_instances(["air_port", "earth_port"])
+
+    air = Component("AirPort", name="air_port", dispatch="concurrent")
+    earth = Component(
+        "EarthPort",
+        name="earth_port",
+        uses=["air_port"],
+        dispatch="concurrent",
+        max_workers=2,
+    )
+    earth.connect(
+        "air_port", air, vars_to_map=[("earth_surface__temperature", "air__density")]
+    )
+    earth.go()
+
+    assert earth._port.current_time == 100.0
+    assert air._port.current_time == 100.0
@@ -0,0 +1,171 @@
+import threading
+
+import pytest
+from pytest import approx
+
+from pymt.component.component import Component
+from pymt.events.chain import ChainEvent
+from pymt.events.empty import PassEvent
+from pymt.events.manager import EventManager, dispatch_waves
+from pymt.events.port import PortEvent, PortMapEvent
+from pymt.framework.services import get_component_instance
+from pymt.testing.services import AirPort, EarthPort
+
+
+class RecordEvent:
+    def __init__(self, name, log, reads=(), writes=(), barrier=None):
+        self.name = name
+        self.dependencies = (reads, writes)
+        self._log = log
+        self._barrier = barrier
+
+    def initialize(self):
+        pass
+
+    def run(self, time):
+        if self._barrier is not None:
+            self._barrier.wait()
+        self._log.append((self.name, time))
+
+    def finalize(self):
+        pass
+
+
+def names(waves):
+    return [[event.name for event in wave] for wave in waves]
+
+
+def test_waves_of_independent_events():
+    (a, b) = (object(), object())
+    events = [
+        RecordEvent("write a", [], writes=[a]),
+        RecordEvent("write b", [], writes=[b]),
+        RecordEvent("read a", [], reads=[a]),
+        RecordEvent("read a again", [], reads=[a]),
+        RecordEvent("write a again", [], writes=[a]),
+    ]
+    assert names(dispatch_waves(events)) == [
+        ["write a", "write b"],
+        ["read a", "read a again"],
+        ["write a again"],
+    ]
+
+
+def test_undeclared_events_are_barriers():
+    event = RecordEvent("event", [])
+    events = [event, PassEvent(), event]
+
+    waves = dispatch_waves(events)
+    assert [len(wave) for wave in waves] == [1, 1, 1]
+    assert isinstance(waves[1][0], PassEvent)
+
+
+def test_port_event_dependencies(tmpdir, with_earth_and_air):
+    with tmpdir.as_cwd():
+        air = get_component_instance("air_port")
+        earth = get_component_instance("earth_port")
+
+        run_air = PortEvent(port=air)
+        run_earth = PortEvent(port=earth)
+        air_to_earth = PortMapEvent(
+            src_port=air,
+            dst_port=earth,
+            vars_to_map=[("earth_surface__temperature", "air__density")],
+        )
+
+        assert dispatch_waves([run_air, run_earth, air_to_earth]) == [
+            [run_air, run_earth],
+            [air_to_earth],
+        ]
+        chain = ChainEvent([run_air, air_to_earth])
+        assert dispatch_waves([chain, run_earth]) == [[chain], [run_earth]]
+
+        in_folder = PortEvent(port=earth, run_dir=str(tmpdir))
+        assert dispatch_waves([run_air, in_folder]) == [[run_air], [in_folder]]
+
+
+def test_component_map_conflicts_with_its_port(tmpdir):
+    with tmpdir.as_cwd():
+        air = Component(AirPort())
+        earth = Component(EarthPort())
+
+        run_earth = PortEvent(port=earth._port)
+        air_to_earth = PortMapEvent(src_port=air, dst_port=earth, vars_to_map=[])
+        assert dispatch_waves([run_earth, air_to_earth]) == [
+            [run_earth],
+            [air_to_earth],
+        ]
+
+
+def test_independent_events_run_concurrently():
+    log = []
+    barrier = threading.Barrier(2, timeout=5.0)
+    events = [
+        RecordEvent("a", log, writes=["a"], barrier=barrier),
+        RecordEvent("b", log, writes=["b"], barrier=barrier),
+    ]
+
+    mngr = EventManager([(event, 1.0) for event in events], dispatch="concurrent")
+    with mngr:
+        mngr.run(2.0)
+
+    assert sorted(log) == [("a", 1.0), ("a", 2.0), ("b", 1.0), ("b", 2.0)]
+
+
+def test_dependent_events_run_in_order():
+    log = []
+    port = object()
+    events = [
+        RecordEvent("a", log, writes=[port]),
+        RecordEvent("b", log, reads=[port]),
+        RecordEvent("c", log, writes=[port]),
+    ]
+
+    mngr = EventManager([(event, 0.5) for event in events], dispatch="concurrent")
+    with mngr:
+        mngr.run(1.0)
+
+    assert [name for name, _ in log] == ["a", "b", "c", "a", "b", "c"]
+
+
+def test_declared_dependencies():
+    log = []
+    barrier = threading.Barrier(2, timeout=5.0)
+    (a, b) = (PassEvent(), PassEvent())
+    a.run = b.run = lambda time: log.append(barrier.wait())
+
+    mngr = EventManager(dispatch="concurrent")
+    mngr.add_recurring_event(a, 1.0, writes=["a"])
+    mngr.add_recurring_event(b, 1.0, writes=["b"])
+    mngr.run(1.0)
+
+    assert sorted(log) == [0, 1]
+
+
+def test_concurrent_error():
+    class FailEvent(RecordEvent):
+        def run(self, time):
+            raise RuntimeError(self.name)
+
+    events = [FailEvent("a", [], writes=["a"]), FailEvent("b", [], writes=["b"])]
+    mngr = EventManager([(event, 1.0) for event in events], dispatch="concurrent")
+    with mngr:
+        with pytest.raises(RuntimeError, match="a"):
+            mngr.run(1.0)
+
+
+def test_bad_dispatch():
+    with pytest.raises(ValueError):
+        EventManager(dispatch="parallel")
+
+
+def test_concurrent_ports_match_serial(tmpdir, with_earth_and_air):
+    with tmpdir.as_cwd():
+        air = get_component_instance("air_port")
+        earth = get_component_instance("earth_port")
+
+        events = [(PortEvent(port=air), 1.0), (PortEvent(port=earth), 1.0)]
+        with EventManager(events, dispatch="concurrent") as mngr:
+            mngr.run(3.0)
+            assert air.get_value("air__density") == approx(3.0)
+            assert earth.get_value("earth_surface__temperature") == approx(3.0)
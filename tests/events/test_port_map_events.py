@@ -1,3 +1,4 @@
+import numpy as np
 from numpy.testing import assert_array_equal
 
 from pymt.events.chain import ChainEvent
@@ -54,3 +55,110 @@ def test_chain(tmpdir, with_earth_and_air):
 
             mngr.run(2.0)
             assert_port_value_equal(air, "air__density", 1.2)
+
+
+def test_nearest_shares_mapper(tmpdir, with_earth_and_air):
+    with tmpdir.as_cwd():
+        events = [
+            PortMapEvent(
+                src_port="air_port",
+                dst_port="earth_port",
+                vars_to_map=[("earth_surface__temperature", "air__density")],
+                method="nearest",
+            )
+            for _ in range(2)
+        ]
+        for event in events:
+            event.initialize()
+
+        assert events[0]._mapper is events[1]._mapper
+        assert events[0].path == "identity"
+
+        events[0]._src.initialize()
+        events[0]._dst.initialize()
+        events[0].run(1.0)
+        assert_port_value_equal(events[0]._dst, "earth_surface__temperature", 0.0)
+
+
+def test_dynamic_mapper_is_updated(tmpdir, with_earth_and_air):
+    with tmpdir.as_cwd():
+        events = [
+            PortMapEvent(
+                src_port="air_port",
+                dst_port="earth_port",
+                vars_to_map=[("earth_surface__temperature", "air__density")],
+                method="nearest",
+                dynamic=dynamic,
+            )
+            for dynamic in (True, False)
+        ]
+        for event in events:
+            event.initialize()
+
+        (dynamic, static) = events
+        assert dynamic.path == "PointToPoint"
+        assert dynamic._mapper is not static._mapper
+        assert_array_equal(dynamic._mapper._nearest_src_id, range(20))
+
+        dynamic._src.initialize()
+        dynamic._dst.initialize()
+        dynamic._src._coords[-1] += 2.0
+        try:
+            dynamic.run(1.0)
+        finally:
+            dynamic._src._coords[-1] -= 2.0
+
+        assert_array_equal(
+            dynamic._mapper._nearest_src_id.reshape((4, 5))[:, 1:],
+            np.arange(20).reshape((4, 5))[:, :-1],
+        )
+
+
+def test_vectors_are_mapped_together(tmpdir, with_earth_and_air):
+    with tmpdir.as_cwd():
+        event = PortMapEvent(
+            src_port="air_port",
+            dst_port="earth_port",
+            vectors_to_map=[
+                (
+                    ("earth_surface__temperature", "earth_surface__density"),
+                    ("air__temperature", "air__density"),
+                )
+            ],
+            method="idw",
+        )
+        event.initialize()
+
+        event._src.initialize()
+        event._dst.initialize()
+        event._src.set_value("air__temperature", np.full(20, 2.0))
+        event._src.set_value("air__density", np.full(20, 3.0))
+        event.run(1.0)
+
+        assert event.path == "identity"
+        assert_port_value_equal(event._dst, "earth_surface__temperature", 2.0)
+        assert_port_value_equal(event._dst, "earth_surface__density", 3.0)
+
+
+def test_components_use_identity(tmpdir):
+    from pymt.component.component import Component
+    from pymt.mappers import IdentityMapper
+    from pymt.testing.services import AirPort, EarthPort
+
+    class FaceAirPort(AirPort):
+        def get_var_location(self, name):
+            return "face"
+
+    with tmpdir.as_cwd():
+        (air, earth) = (Component(AirPort()), Component(EarthPort()))
+        face_air = Component(FaceAirPort())
+
+    vars_to_map = [("earth_surface__temperature", "air__density")]
+    assert IdentityMapper.test(earth, air, vars=vars_to_map)
+    assert not IdentityMapper.test(earth, face_air, vars=vars_to_map)
+
+    event = PortMapEvent(
+        src_port=air, dst_port=earth, vars_to_map=vars_to_map, method="nearest"
+    )
+    event.initialize()
+    assert event.path == "identity"
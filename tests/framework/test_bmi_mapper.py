@@ -0,0 +1,179 @@
+"""Unit tests for the pymt.framework.bmi_mapper module."""
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from pymt.framework.bmi_bridge import BmiTimeInterpolator, GridMapperMixIn, _BmiCap
+
+
+class RasterBmi:
+    shape = (3, 4)
+    spacing = (1.0, 2.0)
+    origin = (0.0, 0.0)
+
+    def __init__(self):
+        self._values = {"elevation": np.arange(12.0), "depth": np.zeros(12)}
+
+    def initialize(self, fname):
+        pass
+
+    def get_input_var_names(self):
+        return ("depth",)
+
+    def get_output_var_names(self):
+        return ("elevation",)
+
+    def get_var_grid(self, name):
+        return 0
+
+    def get_var_units(self, name):
+        return "m"
+
+    def get_var_type(self, name):
+        return "float"
+
+    def get_var_location(self, name):
+        return "node"
+
+    def get_var_nbytes(self, name):
+        return self.get_var_itemsize(name) * 12
+
+    def get_var_itemsize(self, name):
+        return np.dtype("float").itemsize
+
+    def get_value(self, name, out):
+        out[:] = self._values[name]
+
+    def set_value(self, name, values):
+        self._values[name][:] = values
+
+    def get_grid_type(self, grid):
+        return "uniform_rectilinear"
+
+    def get_grid_rank(self, grid):
+        return 2
+
+    def get_grid_node_count(self, grid):
+        return 12
+
+    def get_grid_shape(self, grid, out):
+        out[:] = self.shape
+
+    def get_grid_spacing(self, grid, out):
+        out[:] = self.spacing
+
+    def get_grid_origin(self, grid, out):
+        out[:] = self.origin
+
+
+class ShiftedRasterBmi(RasterBmi):
+    origin = (1.0, 0.0)
+
+
+class Raster(GridMapperMixIn, _BmiCap, BmiTimeInterpolator):
+    _cls = RasterBmi
+
+
+class ShiftedRaster(GridMapperMixIn, _BmiCap, BmiTimeInterpolator):
+    _cls = ShiftedRasterBmi
+
+
+@pytest.fixture
+def raster(tmpdir):
+    bmi = Raster()
+    bmi.initialize(dir=str(tmpdir))
+    return bmi
+
+
+def test_same_grid_is_identity(tmpdir, raster):
+    other = Raster()
+    other.initialize(dir=str(tmpdir))
+
+    assert raster.grid[0].fingerprint() == other.grid[0].fingerprint()
+    assert raster.regrid_path("elevation", to=other, to_name="depth") == "identity"
+    assert_array_equal(raster.regrid("elevation", to=other, to_name="depth"), range(12))
+
+
+def test_identity_set_value(tmpdir, raster):
+    other = Raster()
+    other.initialize(dir=str(tmpdir))
+
+    other.set_value("depth", mapfrom=("elevation", raster))
+    assert_array_equal(other.bmi._values["depth"], range(12))
+
+
+def test_different_grid_is_not_identity(tmpdir, raster):
+    other = ShiftedRaster()
+    other.initialize(dir=str(tmpdir))
+
+    assert raster.grid[0].fingerprint() != other.grid[0].fingerprint()
+    assert raster.regrid_path("elevation", to=other, to_name="depth") != "identity"
+
+
+def test_dynamic_grid_is_refreshed(tmpdir, raster):
+    other = Raster()
+    other.initialize(dir=str(tmpdir))
+    assert raster.regrid_path("elevation", to=other, to_name="depth") == "identity"
+
+    raster.bmi.origin = (1.0, 0.0)
+    assert raster.regrid_path("elevation", to=other, to_name="depth") == "identity"
+
+    raster.dynamic_grids.add(0)
+    raster.regrid("elevation", to=other, to_name="depth")
+    assert raster.regrid_path("elevation", to=other, to_name="depth") != "identity"
+    assert raster.grid[0].fingerprint() != other.grid[0].fingerprint()
+
+    assert not raster.refresh_grid(0)
+
+
+def test_get_value_at_coarse_level(raster):
+    assert_array_equal(raster.get_value("elevation", level=1), [2.5, 4.5, 8.5, 10.5])
+    assert_array_equal(raster.get_value("elevation", level=2), [5.5])
+    assert raster.grid_pyramid(0) is raster.grid_pyramid(0)
+
+
+def test_regrid_at_coarse_level(tmpdir, raster):
+    other = Raster()
+    other.initialize(dir=str(tmpdir))
+
+    assert_array_equal(
+        raster.regrid("elevation", to=other, to_name="depth", level=1),
+        [2.5, 4.5, 8.5, 10.5],
+    )
+
+
+def test_pyramid_is_refreshed(raster):
+    raster.dynamic_grids.add(0)
+    pyramid = raster.grid_pyramid(0)
+
+    raster.bmi.origin = (1.0, 0.0)
+    assert raster.refresh_grid(0)
+    assert raster.grid_pyramid(0) is not pyramid
+    assert_array_equal(raster.grid_pyramid(0).axes(1)[0], [1.5, 3.0])
+
+
+def test_regrid_paths_do_not_outlive_destination(tmpdir, raster):
+    import gc
+
+    other = ShiftedRaster()
+    other.initialize(dir=str(tmpdir))
+    assert raster.regrid_path("elevation", to=other, to_name="depth") != "identity"
+
+    del other
+    gc.collect()
+
+    same = Raster()
+    same.initialize(dir=str(tmpdir))
+    assert raster.regrid_path("elevation", to=same, to_name="depth") == "identity"
+    assert len(raster._regrid_paths) == 1
+
+
+def test_regrid_at_coarse_level_needs_regridding(tmpdir, raster):
+    other = ShiftedRaster()
+    other.initialize(dir=str(tmpdir))
+
+    if raster.regrid_path("elevation", to=other, to_name="depth") != "none":
+        pytest.skip("ESMF is installed")
+    with pytest.raises(ValueError):
+        raster.regrid("elevation", to=other, to_name="depth", level=1)
@@ -12,6 +12,7 @@ from pymt.framework.bmi_ugrid import (
     Unstructured,
     Vector,
 )
+from pymt.grids.registry import GridRegistry
 
 grid_id = 0
 
@@ -244,3 +245,44 @@ def test_uniform_rectilinear_grid():
     assert grid.metadata["type"] == bmi.grid_type(grid_id)
     assert grid.data_vars["mesh"].attrs["type"] is bmi.grid_type(grid_id)
     assert type(grid.data_vars["node_x"].data) is np.ndarray
+
+
+def test_unstructured_grid_face_geometry():
+    """Test the cached geometry of the faces of an unstructured grid."""
+    grid = Unstructured(BmiUnstructured(), grid_id)
+
+    assert "face_area" not in grid
+    area = grid.get_face_areas()
+    assert "face_area" in grid
+    assert np.shares_memory(grid.get_face_areas(), area)
+
+    (faces, offset) = grid.get_node_faces()
+    np.testing.assert_array_equal(faces, [0, 0, 0, 0])
+    np.testing.assert_array_equal(offset, [1, 2, 3, 4])
+
+
+def test_uniform_rectilinear_grid_face_geometry():
+    """Test the geometry of the faces of a uniform rectilinear grid."""
+    bmi = BmiUniformRectilinear()
+    bmi.spacing = (2.0, 1.0)
+    grid = UniformRectilinear(bmi, grid_id)
+
+    np.testing.assert_array_almost_equal(grid.get_face_areas(), np.full(6, 2.0))
+
+    (x, y) = grid.get_face_centroids()
+    np.testing.assert_array_almost_equal(x, [2.5, 3.5, 2.5, 3.5, 2.5, 3.5])
+    np.testing.assert_array_almost_equal(y, [6.0, 6.0, 8.0, 8.0, 10.0, 10.0])
+
+    np.testing.assert_array_almost_equal(
+        grid.get_face_bounds()[0], [2.0, 5.0, 3.0, 7.0]
+    )
+
+
+def test_grids_share_arrays():
+    """Test that grids with the same geometry share their arrays."""
+    with GridRegistry():
+        grids = [Unstructured(BmiUnstructured(), grid_id) for _ in range(2)]
+
+    for name in ("node_x", "node_y", "face_node_connectivity", "face_node_offset"):
+        assert grids[0][name].values is grids[1][name].values
+        assert not grids[0][name].values.flags.writeable
@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from pymt.grids import (
+    RasterField,
+    Rectilinear,
+    Structured,
+    UniformRectilinear,
+    Unstructured,
+    get_index_dtype,
+    set_index_dtype,
+)
+
+
+@pytest.fixture
+def int32_indices():
+    previous = set_index_dtype("int32")
+    yield
+    set_index_dtype(previous)
+
+
+def test_default_index_dtype():
+    assert get_index_dtype() == np.dtype(int)
+    grid = Unstructured([0, 0, 1], [0, 1, 0], connectivity=[0, 1, 2], offset=[3])
+    assert grid.get_connectivity().dtype == np.dtype(int)
+    assert grid.get_x().dtype == np.float64
+
+
+def test_set_index_dtype():
+    previous = set_index_dtype("int32")
+    try:
+        assert get_index_dtype() == np.int32
+    finally:
+        assert set_index_dtype(previous) == np.int32
+    assert get_index_dtype() == previous
+
+    with pytest.raises(TypeError):
+        set_index_dtype("float32")
+    with pytest.raises(TypeError):
+        set_index_dtype("uint32")
+
+
+@pytest.mark.parametrize(
+    "grid",
+    [
+        lambda: Unstructured(
+            [0, 0, 1, 1], [0, 1, 0, 1], connectivity=[0, 1, 3, 2], offset=[4]
+        ),
+        lambda: Structured([0, 0, 1, 1], [0, 1, 0, 1], (2, 2)),
+        lambda: Rectilinear([0, 1], [0, 1]),
+        lambda: UniformRectilinear((2, 2), (1.0, 1.0), (0.0, 0.0)),
+        lambda: RasterField((2, 2), (1.0, 1.0), (0.0, 0.0)),
+    ],
+)
+def test_grids_honour_index_dtype(int32_indices, grid):
+    grid = grid()
+    assert grid.get_connectivity().dtype == np.int32
+    assert grid.get_offset().dtype == np.int32
+
+    (matrix, fill_val) = grid.get_connectivity_as_matrix()
+    assert matrix.dtype == np.int32
+    assert fill_val == np.iinfo(np.int32).max
+
+
+@pytest.mark.parametrize(
+    "grid",
+    [
+        lambda **kwds: Unstructured(
+            [0, 0, 1, 1], [0, 1, 0, 1], connectivity=[0, 1, 3, 2], offset=[4], **kwds
+        ),
+        lambda **kwds: Structured([0, 0, 1, 1], [0, 1, 0, 1], (2, 2), **kwds),
+        lambda **kwds: Rectilinear([0, 1], [0, 1], **kwds),
+        lambda **kwds: UniformRectilinear((2, 2), (1.0, 1.0), (0.0, 0.0), **kwds),
+    ],
+)
+def test_grids_honour_coord_dtype(grid):
+    grid = grid(coord_dtype="float32")
+    assert grid.get_x().dtype == np.float32
+    assert grid.get_y().dtype == np.float32
+    assert grid.get_xyz().dtype == np.float32
+    assert_array_equal(grid.get_x(), [0.0, 1.0, 0.0, 1.0])
+
+
+def test_index_overflow():
+    previous = set_index_dtype("int8")
+    try:
+        with pytest.raises(OverflowError):
+            Unstructured(
+                np.arange(4.0), np.arange(4.0), connectivity=[0, 1, 200], offset=[3]
+            )
+        with pytest.raises(OverflowError):
+            Structured(np.zeros(400), np.zeros(400), (20, 20))
+        with pytest.raises(OverflowError):
+            Rectilinear(np.arange(10.0), np.arange(20.0))
+    finally:
+        set_index_dtype(previous)
@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+
+from pymt.grids.geometry import (
+    bounding_boxes,
+    cell_vertices,
+    clip_polygons,
+    overlap_areas,
+    overlapping_boxes,
+    polygon_areas,
+)
+from pymt.grids.map import UniformRectilinearMap
+
+
+def test_cell_vertices_of_raster():
+    grid = UniformRectilinearMap((3, 4), (1.0, 2.0), (0.0, 0.0))
+    (xv, yv) = cell_vertices(
+        grid.get_x(), grid.get_y(), grid.get_connectivity(), grid.get_offset()
+    )
+    assert xv.shape == (6, 4)
+    assert_array_almost_equal(polygon_areas(xv, yv), 2.0)
+    assert_array_equal(bounding_boxes(xv, yv)[0], [0.0, 0.0, 2.0, 1.0])
+
+
+def test_polygon_area_orientation():
+    (xv, yv) = (np.array([[0.0, 1.0, 1.0, 0.0]]), np.array([[0.0, 0.0, 1.0, 1.0]]))
+    assert polygon_areas(xv, yv, signed=True) == pytest.approx(1.0)
+    assert polygon_areas(xv[:, ::-1], yv[:, ::-1], signed=True) == pytest.approx(-1.0)
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_clip_squares(reverse):
+    square = (np.array([[0.0, 2.0, 2.0, 0.0]]), np.array([[0.0, 0.0, 2.0, 2.0]]))
+    clip = (np.array([[1.0, 3.0, 3.0, 1.0]]), np.array([[1.0, 1.0, 3.0, 3.0]]))
+    if reverse:
+        clip = (clip[0][:, ::-1], clip[1][:, ::-1])
+
+    (xv, yv) = clip_polygons(*square, *clip)
+    assert_array_almost_equal(bounding_boxes(xv, yv), [[1.0, 1.0, 2.0, 2.0]])
+    assert_array_almost_equal(polygon_areas(xv, yv), [1.0])
+
+
+def test_clip_disjoint():
+    square = (np.array([[0.0, 1.0, 1.0, 0.0]]), np.array([[0.0, 0.0, 1.0, 1.0]]))
+    clip = (np.array([[2.0, 3.0, 3.0, 2.0]]), np.array([[2.0, 2.0, 3.0, 3.0]]))
+    assert_array_equal(overlap_areas(*square, *clip), [0.0])
+
+
+def test_clip_against_brute_force():
+    shapely = pytest.importorskip("shapely.geometry")
+
+    n_pairs = 200
+    angles = np.sort(np.random.uniform(0, 2 * np.pi, size=(n_pairs, 5)), axis=1)
+    center = np.random.uniform(-0.5, 0.5, size=(n_pairs, 2, 1))
+    (xv, yv) = (np.cos(angles) + center[:, 0], np.sin(angles) + center[:, 1])
+
+    clip_angles = np.sort(np.random.uniform(0, 2 * np.pi, size=(n_pairs, 4)), axis=1)
+    (clip_xv, clip_yv) = (np.cos(clip_angles), np.sin(clip_angles))
+
+    expected = [
+        shapely.Polygon(np.column_stack((xv[i], yv[i]))).intersection(
+            shapely.Polygon(np.column_stack((clip_xv[i], clip_yv[i])))
+        ).area
+        for i in range(n_pairs)
+    ]
+    assert_array_almost_equal(overlap_areas(xv, yv, clip_xv, clip_yv), expected)
+
+
+def test_overlapping_boxes_against_brute_force():
+    lower_a = np.random.uniform(0, 10, size=(300, 2))
+    boxes_a = np.hstack((lower_a, lower_a + np.random.uniform(0, 1.5, size=(300, 2))))
+    lower_b = np.random.uniform(0, 10, size=(200, 2))
+    boxes_b = np.hstack((lower_b, lower_b + np.random.uniform(0, 0.5, size=(200, 2))))
+
+    (ids_a, ids_b) = overlapping_boxes(boxes_a, boxes_b)
+
+    overlaps = np.all(
+        np.maximum(boxes_a[:, np.newaxis, :2], boxes_b[np.newaxis, :, :2])
+        <= np.minimum(boxes_a[:, np.newaxis, 2:], boxes_b[np.newaxis, :, 2:]),
+        axis=2,
+    )
+    (expected_a, expected_b) = np.nonzero(overlaps)
+
+    assert_array_equal(ids_a, expected_a)
+    assert_array_equal(ids_b, expected_b)
+
+
+def test_overlapping_boxes_empty():
+    (ids_a, ids_b) = overlapping_boxes(np.empty((0, 4)), [[0.0, 0.0, 1.0, 1.0]])
+    assert len(ids_a) == len(ids_b) == 0
@@ -0,0 +1,188 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+
+from pymt.grids.locate import (
+    is_monotonic,
+    locate_in_rectilinear,
+    locate_in_structured,
+    locate_on_axis,
+    locate_on_uniform_axis,
+)
+from pymt.grids import Rectilinear, Structured, UniformRectilinear, Unstructured
+from pymt.grids.map import RectilinearMap, UniformRectilinearMap
+
+
+def test_uniform_axis_matches_searchsorted():
+    coords = np.random.uniform(-1.0, 11.0, size=500)
+    nodes = np.arange(6) * 2.0
+
+    assert_array_equal(
+        locate_on_uniform_axis(coords, 0.0, 2.0, 6)[0], locate_on_axis(coords, nodes)[0]
+    )
+    assert_array_almost_equal(
+        locate_on_uniform_axis(coords, 0.0, 2.0, 6)[1], locate_on_axis(coords, nodes)[1]
+    )
+
+
+@pytest.mark.parametrize("nodes", [[0.0, 1.0, 3.0], [3.0, 1.0, 0.0]])
+def test_axis_end_points(nodes):
+    index, fraction = locate_on_axis([0.0, 3.0, -0.1, 3.1], nodes)
+
+    assert_array_equal(index[2:], -1)
+    assert_array_equal(
+        np.take(nodes, index[:2]) * (1 - fraction[:2])
+        + np.take(nodes, index[:2] + 1) * fraction[:2],
+        [0.0, 3.0],
+    )
+
+
+def test_uniform_axis_non_finite():
+    index, fraction = locate_on_uniform_axis([np.nan, np.inf, 0.5], 0.0, 1.0, 2)
+    assert_array_equal(index, [-1, -1, 0])
+    assert_array_equal(fraction, [0.0, 0.0, 0.5])
+
+
+def test_is_monotonic():
+    assert is_monotonic([1.0, 2.0])
+    assert is_monotonic([2.0, 1.0])
+    assert not is_monotonic([1.0, 2.0, 1.5])
+
+
+@pytest.mark.parametrize(
+    "grid",
+    [
+        UniformRectilinearMap((4, 5), (1.0, 2.0), (0.0, 0.0)),
+        RectilinearMap([0.0, 1.0, 2.0, 3.0], [0.0, 2.0, 4.0, 6.0, 8.0]),
+    ],
+)
+def test_locate_in_rectilinear(grid):
+    (row, row_frac), (col, col_frac) = locate_in_rectilinear(
+        grid, [1.0, 7.0, 9.0], [0.5, 3.0, 1.0]
+    )
+    assert_array_equal(row, [0, 2, 1])
+    assert_array_equal(col, [0, 3, -1])
+    assert_array_almost_equal(row_frac, [0.5, 1.0, 0.0])
+    assert_array_almost_equal(col_frac, [0.5, 0.5, 0.0])
+
+
+def warped_grid(shape):
+    (j, i) = np.meshgrid(
+        np.arange(shape[1], dtype=float), np.arange(shape[0], dtype=float)
+    )
+    x = j + 0.3 * np.sin(i / 2.0) + 0.1 * i
+    y = i + 0.2 * np.cos(j / 3.0)
+    return x, y
+
+
+def test_locate_in_structured_recovers_logical_coordinates():
+    (x_nodes, y_nodes) = warped_grid((12, 15))
+
+    n_points = 300
+    i = np.random.randint(0, 11, size=n_points)
+    j = np.random.randint(0, 14, size=n_points)
+    (t, s) = np.random.uniform(0.01, 0.99, size=(2, n_points))
+
+    def interp(v):
+        return (
+            v[i, j] * (1 - s) * (1 - t)
+            + v[i, j + 1] * s * (1 - t)
+            + v[i + 1, j] * (1 - s) * t
+            + v[i + 1, j + 1] * s * t
+        )
+
+    ((row, row_frac), (col, col_frac)) = locate_in_structured(
+        x_nodes, y_nodes, interp(x_nodes), interp(y_nodes)
+    )
+
+    assert_array_equal(row, i)
+    assert_array_equal(col, j)
+    assert_array_almost_equal(row_frac, t)
+    assert_array_almost_equal(col_frac, s)
+
+
+def test_locate_in_structured_from_far_start():
+    (x_nodes, y_nodes) = warped_grid((6, 6))
+
+    ((row, _), (col, _)) = locate_in_structured(
+        x_nodes, y_nodes, [x_nodes[4, 4] + 0.01], [y_nodes[4, 4] + 0.01], start=[0]
+    )
+    assert_array_equal(row, [4])
+    assert_array_equal(col, [4])
+
+
+def test_locate_in_structured_outside():
+    (x_nodes, y_nodes) = warped_grid((4, 5))
+
+    ((row, row_frac), (col, col_frac)) = locate_in_structured(
+        x_nodes, y_nodes, [-5.0, 20.0, 2.0], [1.0, 1.0, -3.0]
+    )
+    assert_array_equal(row, -1)
+    assert_array_equal(col, -1)
+    assert_array_equal(row_frac, 0.0)
+    assert_array_equal(col_frac, 0.0)
+
+
+@pytest.mark.parametrize(
+    "grid",
+    [
+        UniformRectilinear((4, 5), (2.0, 1.0), (-1.0, 1.0)),
+        Rectilinear([-1.0, 0.5, 3.0, 5.0], [1.0, 1.5, 2.0, 4.0, 5.0]),
+    ],
+)
+def test_locate_points_matches_unstructured(grid):
+    mesh = Unstructured(
+        grid.get_y(),
+        grid.get_x(),
+        connectivity=grid.get_connectivity(),
+        offset=grid.get_offset(),
+    )
+    x = np.random.uniform(0.0, 6.0, size=2000)
+    y = np.random.uniform(-2.0, 6.0, size=2000)
+
+    cells = grid.locate_points(x, y)
+    assert np.any(cells == -1)
+    assert_array_equal(mesh.locate_points(x, y), cells)
+
+
+def test_locate_points_in_curvilinear_grid():
+    (y_nodes, x_nodes) = np.meshgrid(
+        np.linspace(0.0, 2.0, 5), np.linspace(0.0, 3.0, 7), indexing="ij"
+    )
+    x_nodes = x_nodes + y_nodes * y_nodes
+    grid = Structured(y_nodes.reshape((-1,)), x_nodes.reshape((-1,)), (5, 7))
+
+    x = np.random.uniform(-1.0, 8.0, size=1000)
+    y = np.random.uniform(-1.0, 3.0, size=1000)
+
+    ((row, _), (col, _)) = locate_in_structured(x_nodes, y_nodes, x, y)
+    expected = np.where(row >= 0, row * 6 + col, -1)
+
+    assert_array_equal(grid.locate_points(x, y), expected)
+
+
+def test_locate_points_on_mixed_cells():
+    grid = Unstructured(
+        [0.0, 0.0, 0.0, 1.0, 1.0, 1.0],
+        [0.0, 1.0, 2.0, 0.0, 1.0, 2.0],
+        connectivity=[0, 1, 4, 3, 1, 2, 4, 2, 5, 4],
+        offset=[4, 7, 10],
+    )
+    cells = grid.locate_points(
+        [0.5, 1.75, 1.25, 1.0, 0.0, 3.0, np.nan], [0.5, 0.5, 0.5, 0.5, 1.0, 0.5, 0.5]
+    )
+    assert_array_equal(cells, [0, 2, 1, 0, 0, -1, -1])
+
+
+def test_locate_points_index_is_cached():
+    grid = Unstructured([0.0, 0.0, 1.0], [0.0, 1.0, 0.0], [0, 1, 2], [3])
+    assert_array_equal(grid.locate_points([0.25], [0.25]), [0])
+    index = grid._cell_index
+    assert_array_equal(grid.locate_points([0.75], [0.75]), [-1])
+    assert grid._cell_index is index
+
+
+def test_locate_points_requires_2d():
+    grid = Rectilinear([0.0, 1.0, 2.0])
+    with pytest.raises(ValueError):
+        grid.locate_points([0.5], [0.5])
@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from pymt.grids import Rectilinear, Unstructured, UnstructuredPoints
+from pymt.grids.ordering import curve_order, hilbert_keys, morton_keys, reorder_grid
+
+
+@pytest.mark.parametrize("bits", [1, 2, 4])
+def test_hilbert_curve_is_continuous(bits):
+    (y, x) = np.meshgrid(np.arange(2**bits), np.arange(2**bits), indexing="ij")
+    (x, y) = (x.reshape((-1,)).astype(float), y.reshape((-1,)).astype(float))
+
+    keys = hilbert_keys(x, y, bits=bits)
+    assert_array_equal(np.sort(keys), np.arange(4**bits))
+
+    order = np.argsort(keys)
+    steps = np.abs(np.diff(x[order])) + np.abs(np.diff(y[order]))
+    assert_array_equal(steps, 1.0)
+
+
+def test_morton_keys_interleave_bits():
+    keys = morton_keys([0.0, 3.0, 0.0, 3.0, 1.0], [0.0, 0.0, 3.0, 3.0, 2.0], bits=2)
+    assert_array_equal(keys, [0, 5, 10, 15, 9])
+
+
+def test_curve_order():
+    x = np.random.uniform(size=100)
+    y = np.random.uniform(size=100)
+    for curve in ("hilbert", "morton"):
+        assert_array_equal(np.sort(curve_order(x, y, curve=curve)), np.arange(100))
+    assert_array_equal(curve_order([2.0, 0.0, 1.0]), [1, 2, 0])
+    with pytest.raises(ValueError):
+        curve_order(x, y, curve="peano")
+
+
+def test_reorder_grid_keeps_cells():
+    (y, x) = np.meshgrid(np.arange(6.0), np.arange(7.0), indexing="ij")
+    mesh = Rectilinear(np.arange(6.0), np.arange(7.0))
+    shuffle = np.random.permutation(mesh.get_point_count())
+    inverse = np.argsort(shuffle)
+    grid = Unstructured(
+        y.reshape((-1,))[shuffle],
+        x.reshape((-1,))[shuffle],
+        connectivity=inverse[mesh.get_connectivity()],
+        offset=mesh.get_offset(),
+    )
+
+    (new, node_order, cell_order) = reorder_grid(grid)
+
+    assert type(new) is Unstructured
+    assert_array_equal(new.get_x(), grid.get_x()[node_order])
+    assert_array_equal(new.get_y(), grid.get_y()[node_order])
+    assert_array_equal(
+        new.get_x()[new.get_connectivity()].reshape((-1, 4)),
+        grid.get_x()[grid.get_connectivity()].reshape((-1, 4))[cell_order],
+    )
+    assert_array_equal(new.get_cell_areas(), grid.get_cell_areas()[cell_order])
+
+    def mean_jump(g):
+        return np.mean(np.abs(np.diff(g.get_x())) + np.abs(np.diff(g.get_y())))
+
+    assert mean_jump(new) < 0.5 * mean_jump(grid)
+
+
+def test_reorder_points():
+    grid = UnstructuredPoints([1.0, 0.0, 0.0], [0.0, 0.0, 1.0])
+    (new, node_order, cell_order) = reorder_grid(grid)
+    assert_array_equal(node_order, [1, 0, 2])
+    assert cell_order is None
+    assert_array_equal(new.get_x(), [0.0, 0.0, 1.0])
+
+
+def test_structured_grids_are_not_reordered():
+    grid = Rectilinear([0.0, 1.0, 2.0], [0.0, 1.0])
+    assert reorder_grid(grid) == (grid, None, None)
@@ -0,0 +1,106 @@
+"""Unit tests for the pymt.grids.pyramid module."""
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+
+from pymt.grids.pyramid import GridPyramid, block_mean
+
+
+@pytest.mark.parametrize("shape", [(8, 16), (5, 7), (1, 9), (3, 4, 5)])
+def test_block_mean_matches_loop(shape):
+    values = np.random.default_rng(0).random(shape)
+    coarse = block_mean(values, 2)
+
+    expected = np.empty(coarse.shape)
+    for index in np.ndindex(coarse.shape):
+        block = tuple(slice(2 * i, 2 * i + 2) for i in index)
+        expected[index] = values[block].mean()
+
+    assert_array_almost_equal(coarse, expected)
+
+
+def test_pyramid_shapes():
+    pyramid = GridPyramid((20, 33))
+
+    assert pyramid.levels == 3
+    assert [pyramid.shape(level) for level in range(4)] == [
+        (20, 33),
+        (10, 17),
+        (5, 9),
+        (3, 5),
+    ]
+    assert [pyramid.factor(level) for level in range(4)] == [1, 2, 4, 8]
+
+
+def test_pyramid_bad_level():
+    pyramid = GridPyramid((4, 4), levels=2)
+    with pytest.raises(ValueError):
+        pyramid.restrict(np.zeros(16), 3)
+    with pytest.raises(ValueError):
+        pyramid.axes(-1)
+
+
+def test_pyramid_size_mismatch():
+    pyramid = GridPyramid((4, 4))
+    with pytest.raises(ValueError):
+        pyramid.restrict(np.zeros(15), 1)
+    with pytest.raises(ValueError):
+        pyramid.prolong(np.zeros(5), 1)
+
+
+def test_pyramid_uniform_axes():
+    pyramid = GridPyramid((8, 16), spacing=(2.0, 1.0), origin=(10.0, -1.0))
+    (y, x) = pyramid.axes(2)
+
+    assert_array_almost_equal(y, [13.0, 21.0])
+    assert_array_almost_equal(x, [0.5, 4.5, 8.5, 12.5])
+
+
+def test_pyramid_rectilinear_axes():
+    pyramid = GridPyramid((3, 4), axes=([0.0, 1.0, 4.0], [0.0, 1.0, 3.0, 7.0]))
+    (y, x) = pyramid.axes(1)
+
+    assert_array_almost_equal(y, [0.5, 4.0])
+    assert_array_almost_equal(x, [0.5, 5.0])
+
+
+def test_pyramid_restrict_preserves_shape():
+    pyramid = GridPyramid((6, 8))
+    values = np.arange(48.0)
+
+    assert pyramid.restrict(values, 1).shape == (12,)
+    assert pyramid.restrict(values.reshape((6, 8)), 1).shape == (3, 4)
+    assert pyramid.restrict(values, 0) is values
+
+
+@pytest.mark.parametrize("level", [1, 2, 3])
+def test_pyramid_restrict_constant(level):
+    pyramid = GridPyramid((13, 21))
+    assert_array_almost_equal(
+        pyramid.restrict(np.full(13 * 21, 2.0), level),
+        np.full(pyramid.size(level), 2.0),
+    )
+
+
+@pytest.mark.parametrize("level", [1, 2, 3])
+def test_pyramid_restrict_after_prolong(level):
+    pyramid = GridPyramid((13, 21))
+    coarse = np.random.default_rng(1).random(pyramid.size(level))
+
+    fine = pyramid.prolong(coarse, level)
+    assert fine.shape == (13 * 21,)
+    assert_array_almost_equal(pyramid.restrict(fine, level), coarse)
+
+
+@pytest.mark.parametrize("level", [1, 2, 3])
+def test_pyramid_operators_match_kernels(level):
+    pyramid = GridPyramid((13, 21))
+    values = np.random.default_rng(2).random(13 * 21)
+    coarse = pyramid.restrict(values, level)
+
+    assert_array_almost_equal(pyramid.restriction_matrix(level) @ values, coarse)
+    assert_array_equal(
+        pyramid.prolongation_matrix(level) @ coarse, pyramid.prolong(coarse, level)
+    )
+    assert pyramid.restriction_matrix(level) is pyramid.restriction_matrix(level)
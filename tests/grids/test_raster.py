@@ -280,6 +280,28 @@ class TestRasterGrid(unittest.TestCase):
         )
         self.assert_offset(grid, 8.0 * np.arange(1, grid.get_cell_count() + 1))
 
+    def test_coordinates_are_implicit(self):
+        grid = UniformRectilinearPoints((2, 3), (1, 2), (0.5, 0), indexing="ij")
+        self.assertIsNone(grid._coord_matrix)
+
+        x = grid.get_x()
+        self.assertFalse(x.flags.writeable)
+        self.assertIs(x, grid.get_x())
+        self.assert_x(grid, [0.0, 2.0, 4.0, 0.0, 2.0, 4.0])
+        self.assert_y(grid, [0.5, 0.5, 0.5, 1.5, 1.5, 1.5])
+        self.assertIsNone(grid._coord_matrix)
+
+        with self.assertRaises(IndexError):
+            grid.get_z()
+
+    def test_coordinate_matrix_is_writable(self):
+        grid = UniformRectilinearPoints((2, 3), (1, 2), (0.5, 0), indexing="ij")
+        self.assertEqual(grid.get_xyz().shape, (2, 6))
+
+        grid.get_xyz()[-1] += 1.0
+        self.assert_x(grid, [1.0, 3.0, 5.0, 1.0, 3.0, 5.0])
+        self.assertListEqual(list(grid.get_axis_coordinates(axis=1)), [0.0, 2.0, 4.0])
+
 
 def suite():
     suite = unittest.TestLoader().loadTestsFromTestCase(TestRasterGrid)
@@ -0,0 +1,122 @@
+import gc
+import os
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from pymt.grids import Unstructured
+from pymt.grids.registry import GridRegistry, get_registry, intern_array, set_registry
+
+
+@pytest.mark.parametrize("backing", ["memory", "shared_memory", "memmap"])
+def test_intern_shares_arrays(backing):
+    registry = GridRegistry(backing=backing)
+
+    x = registry.intern(np.linspace(0.0, 1.0, 11))
+    assert not x.flags.writeable
+    assert registry.intern(np.linspace(0.0, 1.0, 11)) is x
+    assert registry.intern(np.linspace(0.0, 1.0, 12)) is not x
+    assert_array_equal(x, np.linspace(0.0, 1.0, 11))
+
+    key = registry.key(x)
+    assert key in registry
+    if backing == "memory":
+        assert registry.location(key) is None
+    else:
+        assert registry.location(key) is not None
+
+
+@pytest.mark.parametrize("backing", ["memory", "shared_memory", "memmap"])
+def test_unused_arrays_are_released(backing):
+    registry = GridRegistry(backing=backing)
+
+    x = registry.intern(np.arange(100.0))
+    key = registry.key(x)
+    location = registry.location(key)
+    view = x[10:]
+
+    del x
+    gc.collect()
+    assert len(registry) == 1
+
+    del view
+    gc.collect()
+    assert len(registry) == 0
+    assert registry.location(key) is None
+    if backing == "memmap":
+        assert not os.path.exists(location)
+
+
+def test_intern_without_copy():
+    registry = GridRegistry()
+
+    array = np.arange(5)
+    assert registry.intern(array, copy=False) is array
+    assert not array.flags.writeable
+
+    view = np.arange(10)[::2]
+    assert registry.intern(view, copy=False) is not view
+    assert view.flags.writeable
+
+
+def test_bad_backing():
+    with pytest.raises(ValueError):
+        GridRegistry(backing="disk")
+
+
+def test_set_registry():
+    registry = GridRegistry()
+    previous = set_registry(registry)
+    try:
+        assert get_registry() is registry
+        array = intern_array(np.arange(3))
+        assert registry.key(array) in registry
+    finally:
+        assert set_registry(previous) is registry
+
+
+def _unit_square():
+    return Unstructured(
+        [0.0, 0.0, 1.0, 1.0],
+        [0.0, 1.0, 0.0, 1.0],
+        connectivity=[0, 1, 3, 0, 3, 2],
+        offset=[3, 6],
+    )
+
+
+def test_registry_context():
+    assert get_registry() is None
+    with GridRegistry() as registry:
+        assert get_registry() is registry
+    assert get_registry() is None
+
+
+def test_interning_is_opt_in():
+    array = np.arange(3)
+    assert intern_array(array) is array
+    assert array.flags.writeable
+
+    grid = _unit_square()
+    assert grid.get_connectivity().flags.writeable
+    grid.get_connectivity()[0] = 2
+    assert grid.get_connectivity()[0] == 2
+
+
+def test_interned_arrays_are_read_only():
+    with GridRegistry():
+        grid = _unit_square()
+
+    with pytest.raises(ValueError):
+        grid.get_connectivity()[0] = 2
+
+
+def test_grids_share_connectivity():
+    with GridRegistry():
+        grids = [_unit_square() for _ in range(2)]
+    assert grids[0].get_connectivity() is grids[1].get_connectivity()
+    assert grids[0].get_offset() is grids[1].get_offset()
+
+    grids[0].reverse_element_ordering()
+    assert_array_equal(grids[0].get_connectivity(), [3, 1, 0, 2, 3, 0])
+    assert_array_equal(grids[1].get_connectivity(), [0, 1, 3, 0, 3, 2])
@@ -126,3 +126,40 @@ class TestStructuredGrid(unittest.TestCase, NumpyArrayMixIn):
         self.assertArrayEqual(
             grid.get_axis_coordinates(1), np.array([2.0, 3.0, 2.0, 3.0, 2.0, 3.0])
         )
+
+    def test_connectivity_is_shared(self):
+        grids = [
+            Structured([0, 0, 0, 1, 1, 1], [0, 1, 2, 0, 1, 2], (2, 3)),
+            Structured([0, 0, 0, 2, 2, 2], [0, 1, 2, 0, 1, 2], (2, 3)),
+        ]
+        self.assertEqual(grids[0].get_cell_count(), 2)
+        self.assertIs(grids[0].get_connectivity(), grids[1].get_connectivity())
+        self.assertIs(grids[0].get_offset(), grids[1].get_offset())
+        self.assertFalse(grids[0].get_connectivity().flags.writeable)
+
+        grids[0].reverse_element_ordering()
+        self.assertArrayEqual(
+            grids[0].get_connectivity(), np.array([3, 4, 1, 0, 4, 5, 2, 1])
+        )
+        self.assertArrayEqual(
+            grids[1].get_connectivity(), np.array([0, 1, 4, 3, 1, 2, 5, 4])
+        )
+
+    def test_shared_connectivity_is_released(self):
+        import gc
+
+        from pymt.grids.connectivity import _CONNECTIVITY, cached_connectivity
+
+        (connectivity, offset) = cached_connectivity((7, 11))
+        self.assertIs(cached_connectivity((7, 11))[0], connectivity)
+
+        del connectivity, offset
+        gc.collect()
+        self.assertNotIn(((7, 11), "cw", np.dtype(int).str, "offset"), _CONNECTIVITY)
+
+    def test_cell_nodes_from_stencil(self):
+        grid = Structured(np.zeros(60), np.zeros(60), np.zeros(60), (3, 4, 5))
+        nodes = grid.get_cell_nodes(np.arange(grid.get_cell_count()))
+        self.assertEqual(nodes.shape, (24, 8))
+        self.assertIsNone(grid._connectivity_array)
+        self.assertArrayEqual(nodes.reshape((-1,)), grid.get_connectivity())
@@ -1,6 +1,7 @@
 import unittest
 
 import numpy as np
+from numpy.testing import assert_array_almost_equal
 
 from pymt.grids import Unstructured
 
@@ -85,3 +86,85 @@ class TestUnstructuredGrid(unittest.TestCase, NumpyArrayMixIn):
         mat, fill_val = grid.get_connectivity_as_matrix(fill_val=999)
         self.assertArrayEqual(mat, np.array([[3, 1, 2, 4], [0, 3, 1, 999]]))
         self.assertEqual(fill_val, 999)
+
+    def test_reverse_element_ordering(self):
+        grid = Unstructured(
+            [0, 1, 2, 1, 2],
+            [0, 0, 0, 1, 1],
+            connectivity=[0, 1, 3, 1, 2, 4, 3],
+            offset=[3, 7],
+        )
+        grid.reverse_element_ordering()
+        self.assertArrayEqual(grid.get_connectivity(), np.array([3, 1, 0, 3, 4, 2, 1]))
+        self.assertArrayEqual(grid.get_offset(), np.array([3, 7]))
+
+    def test_connectivity_as_matrix_round_trip(self):
+        from pymt.grids.utils import connectivity_matrix_as_array
+
+        nodes_per_cell = np.random.randint(1, 7, size=500)
+        offset = np.cumsum(nodes_per_cell)
+        connectivity = np.random.randint(0, 100, size=offset[-1])
+        grid = Unstructured(
+            np.arange(100.0), np.arange(100.0), connectivity=connectivity, offset=offset
+        )
+
+        mat, fill_val = grid.get_connectivity_as_matrix(fill_val=-1)
+        self.assertEqual(mat.shape, (500, nodes_per_cell.max()))
+        for cell, (start, end) in enumerate(zip(offset - nodes_per_cell, offset)):
+            self.assertArrayEqual(mat[cell, : end - start], connectivity[start:end])
+            self.assertTrue(np.all(mat[cell, end - start :] == -1))
+
+        (array, array_offset) = connectivity_matrix_as_array(mat, fill_val)
+        self.assertArrayEqual(array, connectivity)
+        self.assertArrayEqual(array_offset, offset)
+
+        grid.reverse_element_ordering()
+        for start, end in zip(offset - nodes_per_cell, offset):
+            self.assertArrayEqual(
+                grid.get_connectivity()[start:end], connectivity[start:end][::-1]
+            )
+
+
+class TestCellGeometry(unittest.TestCase, NumpyArrayMixIn):
+    def setUp(self):
+        self.grid = Unstructured(
+            [0.0, 0.0, 0.0, 1.0, 1.0, 1.0],
+            [0.0, 1.0, 3.0, 0.0, 1.0, 3.0],
+            connectivity=[0, 1, 4, 3, 1, 2, 4],
+            offset=[4, 7],
+        )
+
+    def test_areas(self):
+        assert_array_almost_equal(self.grid.get_cell_areas(), [1.0, 1.0])
+
+    def test_centroids(self):
+        (x, y) = self.grid.get_cell_centroids()
+        assert_array_almost_equal(x, [0.5, 5.0 / 3.0])
+        assert_array_almost_equal(y, [0.5, 1.0 / 3.0])
+
+    def test_bounding_boxes(self):
+        assert_array_almost_equal(
+            self.grid.get_cell_bounding_boxes(),
+            [[0.0, 0.0, 1.0, 1.0], [1.0, 0.0, 3.0, 1.0]],
+        )
+
+    def test_cells_at_node(self):
+        (cells, offset) = self.grid.get_cells_at_node()
+        self.assertArrayEqual(offset, [0, 1, 3, 4, 5, 7, 7])
+        self.assertArrayEqual(cells[offset[4] : offset[5]], [0, 1])
+
+    def test_geometry_is_cached(self):
+        areas = self.grid.get_cell_areas()
+        self.assertIs(self.grid.get_cell_areas(), areas)
+        self.assertFalse(areas.flags.writeable)
+
+        self.grid.reverse_element_ordering()
+        self.assertIsNot(self.grid.get_cell_areas(), areas)
+        assert_array_almost_equal(self.grid.get_cell_areas(), areas)
+
+    def test_geometry_requires_2d(self):
+        grid = Unstructured(
+            [0.0, 6.0, 9.0, 11.0], connectivity=[0, 1, 2, 3], offset=[1, 2, 3, 4]
+        )
+        with self.assertRaises(ValueError):
+            grid.get_cell_areas()
@@ -392,3 +392,54 @@ class TestsConnectivityMatrixToArray(unittest.TestCase, NumpyArrayMixIn):
         matrix = np.array([[0, 1], [999, 0]])
         with self.assertRaises(ValueError):
             utils.connectivity_matrix_as_array(matrix, 999)
+
+
+class TestCellsAtNode(unittest.TestCase, NumpyArrayMixIn):
+    def test_structured(self):
+        grid = Structured([0, 0, 0, 1, 1, 1], [0, 1, 2, 0, 1, 2], (2, 3))
+        (cells, offset) = utils.get_cells_at_node(
+            grid.get_connectivity(), grid.get_offset(), grid.get_point_count()
+        )
+        self.assertArrayEqual(offset, [0, 1, 3, 4, 5, 7, 8])
+        self.assertArrayEqual(cells, [0, 0, 1, 1, 0, 0, 1, 1])
+
+    def test_unused_node(self):
+        (cells, offset) = utils.get_cells_at_node([0, 2, 3], [3], 5)
+        self.assertArrayEqual(offset, [0, 1, 1, 2, 3, 3])
+        self.assertArrayEqual(cells, [0, 0, 0])
+
+    def test_mixed_cells(self):
+        (cells, offset) = utils.get_cells_at_node([0, 1, 2, 1, 3, 2, 0], [3, 6, 7], 4)
+        self.assertArrayEqual(offset, [0, 2, 4, 6, 7])
+        self.assertArrayEqual(cells, [0, 2, 0, 1, 0, 1, 1])
+
+
+class _StructuredPort:
+    def __init__(self, shape):
+        self._shape = shape
+
+    def get_grid_shape(self, grid_id):
+        return self._shape
+
+    def get_grid_x(self, grid_id):
+        return np.arange(6.0)
+
+    def get_grid_y(self, grid_id):
+        return np.zeros(6)
+
+
+class TestGridFingerprint(unittest.TestCase):
+    def test_grid_id_fingerprint_includes_shape(self):
+        from pymt.component.grid import GridMixIn
+
+        class Component(GridMixIn):
+            def __init__(self, shape):
+                self._port = _StructuredPort(shape)
+                super().__init__()
+
+        (wide, tall) = (Component((2, 3)), Component((3, 2)))
+        self.assertEqual(wide.get_grid_type(0), "STRUCTURED")
+        self.assertNotEqual(utils.grid_fingerprint(wide), utils.grid_fingerprint(tall))
+        self.assertEqual(
+            utils.grid_fingerprint(wide), utils.grid_fingerprint(Component((2, 3)))
+        )
@@ -0,0 +1,148 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+from scipy.interpolate import RegularGridInterpolator
+
+from pymt.grids.map import (
+    RectilinearMap,
+    StructuredMap,
+    UniformRectilinearMap,
+    UnstructuredPointsMap,
+)
+from pymt.mappers import Bilinear, IncompatibleGridError
+
+
+def random_points(n_points, y_range, x_range):
+    return UnstructuredPointsMap(
+        np.random.uniform(*y_range, size=n_points),
+        np.random.uniform(*x_range, size=n_points),
+    )
+
+
+@pytest.mark.parametrize(
+    "src",
+    [
+        UniformRectilinearMap((5, 7), (1.0, 0.5), (-1.0, 2.0)),
+        RectilinearMap([-1.0, 0.0, 0.5, 2.0, 3.0], [2.0, 2.1, 3.0, 4.0, 5.0]),
+        RectilinearMap([3.0, 2.0, 0.5, 0.0, -1.0], [2.0, 2.1, 3.0, 4.0, 5.0]),
+    ],
+)
+def test_bilinear_matches_scipy(src):
+    dst = random_points(200, (-1.0, 3.0), (2.0, 5.0))
+    src_vals = np.random.uniform(size=src.get_point_count())
+
+    mapper = Bilinear()
+    mapper.initialize(dst, src)
+
+    y, x = (src.get_axis_coordinates(axis=0), src.get_axis_coordinates(axis=1))
+    interp = RegularGridInterpolator(
+        (y[::-1], x) if y[0] > y[-1] else (y, x),
+        (
+            src_vals.reshape(src.get_shape())[::-1]
+            if y[0] > y[-1]
+            else src_vals.reshape(src.get_shape())
+        ),
+    )
+    assert_array_almost_equal(
+        mapper.run(src_vals), interp(np.column_stack((dst.get_y(), dst.get_x())))
+    )
+
+
+def test_bilinear_reproduces_source_nodes():
+    src = UniformRectilinearMap((4, 3), (2.0, 1.0), (0.0, 0.0))
+    dst = UnstructuredPointsMap(src.get_y(), src.get_x())
+
+    mapper = Bilinear()
+    mapper.initialize(dst, src)
+
+    src_vals = np.arange(src.get_point_count(), dtype=float)
+    assert_array_almost_equal(mapper.run(src_vals), src_vals)
+    assert_array_equal(np.diff(mapper.weights.indptr), 1)
+
+
+def test_bilinear_outside_is_bad():
+    src = UniformRectilinearMap((3, 3), (1.0, 1.0), (0.0, 0.0))
+    dst = UnstructuredPointsMap(np.array([0.5, 2.5, -0.5]), np.array([0.5, 0.5, 0.5]))
+
+    mapper = Bilinear()
+    mapper.initialize(dst, src)
+
+    assert_array_equal(mapper.run(np.ones(9)), [1.0, -999.0, -999.0])
+
+    dst_vals = np.zeros(3)
+    mapper.run(np.ones(9), dst_vals=dst_vals)
+    assert_array_equal(dst_vals, [1.0, 0.0, 0.0])
+
+
+def test_bilinear_bad_values():
+    src = UniformRectilinearMap((2, 2), (1.0, 1.0), (0.0, 0.0))
+    dst = UnstructuredPointsMap(np.array([0.5]), np.array([0.5]))
+
+    mapper = Bilinear()
+    mapper.initialize(dst, src)
+
+    assert_array_almost_equal(mapper.run(np.array([1.0, 2.0, -999.0, 3.0])), [2.0])
+
+
+def test_bilinear_test():
+    src = RectilinearMap([0.0, 1.0, 2.0], [0.0, 1.0])
+    points = UnstructuredPointsMap(np.array([0.5]), np.array([0.5]))
+
+    assert Bilinear.test(points, src)
+    assert not Bilinear.test(src, points)
+    assert not Bilinear.test(None, src)
+
+    with pytest.raises(IncompatibleGridError):
+        Bilinear().initialize(src, points)
+
+
+def test_bilinear_from_structured():
+    (j, i) = np.meshgrid(np.arange(8, dtype=float), np.arange(6, dtype=float))
+    (x, y) = (j + 0.2 * np.sin(i), i + 0.1 * j)
+    src = StructuredMap(y.reshape((-1,)), x.reshape((-1,)), (6, 8))
+    dst = random_points(200, (1.0, 4.5), (1.0, 6.0))
+
+    mapper = Bilinear()
+    mapper.initialize(dst, src)
+
+    src_vals = 2.0 * src.get_x() - 3.0 * src.get_y() + 1.0
+    assert_array_almost_equal(
+        mapper.run(src_vals), 2.0 * dst.get_x() - 3.0 * dst.get_y() + 1.0
+    )
+
+
+def test_bilinear_update_moving_destination():
+    src = UniformRectilinearMap((5, 5), (1.0, 1.0), (0.0, 0.0))
+    dst = random_points(100, (0.0, 4.0), (0.0, 4.0))
+
+    mapper = Bilinear()
+    mapper.initialize(dst, src)
+
+    (y, x) = (dst.get_y().copy(), dst.get_x().copy())
+    x[:20] = np.clip(x[:20] + 0.3, 0.0, 4.0)
+    dst = UnstructuredPointsMap(y, x)
+    mapper.update(dst, src)
+
+    expected = Bilinear()
+    expected.initialize(dst, src)
+    assert_array_almost_equal(mapper.weights.toarray(), expected.weights.toarray())
+
+
+def test_bilinear_update_deforming_structured_source():
+    (j, i) = np.meshgrid(np.arange(8, dtype=float), np.arange(6, dtype=float))
+    dst = random_points(200, (1.0, 4.5), (1.0, 6.0))
+
+    mapper = Bilinear()
+    for step in range(4):
+        (x, y) = (j + 0.2 * np.sin(i + step / 4.0), i + 0.1 * j)
+        src = StructuredMap(y.reshape((-1,)), x.reshape((-1,)), (6, 8))
+        if step == 0:
+            mapper.initialize(dst, src)
+        else:
+            mapper.update(dst, src)
+
+        expected = Bilinear()
+        expected.initialize(dst, src)
+        assert_array_almost_equal(
+            mapper.weights.toarray(), expected.weights.toarray()
+        )
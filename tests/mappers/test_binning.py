@@ -0,0 +1,121 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+
+from pymt.grids.map import RectilinearMap, UniformRectilinearMap, UnstructuredPointsMap
+from pymt.mappers import Binning, IncompatibleGridError, PointToCell
+
+
+@pytest.fixture
+def points():
+    n_points = 1000
+    return UnstructuredPointsMap(
+        np.random.uniform(-0.5, 3.5, size=n_points),
+        np.random.uniform(-0.5, 4.5, size=n_points),
+    )
+
+
+@pytest.mark.parametrize(
+    "raster",
+    [
+        UniformRectilinearMap((4, 5), (1.0, 1.0), (0.0, 0.0)),
+        RectilinearMap([0.0, 0.5, 2.0, 3.0], [0.0, 1.0, 1.5, 3.0, 4.0]),
+    ],
+)
+@pytest.mark.parametrize("method", ["mean", "sum", "max", "min", "count"])
+def test_binning_matches_brute_force(points, raster, method):
+    mapper = Binning()
+    mapper.initialize(raster, points)
+
+    src_vals = np.random.uniform(size=points.get_point_count())
+    dst_vals = mapper.run(src_vals, method=method)
+
+    (x, y) = (points.get_x(), points.get_y())
+    (xv, yv) = (
+        raster.get_x()[raster.get_connectivity()].reshape((-1, 4)),
+        raster.get_y()[raster.get_connectivity()].reshape((-1, 4)),
+    )
+    for cell in range(raster.get_cell_count()):
+        in_cell = (
+            (x >= xv[cell].min())
+            & (x < xv[cell].max())
+            & (y >= yv[cell].min())
+            & (y < yv[cell].max())
+        )
+        values = src_vals[in_cell]
+        if method == "count":
+            assert dst_vals[cell] == len(values)
+        elif method == "sum":
+            assert dst_vals[cell] == pytest.approx(values.sum())
+        elif len(values) == 0:
+            assert dst_vals[cell] == -999.0
+        else:
+            assert dst_vals[cell] == pytest.approx(getattr(np, method)(values))
+
+
+def test_binning_matches_point_to_cell(points):
+    raster = UniformRectilinearMap((4, 5), (1.0, 1.0), (0.0, 0.0))
+    src_vals = np.random.uniform(size=points.get_point_count())
+
+    binning, point_to_cell = Binning(), PointToCell()
+    binning.initialize(raster, points)
+    point_to_cell.initialize(raster, points)
+
+    assert_array_almost_equal(
+        binning.run(src_vals, method=np.sum), point_to_cell.run(src_vals, method=np.sum)
+    )
+
+
+def test_binning_bad_values():
+    points = UnstructuredPointsMap(np.array([0.5, 0.5, 0.5]), np.array([0.5, 0.5, 5.0]))
+    raster = UniformRectilinearMap((2, 2), (1.0, 1.0), (0.0, 0.0))
+
+    mapper = Binning()
+    mapper.initialize(raster, points)
+
+    assert_array_equal(mapper.run(np.array([-999.0, 2.0, 5.0])), [2.0])
+    assert_array_equal(mapper.run(np.array([-999.0, 2.0, 5.0]), method="count"), [1])
+
+    dst_vals = np.array([10.0])
+    mapper.run(np.array([-999.0, -999.0, 5.0]), dst_vals=dst_vals, method="max")
+    assert_array_equal(dst_vals, [10.0])
+
+
+def test_binning_relocate():
+    points = UnstructuredPointsMap(np.array([0.5, 0.5]), np.array([0.5, 1.5]))
+    raster = UniformRectilinearMap((2, 3), (1.0, 1.0), (0.0, 0.0))
+
+    mapper = Binning()
+    mapper.initialize(raster, points)
+    assert_array_equal(mapper.run(np.array([1.0, 3.0]), method="max"), [1.0, 3.0])
+
+    mapper.relocate(np.array([1.5, 1.5, 0.5]), np.array([0.5, 0.5, 0.5]))
+    assert_array_equal(mapper.run(np.array([1.0, 3.0, 2.0]), method="max"), [2.0, 3.0])
+
+
+def test_binning_bad_method(points):
+    raster = UniformRectilinearMap((4, 5), (1.0, 1.0), (0.0, 0.0))
+    mapper = Binning()
+    mapper.initialize(raster, points)
+
+    with pytest.raises(ValueError):
+        mapper.run(np.zeros(points.get_point_count()), method="median")
+    with pytest.raises(ValueError):
+        mapper.run(np.zeros(3))
+
+
+def test_binning_test(points):
+    raster = UniformRectilinearMap((4, 5), (1.0, 1.0), (0.0, 0.0))
+    assert Binning.test(raster, points)
+    assert not Binning.test(points, raster)
+    with pytest.raises(IncompatibleGridError):
+        Binning().initialize(points, raster)
+
+
+def test_binning_update():
+    raster = UniformRectilinearMap((2, 3), (1.0, 1.0), (0.0, 0.0))
+    mapper = Binning()
+    mapper.initialize(raster, UnstructuredPointsMap(np.array([0.5]), np.array([0.5])))
+    mapper.update(raster, UnstructuredPointsMap(np.array([0.5]), np.array([1.5])))
+
+    assert_array_equal(mapper.run(np.array([1.0]), method="count"), [0, 1])
@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from pymt.grids.map import RectilinearMap as Rectilinear
+from pymt.mappers import MapperCache, NearestVal
+
+
+def test_same_geometry_shares_mapper():
+    cache = MapperCache()
+    mapper = cache.get(
+        NearestVal, Rectilinear([0.5, 1.5], [0.25, 1.25]), Rectilinear([0, 1], [0, 2])
+    )
+    assert (
+        cache.get(
+            NearestVal,
+            Rectilinear([0.5, 1.5], [0.25, 1.25]),
+            Rectilinear([0, 1], [0, 2]),
+        )
+        is mapper
+    )
+    assert len(cache) == 1
+
+
+def test_different_geometry():
+    cache = MapperCache()
+    src = Rectilinear([0, 1], [0, 2])
+    mapper = cache.get(NearestVal, Rectilinear([0.5, 1.5], [0.25, 1.25]), src)
+    other = cache.get(NearestVal, Rectilinear([0.5, 1.5], [0.25, 1.5]), src)
+
+    assert other is not mapper
+    assert len(cache) == 2
+
+
+def test_keywords_are_part_of_key():
+    cache = MapperCache()
+    (src, dst) = (Rectilinear([0, 1], [0, 2]), Rectilinear([0.5, 1.5], [0.25, 1.25]))
+
+    mapper = cache.get(NearestVal, dst, src, vars=[("a", "b")])
+    assert cache.get(NearestVal, dst, src, vars=[("a", "b")]) is mapper
+    assert cache.get(NearestVal, dst, src, vars=[("a", "c")]) is not mapper
+
+
+def test_least_recently_used_is_evicted():
+    cache = MapperCache(maxsize=2)
+    src = Rectilinear([0, 1], [0, 2])
+    grids = [Rectilinear([0.5, 1.5], [y, 1.25]) for y in (0.1, 0.2, 0.3)]
+
+    first = cache.get(NearestVal, grids[0], src)
+    second = cache.get(NearestVal, grids[1], src)
+    assert cache.get(NearestVal, grids[0], src) is first
+
+    cache.get(NearestVal, grids[2], src)
+
+    assert len(cache) == 2
+    assert cache.get(NearestVal, grids[0], src) is first
+    assert cache.get(NearestVal, grids[1], src) is not second
+
+
+def test_cached_mapper_runs():
+    cache = MapperCache()
+    src = Rectilinear([0, 1, 2], [0, 2])
+    dst = Rectilinear([0.5, 1.5, 2.5], [0.25, 1.25])
+
+    mapper = cache.get(NearestVal, dst, src)
+    assert_array_equal(mapper.run(np.arange(6.0)), [0.0, 1.0, 2.0, 3.0, 4.0, 5.0])
+
+
+def test_bad_maxsize():
+    with pytest.raises(ValueError):
+        MapperCache(maxsize=0)
+
+
+class CountingMapper:
+    n_initialized = 0
+
+    def initialize(self, dest_grid, src_grid, **kwds):
+        CountingMapper.n_initialized += 1
+
+
+def test_components_share_mapper(tmpdir):
+    from pymt.component.component import Component
+    from pymt.testing.services import AirPort, EarthPort
+
+    with tmpdir.as_cwd():
+        (air, earth) = (Component(AirPort()), Component(EarthPort()))
+        (other_air, other_earth) = (Component(AirPort()), Component(EarthPort()))
+
+    cache = MapperCache()
+    vars_to_map = [("earth_surface__temperature", "air__density")]
+    mapper = cache.get(CountingMapper, earth, air, vars=vars_to_map)
+
+    assert cache.get(CountingMapper, other_earth, other_air, vars=vars_to_map) is mapper
+    assert CountingMapper.n_initialized == 1
+    assert len(cache) == 1
@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+
+from pymt.grids.map import (
+    RectilinearMap,
+    UniformRectilinearMap,
+    UnstructuredMap,
+    UnstructuredPointsMap,
+)
+from pymt.mappers import Conservative, IncompatibleGridError
+from pymt.mappers.conservative import _cell_vertices, overlap_weights
+
+
+def test_conservative_is_conservative():
+    src = RectilinearMap(
+        np.concatenate(([0.0], np.sort(np.random.uniform(0.1, 9.9, size=12)), [10.0])),
+        np.concatenate(([0.0], np.sort(np.random.uniform(0.1, 9.9, size=15)), [10.0])),
+    )
+    dst = UniformRectilinearMap((6, 8), (2.0, 10.0 / 7.0), (0.0, 0.0))
+
+    mapper = Conservative()
+    mapper.initialize(dst, src)
+
+    src_vals = np.random.uniform(size=src.get_cell_count())
+    dst_vals = mapper.run(src_vals)
+
+    assert dst_vals.shape == (dst.get_cell_count(),)
+    error = mapper.conservation_error(src_vals, dst_vals)
+    assert error == pytest.approx(0.0, abs=1e-12)
+    assert_array_almost_equal(mapper.weights.sum(axis=1).A1, 1.0)
+
+
+def test_conservative_constant_field():
+    src = UniformRectilinearMap((5, 5), (1.0, 1.0), (0.0, 0.0))
+    dst = UniformRectilinearMap((4, 4), (1.0, 1.0), (0.5, 0.5))
+
+    mapper = Conservative()
+    mapper.initialize(dst, src)
+
+    assert_array_almost_equal(mapper.run(np.full(16, 3.0)), 3.0)
+
+
+def test_conservative_triangles_to_raster():
+    (x, y) = (np.array([0.0, 2.0, 2.0, 0.0]), np.array([0.0, 0.0, 2.0, 2.0]))
+    src = UnstructuredMap(y, x, [0, 1, 2, 0, 2, 3], [3, 6])
+    dst = UniformRectilinearMap((3, 3), (1.0, 1.0), (0.0, 0.0))
+
+    mapper = Conservative()
+    mapper.initialize(dst, src)
+
+    dst_vals = mapper.run(np.array([1.0, 3.0]))
+    assert_array_almost_equal(dst_vals, [2.0, 1.0, 3.0, 2.0])
+    assert mapper.conservation_error([1.0, 3.0], dst_vals) == pytest.approx(0.0)
+
+
+def test_conservative_partial_cover():
+    src = UniformRectilinearMap((2, 2), (1.0, 1.0), (0.0, 0.0))
+    dst = UniformRectilinearMap((2, 3), (1.0, 1.0), (0.0, 0.5))
+
+    mapper = Conservative()
+    mapper.initialize(dst, src)
+
+    assert_array_almost_equal(mapper.weights.toarray(), [[0.5], [0.0]])
+    assert_array_equal(mapper.run(np.array([4.0])), [2.0, -999.0])
+
+
+def test_conservative_bad_values():
+    src = UniformRectilinearMap((2, 3), (1.0, 1.0), (0.0, 0.0))
+    dst = UniformRectilinearMap((2, 2), (1.0, 2.0), (0.0, 0.0))
+
+    mapper = Conservative()
+    mapper.initialize(dst, src)
+
+    assert_array_almost_equal(mapper.run(np.array([1.0, 3.0])), [2.0])
+    assert_array_almost_equal(mapper.run(np.array([-999.0, 3.0])), [3.0])
+
+
+def test_conservative_chunks_with_threads():
+    src = UniformRectilinearMap((40, 30), (1.0, 1.0), (0.0, 0.0))
+    dst = UniformRectilinearMap((30, 20), (1.3, 1.5), (0.0, 0.0))
+
+    (dst_cells, src_cells) = (_cell_vertices(dst), _cell_vertices(src))
+    serial = overlap_weights(dst_cells, src_cells, workers=1)
+    threaded = overlap_weights(dst_cells, src_cells, chunk_size=100, workers=4)
+
+    assert_array_almost_equal(serial.toarray(), threaded.toarray())
+    assert_array_almost_equal(serial.sum(axis=1).A1, 1.3 * 1.5)
+
+
+def test_conservative_test():
+    grid = UniformRectilinearMap((3, 3), (1.0, 1.0), (0.0, 0.0))
+    points = UnstructuredPointsMap(np.array([0.5]), np.array([0.5]))
+
+    assert Conservative.test(grid, grid)
+    assert not Conservative.test(grid, points)
+    with pytest.raises(IncompatibleGridError):
+        Conservative().initialize(points, grid)
@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+
+from pymt.grids.map import RectilinearMap, UnstructuredPointsMap
+from pymt.mappers import InverseDistance, NearestVal, find_mapper
+
+
+@pytest.fixture
+def src():
+    return RectilinearMap([0.0, 1.0, 2.0, 3.0], [0.0, 1.0, 2.0])
+
+
+def test_idw_is_registered(src):
+    dst = RectilinearMap([0.5, 1.5], [0.5, 1.5])
+    names = [mapper.name for mapper in find_mapper(dst, src)]
+    assert "InverseDistance" in names
+
+
+def test_idw_weights_sum_to_one(src):
+    dst = RectilinearMap([0.5, 1.5, 2.25], [0.5, 1.75])
+    mapper = InverseDistance()
+    mapper.initialize(dst, src, k=4)
+
+    assert mapper.weights.shape == (dst.get_point_count(), src.get_point_count())
+    assert_array_almost_equal(mapper.weights.sum(axis=1).A1, 1.0)
+    assert_array_equal(np.diff(mapper.weights.indptr), 4)
+
+
+def test_idw_preserves_linear_field_at_centers(src):
+    dst = RectilinearMap([0.5, 1.5, 2.5], [0.5, 1.5])
+    mapper = InverseDistance()
+    mapper.initialize(dst, src, k=4)
+
+    src_vals = 2.0 * src.get_x() + src.get_y()
+    assert_array_almost_equal(mapper.run(src_vals), 2.0 * dst.get_x() + dst.get_y())
+
+
+def test_idw_with_k_one_is_nearest(src):
+    dst = RectilinearMap([0.1, 1.2, 2.9], [0.2, 1.9])
+    idw, nearest = InverseDistance(), NearestVal()
+    idw.initialize(dst, src, k=1)
+    nearest.initialize(dst, src)
+
+    src_vals = np.arange(src.get_point_count(), dtype=float)
+    assert_array_equal(idw.run(src_vals), nearest.run(src_vals))
+
+
+def test_idw_on_source_point(src):
+    dst = UnstructuredPointsMap(np.array([2.0]), np.array([1.0]))
+    mapper = InverseDistance()
+    mapper.initialize(dst, src, k=4)
+
+    src_vals = np.arange(src.get_point_count(), dtype=float)
+    assert_array_equal(mapper.run(src_vals), [7.0])
+
+
+def test_idw_k_larger_than_source():
+    src = UnstructuredPointsMap(np.array([0.0, 1.0]), np.array([0.0, 0.0]))
+    dst = UnstructuredPointsMap(np.array([0.5]), np.array([0.0]))
+    mapper = InverseDistance()
+    mapper.initialize(dst, src, k=8)
+
+    assert_array_almost_equal(mapper.run(np.array([1.0, 3.0])), [2.0])
+
+
+def test_idw_bad_values(src):
+    dst = UnstructuredPointsMap(np.array([0.5, 2.5]), np.array([0.5, 1.5]))
+    mapper = InverseDistance()
+    mapper.initialize(dst, src, k=4)
+
+    src_vals = np.full(src.get_point_count(), -999.0)
+    src_vals[0] = 10.0
+
+    assert_array_equal(mapper.run(src_vals), [10.0, -999.0])
+
+    dst_vals = np.array([-1.0, -1.0])
+    rtn = mapper.run(src_vals, dst_vals=dst_vals)
+    assert rtn is dst_vals
+    assert_array_equal(dst_vals, [10.0, -1.0])
+
+
+def test_idw_size_mismatch(src):
+    dst = RectilinearMap([0.5, 1.5], [0.5, 1.5])
+    mapper = InverseDistance()
+    mapper.initialize(dst, src)
+
+    with pytest.raises(ValueError):
+        mapper.run(np.zeros(3))
+    with pytest.raises(ValueError):
+        mapper.run(np.zeros(src.get_point_count()), dst_vals=np.zeros(3))
+
+
+@pytest.mark.parametrize("move", ["none", "dst", "src"])
+def test_idw_update_matches_initialize(move):
+    src_x, src_y = np.random.uniform(size=(2, 50))
+    dst_x, dst_y = np.random.uniform(size=(2, 30))
+    src = UnstructuredPointsMap(src_y, src_x)
+    dst = UnstructuredPointsMap(dst_y, dst_x)
+
+    mapper = InverseDistance()
+    mapper.initialize(dst, src, k=3)
+
+    if move == "dst":
+        dst_x[:10] += 0.1
+        dst = UnstructuredPointsMap(dst_y, dst_x)
+    elif move == "src":
+        src_x[::2] -= 0.1
+        src = UnstructuredPointsMap(src_y, src_x)
+    mapper.update(dst, src)
+
+    expected = InverseDistance()
+    expected.initialize(dst, src, k=3)
+
+    assert_array_almost_equal(mapper.weights.toarray(), expected.weights.toarray())
@@ -0,0 +1,93 @@
+import numpy as np
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+
+from pymt.grids.map import RectilinearMap as Rectilinear
+from pymt.mappers import NearestVal
+from pymt.mappers import kdtree
+from pymt.mappers.kdtree import get_kdtree, points_key, query_nearest
+
+
+class Points:
+    def __init__(self, x, y, dynamic=False):
+        self._x, self._y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+        self._dynamic = dynamic
+
+    def get_x(self, name=None):
+        return self._x
+
+    def get_y(self, name=None):
+        return self._y
+
+    def get_attrs(self):
+        return {"dynamic": self._dynamic}
+
+    def get_var_grid(self, name):
+        return 0
+
+    def get_var_location(self, name):
+        return "node"
+
+
+def test_tree_is_shared_between_mappers():
+    src = Rectilinear([0, 1, 2], [0, 2])
+    dst = Rectilinear([0.5, 1.5, 2.5], [0.25, 1.25])
+
+    tree = get_kdtree(src)
+    NearestVal().initialize(dst, src)
+    NearestVal().initialize(dst, src)
+
+    assert get_kdtree(src) is tree
+
+
+def test_tree_with_key():
+    src = Rectilinear([0, 1, 2], [0, 2])
+    tree = get_kdtree(src, [0.0, 10.0], [0.0, 10.0], key="var")
+
+    assert tree is not get_kdtree(src)
+    assert tree is get_kdtree(src, [0.0, 10.0], [0.0, 10.0], key="var")
+    assert tree.n == 2
+
+
+def test_tree_is_rebuilt_if_points_change():
+    src = Rectilinear([0, 1, 2], [0, 2])
+    tree = get_kdtree(src, [0.0, 10.0], [0.0, 10.0], key="var")
+
+    assert get_kdtree(src, [0.0, 5.0], [0.0, 10.0], key="var") is not tree
+
+
+def test_query_nearest():
+    tree = get_kdtree(None, [0.0, 1.0, 2.0], [0.0, 0.0, 0.0])
+    (dist, ids) = query_nearest(tree, np.array([[1.9, 0.1]]), np.array([[0.0, 0.0]]))
+    assert_array_equal(ids, [2, 0])
+    assert_array_almost_equal(dist, [0.1, 0.1])
+
+
+def test_variables_on_a_grid_share_a_tree():
+    src = Points([0.0, 1.0, 2.0], [0.0, 0.0, 0.0])
+
+    assert points_key(src, "a") == points_key(src, "b")
+    tree = get_kdtree(src, src.get_x("a"), src.get_y("a"), key=points_key(src, "a"))
+    assert tree is get_kdtree(
+        src, src.get_x("b"), src.get_y("b"), key=points_key(src, "b")
+    )
+
+
+def test_same_points_are_not_compared(monkeypatch):
+    src = Rectilinear([0, 1, 2], [0, 2])
+    tree = get_kdtree(src)
+
+    def fail(*args):
+        raise AssertionError("points were compared")
+
+    monkeypatch.setattr(kdtree, "fingerprint_arrays", fail)
+    assert get_kdtree(src) is tree
+
+
+def test_tree_of_dynamic_grid_is_rebuilt():
+    src = Points([0.0, 1.0, 2.0], [0.0, 0.0, 0.0], dynamic=True)
+    tree = get_kdtree(src)
+    assert get_kdtree(src) is tree
+
+    src.get_x()[0] = -1.0
+    assert get_kdtree(src) is not tree
+    assert get_kdtree(src).data[0, 0] == -1.0
@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 from numpy.testing import assert_array_equal
 
 from pymt.grids.map import (
@@ -100,3 +101,51 @@ def test_point_to_cell_big():
     dst_vals = np.zeros(dst.get_cell_count(), dtype=float) - 1
     mapper.run(src_vals, dst_vals=dst_vals)
     assert_array_equal(dst_vals, src_vals)
+
+
+@pytest.mark.parametrize(
+    "method,expected",
+    [
+        ("mean", [1.5, 4.0, 1.0]),
+        ("sum", [3.0, 4.0, 1.0]),
+        ("min", [0.0, 4.0, 1.0]),
+        (np.max, [3.0, 4.0, 1.0]),
+        ("count", [2.0, 1.0, 1.0]),
+        (np.median, [1.5, 4.0, 1.0]),
+    ],
+)
+def test_point_to_cell_methods(method, expected):
+    (src_x, src_y) = (
+        np.array([0.45, 1.25, 3.5, 0.0, 1.0]),
+        np.array([0.75, 2.25, 3.25, 0.9, 1.1]),
+    )
+    src = UnstructuredPoints(src_x, src_y)
+    dst = UniformRectilinear((2, 4), (2, 1), (0, 0))
+
+    mapper = PointToCell()
+    mapper.initialize(dst, src)
+
+    src_vals = np.arange(src.get_point_count(), dtype=float)
+    dst_vals = mapper.run(src_vals, bad_val=-999, method=method)
+    assert_array_equal(dst_vals, expected)
+
+
+def test_point_to_cell_bad_method():
+    src = UnstructuredPoints(np.array([0.45]), np.array([0.75]))
+    dst = UniformRectilinear((2, 4), (2, 1), (0, 0))
+
+    mapper = PointToCell()
+    mapper.initialize(dst, src)
+    with pytest.raises(ValueError):
+        mapper.run(np.array([1.0]), method="mode")
+
+
+def test_update_defaults_to_initialize():
+    src = UnstructuredPoints(np.array([0.45, 1.25, 0.0]), np.array([0.75, 2.25, 0.9]))
+    dst = UniformRectilinear((2, 4), (2, 1), (0, 0))
+
+    mapper = PointToCell()
+    mapper.initialize(dst, src)
+    mapper.update(dst, UnstructuredPoints(np.array([0.5]), np.array([2.5])))
+
+    assert_array_equal(mapper.run(np.array([3.0])), [-999.0, -999.0, 3.0])
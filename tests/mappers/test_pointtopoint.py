@@ -1,8 +1,9 @@
 import numpy as np
 import pytest
-from numpy.testing import assert_array_almost_equal
+from numpy.testing import assert_array_almost_equal, assert_array_equal
 
 from pymt.grids.map import RectilinearMap as Rectilinear
+from pymt.grids.map import UnstructuredPointsMap as UnstructuredPoints
 from pymt.mappers import NearestVal, find_mapper
 
 
@@ -79,7 +80,7 @@ def test_find_mapper():
 
     mappers = find_mapper(dst, src)
 
-    assert len(mappers) == 3
+    assert len(mappers) == 7
     assert mappers[0].name == "PointToPoint"
     assert isinstance(mappers[0], NearestVal)
 
@@ -92,3 +93,28 @@ def test_incompatible_grids():
     assert not mapper.test(grid, None)
     assert not mapper.test(None, grid)
     assert mapper.test(grid, grid)
+
+
+@pytest.mark.parametrize("move", ["dst", "src", "both"])
+def test_update_matches_initialize(move):
+    src_x, src_y = np.random.uniform(size=(2, 50))
+    dst_x, dst_y = np.random.uniform(size=(2, 30))
+    src = UnstructuredPoints(src_y, src_x)
+    dst = UnstructuredPoints(dst_y, dst_x)
+
+    mapper = NearestVal()
+    mapper.initialize(dst, src)
+
+    if move in ("dst", "both"):
+        dst_x[:10] += 0.1
+        dst = UnstructuredPoints(dst_y, dst_x)
+    if move in ("src", "both"):
+        src_x[::2] -= 0.1
+        src = UnstructuredPoints(src_y, src_x)
+    mapper.update(dst, src)
+
+    expected = NearestVal()
+    expected.initialize(dst, src)
+
+    src_vals = np.arange(50.0)
+    assert_array_equal(mapper.run(src_vals), expected.run(src_vals))
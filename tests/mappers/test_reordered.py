@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_almost_equal
+
+from pymt.grids.map import (
+    RectilinearMap,
+    UniformRectilinearMap,
+    UnstructuredMap,
+    UnstructuredPointsMap,
+)
+from pymt.mappers import (
+    Bilinear,
+    Conservative,
+    InverseDistance,
+    NearestVal,
+    PointToCell,
+    ReorderedMapper,
+)
+
+
+def _shuffled_mesh(shape):
+    mesh = UniformRectilinearMap(shape, (1.0, 1.0), (0.0, 0.0))
+    shuffle = np.random.permutation(mesh.get_point_count())
+    inverse = np.argsort(shuffle)
+    return UnstructuredMap(
+        mesh.get_y()[shuffle],
+        mesh.get_x()[shuffle],
+        connectivity=inverse[mesh.get_connectivity()],
+        offset=mesh.get_offset(),
+    )
+
+
+def _random_points(n_points, upper):
+    return UnstructuredPointsMap(
+        np.random.uniform(0.0, upper, n_points), np.random.uniform(0.0, upper, n_points)
+    )
+
+
+@pytest.mark.parametrize(
+    "mapper_class,dst,src",
+    [
+        (InverseDistance, _random_points(50, 5.0), _random_points(80, 5.0)),
+        (NearestVal, _random_points(50, 5.0), _random_points(80, 5.0)),
+        (
+            Bilinear,
+            _random_points(50, 5.0),
+            RectilinearMap([0.0, 2.0, 5.0], [0.0, 1.0, 5.0]),
+        ),
+        (PointToCell, _shuffled_mesh((6, 6)), _random_points(200, 5.0)),
+        (Conservative, _shuffled_mesh((4, 5)), _shuffled_mesh((6, 6))),
+    ],
+)
+def test_reordered_matches_mapper(mapper_class, dst, src):
+    expected_mapper = mapper_class()
+    expected_mapper.initialize(dst, src)
+
+    mapper = ReorderedMapper(mapper_class())
+    mapper.initialize(dst, src)
+
+    if mapper_class is Conservative:
+        src_values = np.random.uniform(size=src.get_cell_count())
+    else:
+        src_values = np.random.uniform(size=src.get_point_count())
+    src_values[::7] = -999.0
+
+    assert_array_almost_equal(
+        mapper.run(src_values, bad_val=-999.0),
+        expected_mapper.run(src_values, bad_val=-999.0),
+    )
+    assert mapper.name == "Reordered" + expected_mapper.name
+
+
+def test_reordered_into_destination():
+    src = _random_points(10, 1.0)
+    dst = _random_points(5, 1.0)
+
+    mapper = ReorderedMapper(InverseDistance(), curve="morton")
+    mapper.initialize(dst, src, k=1)
+
+    expected = InverseDistance()
+    expected.initialize(dst, src, k=1)
+
+    dst_vals = np.full(5, -1.0)
+    out = mapper.run(np.arange(10.0), dst_vals=dst_vals)
+
+    assert out is dst_vals
+    assert_array_almost_equal(dst_vals, expected.run(np.arange(10.0)))
+
+    with pytest.raises(ValueError):
+        mapper.run(np.arange(9.0))
+    with pytest.raises(ValueError):
+        mapper.run(np.arange(10.0), dst_vals=np.zeros(4))
@@ -0,0 +1,163 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+
+from pymt.grids.map import RectilinearMap, StructuredMap, UniformRectilinearMap
+from pymt.mappers import Bilinear, InverseDistance, tiled
+from pymt.mappers.tiled import attach_grid, share_grid, spatial_tiles
+
+
+def _rotated_grid(shape, angle):
+    grid = UniformRectilinearMap(shape, (1.0, 1.0), (0.0, 0.0))
+    (x, y) = (grid.get_x(), grid.get_y())
+    (c, s) = (np.cos(angle), np.sin(angle))
+    return StructuredMap(x * s + y * c, x * c - y * s, shape)
+
+
+def test_spatial_tiles_cover_points():
+    x = np.random.uniform(size=1000)
+    y = np.random.uniform(size=1000)
+
+    tiles = spatial_tiles(x, y, 9)
+
+    assert len(tiles) == 9
+    assert_array_equal(np.sort(np.concatenate(tiles)), np.arange(1000))
+    for tile in tiles:
+        assert np.ptp(x[tile]) <= 1.0 / 3.0
+        assert np.ptp(y[tile]) <= 1.0 / 3.0
+
+
+def test_spatial_tiles_degenerate():
+    tiles = spatial_tiles([1.0, 1.0, 1.0], [2.0, 2.0, 2.0], 4)
+    assert len(tiles) == 1
+    assert_array_equal(tiles[0], [0, 1, 2])
+
+    assert spatial_tiles([], [], 4) == []
+    with pytest.raises(ValueError):
+        spatial_tiles([1.0], [1.0], 0)
+
+
+@pytest.mark.parametrize(
+    "src",
+    [
+        UniformRectilinearMap((4, 5), (2.0, 1.0), (0.0, 1.0)),
+        RectilinearMap([0.0, 1.0, 3.0], [0.0, 2.0, 3.0, 7.0]),
+        _rotated_grid((4, 5), np.pi / 6.0),
+    ],
+)
+def test_share_grid(src):
+    blocks = []
+    try:
+        spec = share_grid(src, blocks)
+        grid = attach_grid(spec)
+        try:
+            assert_array_equal(grid.get_x(), src.get_x())
+            assert_array_equal(grid.get_y(), src.get_y())
+            assert_array_equal(grid.get_shape(), src.get_shape())
+            assert Bilinear.test(grid, grid) == Bilinear.test(src, src)
+            assert_array_almost_equal(
+                Bilinear.point_weights(grid, src.get_x(), src.get_y()).toarray(),
+                Bilinear.point_weights(src, src.get_x(), src.get_y()).toarray(),
+            )
+        finally:
+            grid.close()
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+@pytest.mark.parametrize("mapper_class", [Bilinear, InverseDistance])
+@pytest.mark.parametrize(
+    "src",
+    [
+        UniformRectilinearMap((20, 30), (1.0, 1.0), (0.0, 0.0)),
+        _rotated_grid((20, 30), np.pi / 5.0),
+    ],
+)
+def test_tiled_weights_match(mapper_class, src):
+    dst = RectilinearMap(np.linspace(-1.0, 25.0, 37), np.linspace(-2.0, 30.0, 41))
+
+    mapper = mapper_class()
+    mapper.initialize(dst, src)
+    expected = mapper.weights.toarray()
+
+    mapper.initialize(dst, src, tiles=7, max_workers=1)
+    assert mapper.weights.shape == expected.shape
+    assert_array_almost_equal(mapper.weights.toarray(), expected)
+
+
+@pytest.mark.parametrize("mapper_class", [Bilinear, InverseDistance])
+def test_tiled_weights_with_processes(mapper_class):
+    src = _rotated_grid((20, 30), np.pi / 5.0)
+    dst = RectilinearMap(np.linspace(-1.0, 25.0, 37), np.linspace(-2.0, 30.0, 41))
+
+    mapper = mapper_class()
+    mapper.initialize(dst, src)
+    expected = mapper.weights.toarray()
+
+    mapper.initialize(dst, src, tiles=6, max_workers=2)
+    assert_array_almost_equal(mapper.weights.toarray(), expected)
+
+
+class _LazyFuture:
+    def __init__(self, executor, fn, args):
+        (self._executor, self._fn, self._args) = (executor, fn, args)
+
+    def result(self):
+        self._executor.pending -= 1
+        return self._fn(*self._args)
+
+
+class _CountingExecutor:
+    max_pending = 0
+
+    def __init__(self, max_workers=None):
+        self.pending = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def submit(self, fn, *args):
+        self.pending += 1
+        _CountingExecutor.max_pending = max(_CountingExecutor.max_pending, self.pending)
+        return _LazyFuture(self, fn, args)
+
+
+def test_tiles_in_flight_are_bounded(monkeypatch):
+    monkeypatch.setattr(tiled, "ProcessPoolExecutor", _CountingExecutor)
+
+    src = _rotated_grid((20, 30), np.pi / 5.0)
+    dst = RectilinearMap(np.linspace(-1.0, 25.0, 37), np.linspace(-2.0, 30.0, 41))
+
+    mapper = Bilinear()
+    mapper.initialize(dst, src)
+    expected = mapper.weights.toarray()
+
+    mapper.initialize(dst, src, tiles=50, max_workers=2)
+    assert _CountingExecutor.max_pending == 4
+    assert_array_almost_equal(mapper.weights.toarray(), expected)
+
+
+def test_tiled_update():
+    src = UniformRectilinearMap((3, 3), (1.0, 1.0), (0.0, 0.0))
+    dst = RectilinearMap([0.5, 1.5], [0.5, 1.5])
+
+    mapper = Bilinear()
+    mapper.initialize(dst, src, tiles=2, max_workers=1)
+    assert_array_almost_equal(mapper.run(np.arange(9.0)), [2.0, 3.0, 5.0, 6.0])
+
+    dst = RectilinearMap([0.0, 1.0], [0.0, 1.0])
+    mapper.update(dst, src)
+    assert_array_almost_equal(mapper.run(np.arange(9.0)), [0.0, 1.0, 3.0, 4.0])
+
+
+def test_tiles_with_var_names():
+    src = RectilinearMap([0.0, 1.0, 2.0], [0.0, 1.0, 2.0])
+    dst = RectilinearMap([0.5, 1.5], [0.5, 1.5])
+
+    with pytest.raises(ValueError):
+        InverseDistance().initialize(dst, src, var_names=[("a", "b")], tiles=2)
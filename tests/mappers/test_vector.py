@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_almost_equal
+
+from pymt.grids.map import RectilinearMap, StructuredMap, UniformRectilinearMap
+from pymt.mappers import Bilinear, InverseDistance, NearestVal, VectorMapper
+from pymt.mappers.vector import grid_angles
+
+
+def _rotated_grid(shape, angle):
+    grid = UniformRectilinearMap(shape, (1.0, 1.0), (0.0, 0.0))
+    (x, y) = (grid.get_x(), grid.get_y())
+    (c, s) = (np.cos(angle), np.sin(angle))
+    return StructuredMap(x * s + y * c, x * c - y * s, shape)
+
+
+def test_grid_angles():
+    assert grid_angles(UniformRectilinearMap((3, 4), (1.0, 1.0), (0.0, 0.0))) is None
+    assert grid_angles(RectilinearMap([0.0, 1.0], [0.0, 2.0, 3.0])) is None
+
+    angle = grid_angles(_rotated_grid((3, 4), np.pi / 6.0))
+    assert_array_almost_equal(angle, np.full(12, np.pi / 6.0))
+
+
+@pytest.mark.parametrize("mapper_class", [InverseDistance, Bilinear])
+def test_vector_matches_components(mapper_class):
+    src = UniformRectilinearMap((5, 6), (1.0, 1.0), (0.0, 0.0))
+    dst = RectilinearMap([0.5, 1.5, 2.5, 3.5], [0.25, 1.75, 4.5])
+    (u, v) = (np.random.uniform(size=30), np.random.uniform(size=30))
+    u[3] = -999.0
+
+    mapper = mapper_class()
+    mapper.initialize(dst, src)
+    vector_mapper = VectorMapper(mapper)
+    vector_mapper.set_rotation(dst, src)
+
+    (dst_u, dst_v) = vector_mapper.run((u, v))
+
+    v[3] = -999.0
+    assert_array_almost_equal(dst_u, mapper.run(u))
+    assert_array_almost_equal(dst_v, mapper.run(v))
+
+
+@pytest.mark.parametrize("mapper_class", [InverseDistance, NearestVal])
+def test_vector_between_rotated_grids(mapper_class):
+    src = _rotated_grid((4, 5), np.pi / 6.0)
+    dst = _rotated_grid((4, 5), -np.pi / 3.0)
+
+    mapper = VectorMapper(mapper_class())
+    mapper.initialize(dst, src)
+
+    (u, v) = mapper.run((np.ones(20), np.zeros(20)))
+
+    assert_array_almost_equal(u, np.full(20, np.cos(np.pi / 2.0)))
+    assert_array_almost_equal(v, np.full(20, np.sin(np.pi / 2.0)))
+
+
+def test_vector_without_rotation():
+    src = _rotated_grid((4, 5), np.pi / 6.0)
+
+    mapper = VectorMapper(InverseDistance())
+    mapper.initialize(src, src, k=1, rotate=False)
+
+    (u, v) = mapper.run((np.ones(20), np.full(20, 2.0)))
+    assert_array_almost_equal(u, np.ones(20))
+    assert_array_almost_equal(v, np.full(20, 2.0))
+    assert mapper.name == "VectorInverseDistance"
+
+
+def test_vector_into_destination():
+    src = UniformRectilinearMap((3, 3), (1.0, 1.0), (0.0, 0.0))
+    dst = RectilinearMap([0.5, 10.0], [0.5])
+
+    mapper = VectorMapper(Bilinear())
+    mapper.initialize(dst, src)
+
+    dst_vals = (np.full(2, 5.0), np.full(2, 6.0))
+    out = mapper.run((np.arange(9.0), np.arange(9.0)), dst_vals=dst_vals)
+
+    assert out is dst_vals
+    assert_array_almost_equal(dst_vals[0], [2.0, 5.0])
+    assert_array_almost_equal(dst_vals[1], [2.0, 6.0])
+
+    with pytest.raises(ValueError):
+        mapper.run((np.arange(9.0), np.arange(8.0)))
@@ -43,3 +43,29 @@ def test_rectilinear_points(tmpdir, grid, ndims):
     with tmpdir.as_cwd():
         _GRID_TYPE[grid]("rectilinear.nc", field)
         assert os.path.isfile("rectilinear.nc")
+
+
+def test_unstructured_compact_dtypes(tmpdir):
+    import netCDF4 as nc
+
+    from pymt.grids import UnstructuredField, set_index_dtype
+
+    previous = set_index_dtype("int32")
+    try:
+        field = UnstructuredField(
+            [0.0, 0.0, 1.0, 1.0],
+            [0.0, 1.0, 0.0, 1.0],
+            connectivity=[0, 1, 3, 0, 3, 2],
+            offset=[3, 6],
+            coord_dtype="float32",
+        )
+    finally:
+        set_index_dtype(previous)
+    field.add_field("air_temperature", np.arange(4.0), centering="point")
+
+    with tmpdir.as_cwd():
+        NetcdfUnstructuredField("unstructured.nc", field)
+        with nc.Dataset("unstructured.nc") as root:
+            assert root.variables["node_x"].dtype == np.float32
+            assert root.variables["face_nodes_connectivity"].dtype == np.int32
+            assert root.variables["face_nodes"].dtype == np.int32
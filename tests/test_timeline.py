@@ -113,3 +113,77 @@ def test_repeated_events():
     assert first_event is timeline.pop()
     assert second_event is timeline.pop()
     assert first_event is timeline.pop()
+
+
+def test_unorderable_events():
+    timeline = Timeline([({"a": 1}, 1.0), ({"b": 2}, 1.0)])
+    assert timeline.pop() == {"a": 1}
+    assert timeline.pop() == {"b": 2}
+
+
+def test_add_one_time_events_in_bulk():
+    timeline = Timeline([("recurring", 10.0)])
+    timeline.add_one_time_events((f"event {i}", float(i % 7)) for i in range(100))
+
+    events = timeline.pop_until(10.0)
+    assert len(events) == 101
+    assert events[:3] == ["event 0", "event 7", "event 14"]
+    assert events[-2:] == ["event 97", "recurring"]
+    assert timeline.events == {"recurring"}
+
+
+def test_fifo_matches_insertion_order():
+    timeline = Timeline()
+    for i in range(50):
+        timeline.add_one_time_event(i, 1.0)
+    timeline.add_one_time_events([(i, 1.0) for i in range(50, 100)])
+
+    assert [timeline.pop() for _ in range(100)] == list(range(100))
+
+
+def test_no_drift():
+    timeline = Timeline([("tick", 0.1)])
+    for _ in range(1000000):
+        timeline.pop()
+    assert timeline.time == 100000.0
+    assert timeline.time_of_next_event == 100000.1
+
+
+def test_events_fire_on_stop_time():
+    timeline = Timeline([("a", 0.1), ("b", 0.3)])
+    events = timeline.pop_until(0.3)
+    assert events == ["a", "a", "b", "a"]
+    assert timeline.time == 0.3
+
+
+def test_intervals_with_different_denominators():
+    from fractions import Fraction
+
+    timeline = Timeline([("third", Fraction(1, 3))])
+    timeline.add_recurring_event("tenth", 0.1)
+    timeline.add_one_time_event("once", 0.7)
+
+    events = timeline.pop_until(1.0)
+    assert events.count("third") == 3
+    assert events.count("tenth") == 10
+    assert events[-2:] == ["third", "tenth"]
+    assert timeline.time == 1.0
+
+
+def test_float_intervals_of_thirds_and_hours():
+    timeline = Timeline([("fine", 1 / 24), ("coarse", 1.0)])
+    timeline.add_recurring_event("third", 1 / 3)
+
+    groups = list(timeline.iter_groups_until(1.0))
+    assert len(groups) == 24
+    assert sum(group.count("fine") for group in groups) == 24
+    assert sorted(groups[-1]) == ["coarse", "fine", "third"]
+    assert timeline.time == 1.0
+
+
+def test_accumulated_float_stop_time():
+    timeline = Timeline([("tenth", 0.1)])
+
+    assert timeline.pop_until(0.1 + 0.2) == ["tenth"] * 3
+    assert timeline.time == 0.3
+    assert timeline.time_of_next_event == 0.4